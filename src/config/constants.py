@@ -16,6 +16,12 @@ APP_DESCRIPTION = "Systems-Theoretic Process Analysis Tool"
 DEFAULT_DB_NAME = "stpa.db"
 DB_TIMEOUT = 30.0  # seconds
 DB_WAL_MODE = True
+DB_SYNCHRONOUS = "NORMAL"  # durable under WAL, fsyncs only at checkpoints
+DB_TEMP_STORE = "MEMORY"
+DB_MMAP_SIZE = 268435456  # 256 MB
+DB_CACHE_SIZE = -20000  # page cache, negative means KiB (about 20 MB)
+DB_CACHED_STATEMENTS = 256  # compiled statements kept per connection
+DB_FETCH_ARRAYSIZE = 256  # rows per fetchmany batch when streaming results
 
 # Configuration Files
 CONFIG_FILE_JSON = "config.json"
@@ -109,10 +115,20 @@ BASELINE_DATE_FORMAT = "%Y-%m-%d"
 WINDOW_MIN_WIDTH = 1024
 WINDOW_MIN_HEIGHT = 768
 SPLITTER_DEFAULT_SIZES = [300, 700]
+TABLE_TEXT_PREVIEW_LENGTH = 100  # characters shown for long text in entity tables
+SYSTEM_SELECTION_DELAY_MS = 50  # quiet time before a tree selection loads its tables
 
 # Performance Limits
 MAX_RECORDS_THRESHOLD = 100000
 THUMBNAIL_LAZY_LOAD_THRESHOLD = 200
+TABLE_PAGE_SIZE = 100  # entity table rows fetched per page
+TABLE_PREFETCH_CACHE_SIZE = 256  # first pages kept for recently loaded or prefetched tables
+TABLE_PREFETCH_NEIGHBORS = 8  # neighboring systems whose tables are prefetched on selection
+VALIDATION_ISSUE_BATCH_SIZE = 100  # issues sent to the warnings table at a time
+VALIDATION_CACHE_SIZE = 128  # rule results kept per (rule, system) until the database changes
+VALIDATION_MAX_WORKERS = 4  # rules run at the same time, each on its own connection
+VALIDATION_PARALLEL_MIN_ROWS = 20000  # working-baseline rows before completeness queries run in parallel
+DIRECTORY_VALIDATION_CACHE_SIZE = 32  # working directory validation results kept, one per directory
 
 # Hash Algorithm
 HASH_ALGORITHM = "sha256"
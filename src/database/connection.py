@@ -6,12 +6,15 @@ Handles SQLite database connections, initialization, and configuration.
 import sqlite3
 import threading
 from pathlib import Path
-from typing import Optional, Any, Dict, List, Tuple
+from typing import Optional, Any, Dict, Iterator, List, Tuple
 from contextlib import contextmanager
 
-from ..config.constants import DB_TIMEOUT, DB_WAL_MODE
+from ..config.constants import (
+    DB_TIMEOUT, DB_WAL_MODE, DB_CACHED_STATEMENTS, DB_SYNCHRONOUS,
+    DB_TEMP_STORE, DB_MMAP_SIZE, DB_CACHE_SIZE, DB_FETCH_ARRAYSIZE
+)
 from ..log_config.config import get_logger
-from .schema import get_full_schema_sql, SCHEMA_VERSION
+from .schema import get_full_schema_sql, get_ensure_indexes_sql, SCHEMA_VERSION
 
 logger = get_logger(__name__)
 
@@ -32,6 +35,7 @@ class DatabaseConnection:
         self._local = threading.local()
         self._lock = threading.RLock()
         self._is_initialized = False
+        self._write_counter = 0
         
     def _get_connection(self) -> sqlite3.Connection:
         """
@@ -47,7 +51,8 @@ class DatabaseConnection:
             conn = sqlite3.connect(
                 str(self.db_path),
                 timeout=DB_TIMEOUT,
-                check_same_thread=False
+                check_same_thread=False,
+                cached_statements=DB_CACHED_STATEMENTS
             )
             
             # Configure connection
@@ -56,6 +61,11 @@ class DatabaseConnection:
             
             if DB_WAL_MODE:
                 conn.execute("PRAGMA journal_mode = WAL")  # Enable WAL mode
+                conn.execute(f"PRAGMA synchronous = {DB_SYNCHRONOUS}")  # Safe with WAL
+            
+            conn.execute(f"PRAGMA temp_store = {DB_TEMP_STORE}")
+            conn.execute(f"PRAGMA mmap_size = {DB_MMAP_SIZE}")
+            conn.execute(f"PRAGMA cache_size = {DB_CACHE_SIZE}")
                 
             # Enable automatic commits for most operations
             conn.isolation_level = None
@@ -91,10 +101,26 @@ class DatabaseConnection:
         """
         Context manager for database transactions.
         
+        Inside an open transaction this uses a savepoint instead, so callers can
+        group several transactional operations into one commit while each still
+        rolls back on its own failure.
+        
         Yields:
             SQLite connection
         """
         conn = self._get_connection()
+        if conn.in_transaction:
+            try:
+                conn.execute("SAVEPOINT nested")
+                yield conn
+                conn.execute("RELEASE nested")
+            except Exception:
+                conn.execute("ROLLBACK TO nested")
+                conn.execute("RELEASE nested")
+                raise
+            return
+        
+        changes = conn.total_changes
         try:
             conn.execute("BEGIN")
             yield conn
@@ -102,6 +128,28 @@ class DatabaseConnection:
         except Exception:
             conn.execute("ROLLBACK")
             raise
+        self._count_write(conn, changes)
+    
+    @property
+    def write_counter(self) -> int:
+        """
+        Number of committed writes made through this object on any thread.
+        
+        It can be compared across threads, so it can key results shared
+        between threads. Writes by other processes are not counted.
+        """
+        return self._write_counter
+    
+    def _count_write(self, conn: sqlite3.Connection, changes_before: int) -> None:
+        """Advance the write counter if rows changed and are committed."""
+        if conn.total_changes != changes_before and not conn.in_transaction:
+            with self._lock:
+                self._write_counter += 1
+    
+    @property
+    def in_transaction(self) -> bool:
+        """Whether the current thread's connection has a transaction open."""
+        return self._get_connection().in_transaction
     
     def execute(self, sql: str, parameters: Optional[Tuple] = None) -> sqlite3.Cursor:
         """
@@ -114,11 +162,16 @@ class DatabaseConnection:
         Returns:
             Cursor with results
         """
+        conn = self._get_connection()
+        changes = conn.total_changes
         with self.get_cursor() as cursor:
             if parameters:
-                return cursor.execute(sql, parameters)
+                cursor = cursor.execute(sql, parameters)
             else:
-                return cursor.execute(sql)
+                cursor = cursor.execute(sql)
+        # Writes inside a transaction are counted when it commits
+        self._count_write(conn, changes)
+        return cursor
     
     def fetchone(self, sql: str, parameters: Optional[Tuple] = None) -> Optional[sqlite3.Row]:
         """
@@ -156,6 +209,35 @@ class DatabaseConnection:
                 cursor.execute(sql)
             return cursor.fetchall()
     
+    def iterate(self, sql: str, parameters: Optional[Tuple] = None,
+                arraysize: int = DB_FETCH_ARRAYSIZE) -> Iterator[sqlite3.Row]:
+        """
+        Execute SQL and yield rows as they are fetched.
+        
+        Rows are read arraysize at a time with fetchmany, so callers building
+        their own objects per row never hold the whole result list as well.
+        
+        Args:
+            sql: SQL statement
+            parameters: SQL parameters (optional)
+            arraysize: Rows fetched per batch
+            
+        Yields:
+            Rows in result order
+        """
+        with self.get_cursor() as cursor:
+            cursor.arraysize = arraysize
+            if parameters:
+                cursor.execute(sql, parameters)
+            else:
+                cursor.execute(sql)
+            
+            while True:
+                batch = cursor.fetchmany()
+                if not batch:
+                    break
+                yield from batch
+    
     def initialize_database(self) -> bool:
         """
         Initialize database with schema if it doesn't exist.
@@ -173,6 +255,8 @@ class DatabaseConnection:
                     # Check if database has proper schema
                     if self._verify_schema():
                         logger.info("Database schema verified")
+                        # Databases created before an index was added get it now
+                        self._get_connection().executescript(get_ensure_indexes_sql())
                         self._is_initialized = True
                         return True
                     else:
@@ -4,8 +4,10 @@ Provides base classes and CRUD operations for database entities.
 """
 
 import hashlib
+import sqlite3
 from datetime import datetime
-from typing import Dict, Any, Optional, List, Type, Union
+from functools import lru_cache
+from typing import Dict, Any, Optional, List, Tuple, Type, Union
 from dataclasses import dataclass, field, fields
 from abc import ABC, abstractmethod
 
@@ -18,8 +20,32 @@ from .connection import DatabaseConnection
 
 logger = get_logger(__name__)
 
+# INSERT/UPDATE ... RETURNING needs SQLite 3.35+
+_SUPPORTS_RETURNING = sqlite3.sqlite_version_info >= (3, 35, 0)
 
-@dataclass
+# Column layouts for BaseEntity.from_row, keyed by (entity class, column names)
+_ROW_LAYOUTS: Dict[tuple, Optional[tuple]] = {}
+
+
+@lru_cache(maxsize=4096)
+def _format_hierarchical_id(type_identifier: str, level_identifier: int, sequential_identifier: int) -> str:
+    """Format a hierarchical ID from its components, once per distinct ID."""
+    if level_identifier == 0:
+        return f"{type_identifier}-{sequential_identifier}"
+    return f"{type_identifier}-{level_identifier}.{sequential_identifier}"
+
+
+def _parse_timestamp(value: Any) -> Optional[datetime]:
+    """Convert a stored timestamp string to datetime, leaving other values as-is."""
+    if isinstance(value, str):
+        try:
+            return datetime.fromisoformat(value)
+        except ValueError:
+            return None
+    return value
+
+
+@dataclass(slots=True)
 class BaseEntity(ABC):
     """
     Base class for all database entities.
@@ -39,6 +65,45 @@ class BaseEntity(ABC):
         """Get the database table name for this entity."""
         pass
     
+    @classmethod
+    def from_row(cls, row) -> "BaseEntity":
+        """
+        Build an entity directly from a database row.
+        
+        The mapping from row columns to dataclass fields is computed once per
+        column layout, so each row is passed positionally to __init__ without
+        building an intermediate dictionary.
+        
+        Args:
+            row: sqlite3.Row for this entity's table
+            
+        Returns:
+            Entity instance
+        """
+        columns = tuple(row.keys())
+        key = (cls, columns)
+        
+        try:
+            layout = _ROW_LAYOUTS[key]
+        except KeyError:
+            positions = {name: index for index, name in enumerate(columns)}
+            field_names = [f.name for f in fields(cls)]
+            if all(name in positions for name in field_names):
+                layout = tuple(positions[name] for name in field_names)
+            else:
+                layout = None
+            _ROW_LAYOUTS[key] = layout
+        
+        if layout is None:
+            # Partial rows fall back to keyword construction with defaults
+            entity = cls(**dict(row))
+        else:
+            entity = cls(*[row[index] for index in layout])
+        
+        entity.created_at = _parse_timestamp(entity.created_at)
+        entity.updated_at = _parse_timestamp(entity.updated_at)
+        return entity
+    
     def to_dict(self) -> Dict[str, Any]:
         """Convert entity to dictionary."""
         result = {}
@@ -61,11 +126,11 @@ class BaseEntity(ABC):
         if self.system_hierarchy:
             return self.system_hierarchy
         
-        # Fallback to the old method if system_hierarchy is not set
-        if self.level_identifier == 0:
-            return f"{self.type_identifier}-{self.sequential_identifier}"
-        else:
-            return f"{self.type_identifier}-{self.level_identifier}.{self.sequential_identifier}"
+        # Fallback to the old method if system_hierarchy is not set; the
+        # formatted string is shared by every entity with the same components
+        return _format_hierarchical_id(
+            self.type_identifier, self.level_identifier, self.sequential_identifier
+        )
 
 
 @dataclass 
@@ -90,7 +155,7 @@ class CriticalAttributes:
     privacy_description: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class System(BaseEntity):
     """System entity representing a system in the hierarchy."""
     system_name: str = ""
@@ -122,7 +187,7 @@ class System(BaseEntity):
         return "systems"
 
 
-@dataclass
+@dataclass(slots=True)
 class Function(BaseEntity):
     """Function entity representing a system function."""
     system_id: int = 0
@@ -155,7 +220,7 @@ class Function(BaseEntity):
         return "functions"
 
 
-@dataclass
+@dataclass(slots=True)
 class Interface(BaseEntity):
     """Interface entity representing a system interface."""
     system_id: int = 0
@@ -187,7 +252,7 @@ class Interface(BaseEntity):
         return "interfaces"
 
 
-@dataclass
+@dataclass(slots=True)
 class Asset(BaseEntity):
     """Asset entity representing a system asset."""
     system_id: int = 0
@@ -219,7 +284,7 @@ class Asset(BaseEntity):
         return "assets"
 
 
-@dataclass
+@dataclass(slots=True)
 class Requirement(BaseEntity):
     """Requirement entity representing a system requirement."""
     system_id: int = 0
@@ -258,7 +323,7 @@ class Requirement(BaseEntity):
         return "requirements"
 
 
-@dataclass
+@dataclass(slots=True)
 class Hazard(BaseEntity):
     """Hazard entity representing a system hazard."""
     environment_id: Optional[int] = None
@@ -310,7 +375,7 @@ class Hazard(BaseEntity):
         self.h_description = value
 
 
-@dataclass
+@dataclass(slots=True)
 class Loss(BaseEntity):
     """Loss entity representing a system loss."""
     asset_id: int = 0
@@ -334,7 +399,7 @@ class Loss(BaseEntity):
         self.l_name = value
 
 
-@dataclass
+@dataclass(slots=True)
 class ControlStructure(BaseEntity):
     """Control Structure entity representing a control system structure."""
     system_id: int = 0
@@ -367,7 +432,7 @@ class ControlStructure(BaseEntity):
         return "control_structures"
 
 
-@dataclass
+@dataclass(slots=True)
 class Controller(BaseEntity):
     """Controller entity representing a control system controller."""
     system_id: int = 0
@@ -381,7 +446,7 @@ class Controller(BaseEntity):
         return "controllers"
 
 
-@dataclass
+@dataclass(slots=True)
 class ControlledProcess(BaseEntity):
     """Controlled Process entity representing a controlled process."""
     system_id: Optional[int] = None
@@ -396,7 +461,7 @@ class ControlledProcess(BaseEntity):
         return "controlled_processes"
 
 
-@dataclass
+@dataclass(slots=True)
 class ControlAction(BaseEntity):
     """Control Action entity representing a control action."""
     control_algorithm_id: Optional[int] = None
@@ -430,7 +495,7 @@ class ControlAction(BaseEntity):
         return "control_actions"
 
 
-@dataclass
+@dataclass(slots=True)
 class Feedback(BaseEntity):
     """Feedback entity representing a feedback signal."""
     controlled_process_id: Optional[int] = None
@@ -464,7 +529,7 @@ class Feedback(BaseEntity):
         return "feedback"
 
 
-@dataclass
+@dataclass(slots=True)
 class Constraint(BaseEntity):
     """Database entity for constraints."""
     constraint_name: str = ""
@@ -476,7 +541,7 @@ class Constraint(BaseEntity):
         return "constraints"
 
 
-@dataclass
+@dataclass(slots=True)
 class Environment(BaseEntity):
     """Database entity for environments, associated with a system."""
     system_id: int = 0
@@ -491,7 +556,7 @@ class Environment(BaseEntity):
         return "environments"
 
 
-@dataclass  
+@dataclass(slots=True)
 class StateDiagram(BaseEntity):
     """Database entity for state diagrams."""
     sd_name: str = ""
@@ -504,7 +569,7 @@ class StateDiagram(BaseEntity):
         return "state_diagrams"
 
 
-@dataclass
+@dataclass(slots=True)
 class State(BaseEntity):
     """Database entity for states."""
     short_text_identifier: str = ""
@@ -533,7 +598,7 @@ class State(BaseEntity):
         return "states"
 
 
-@dataclass
+@dataclass(slots=True)
 class SafetySecurityControl(BaseEntity):
     """Database entity for safety and security controls."""
     sc_name: str = ""
@@ -580,6 +645,12 @@ class EntityRepository:
         self.connection = connection
         self.entity_class = entity_class
         self.table_name = entity_class.get_table_name()
+        
+        # Statement text built once per repository so the connection's
+        # statement cache reuses the compiled query
+        self._columns: Optional[List[str]] = None
+        self._read_sql: Optional[str] = None
+        self._read_related_sql: Optional[str] = None
     
     def create(self, entity: BaseEntity) -> Optional[int]:
         """
@@ -641,8 +712,12 @@ class EntityRepository:
             Entity instance or None if not found
         """
         try:
-            sql = f"SELECT * FROM {self.table_name} WHERE id = ? AND baseline = ?"
-            row = self.connection.fetchone(sql, (entity_id, baseline))
+            if self._read_sql is None:
+                self._read_sql = (
+                    f"SELECT {', '.join(self._get_columns())} FROM {self.table_name} "
+                    f"WHERE id = ? AND baseline = ?"
+                )
+            row = self.connection.fetchone(self._read_sql, (entity_id, baseline))
             
             if row:
                 return self._row_to_entity(row)
@@ -696,6 +771,76 @@ class EntityRepository:
             logger.error(f"Failed to update {self.entity_class.__name__} {entity.id}: {str(e)}")
             return False
     
+    def upsert(self, entity: BaseEntity) -> Optional[int]:
+        """
+        Create or update an entity in a single statement.
+        
+        New entities (id is None) are inserted; existing entities are updated
+        in place and fail if their row no longer exists, as with update().
+        Either way the row ID is returned by the same statement.
+        
+        Args:
+            entity: Entity to save
+            
+        Returns:
+            ID of the saved entity or None if failed
+        """
+        if not _SUPPORTS_RETURNING:
+            if entity.id is None:
+                return self.create(entity)
+            return entity.id if self.update(entity) else None
+        
+        is_new = entity.id is None
+        
+        try:
+            # Auto-generate hierarchical ID if not already set
+            if is_new and not entity.system_hierarchy:
+                self._generate_hierarchical_id(entity)
+            
+            # Prepare field data
+            entity_dict = entity.to_dict()
+            entity_dict.pop('id', None)
+            entity_dict.pop('created_at', None)
+            if is_new:
+                entity_dict.pop('updated_at', None)
+            else:
+                entity_dict['updated_at'] = datetime.now().isoformat()
+            
+            # Generate SQL
+            values = list(entity_dict.values())
+            if is_new:
+                fields_str = ', '.join(entity_dict.keys())
+                placeholders = ', '.join(['?' for _ in entity_dict])
+                sql = f"""
+                INSERT INTO {self.table_name} ({fields_str})
+                VALUES ({placeholders})
+                RETURNING id
+                """
+            else:
+                # A row deleted since the entity was loaded is not re-created
+                set_clause = ', '.join([f"{k} = ?" for k in entity_dict.keys()])
+                sql = f"UPDATE {self.table_name} SET {set_clause} WHERE id = ? RETURNING id"
+                values.append(entity.id)
+            
+            # Execute upsert
+            with self.connection.transaction():
+                rows = self.connection.fetchall(sql, values)
+                entity_id = rows[0][0] if rows else None
+                
+                if entity_id is None:
+                    logger.warning(f"No rows saved for {self.entity_class.__name__} {entity.id}")
+                    return None
+                
+                # Log audit trail
+                self._log_audit('INSERT' if is_new else 'UPDATE', entity_id, entity_dict)
+                
+                logger.debug(f"Saved {self.entity_class.__name__} with ID {entity_id} and hierarchical ID {entity.system_hierarchy}")
+                return entity_id
+                
+        except Exception as e:
+            logger.error(f"Failed to save {self.entity_class.__name__}: {str(e)}")
+            return None
+    
     def delete(self, entity_id: int) -> bool:
         """
         Delete entity by ID.
@@ -738,9 +883,7 @@ class EntityRepository:
         """
         try:
             sql = f"SELECT * FROM {self.table_name} WHERE system_id = ? AND baseline = ? ORDER BY id"
-            rows = self.connection.fetchall(sql, (system_id, baseline))
-            
-            return [self._row_to_entity(row) for row in rows]
+            return [self._row_to_entity(row) for row in self.connection.iterate(sql, (system_id, baseline))]
             
         except Exception as e:
             logger.error(f"Failed to list {self.entity_class.__name__} by system {system_id}: {str(e)}")
@@ -759,9 +902,7 @@ class EntityRepository:
         """
         try:
             sql = f"SELECT * FROM {self.table_name} WHERE system_hierarchy = ? AND baseline = ? ORDER BY id"
-            rows = self.connection.fetchall(sql, (system_hierarchy, baseline))
-            
-            return [self._row_to_entity(row) for row in rows]
+            return [self._row_to_entity(row) for row in self.connection.iterate(sql, (system_hierarchy, baseline))]
             
         except Exception as e:
             logger.error(f"Failed to find {self.entity_class.__name__} by system hierarchy {system_hierarchy}: {str(e)}")
@@ -788,9 +929,7 @@ class EntityRepository:
                 return []
             
             sql = f"SELECT * FROM {self.table_name} WHERE system_id = ? AND baseline = ? ORDER BY id"
-            rows = self.connection.fetchall(sql, (system_id, baseline))
-            
-            return [self._row_to_entity(row) for row in rows]
+            return [self._row_to_entity(row) for row in self.connection.iterate(sql, (system_id, baseline))]
         except Exception as e:
             logger.error(f"Failed to find {self.entity_class.__name__} by system ID {system_id}: {str(e)}")
             return []
@@ -808,6 +947,50 @@ class EntityRepository:
         """
         return self.read(entity_id, baseline)
     
+    def get_by_id_with_related(self, entity_id: int) -> Optional[Tuple[BaseEntity, Dict[str, Any]]]:
+        """
+        Get entity by ID together with its owning system in one query.
+        
+        Args:
+            entity_id: The entity ID
+        
+        Returns:
+            Tuple of (entity, related) where related holds system_name and
+            system_hierarchy of the owning system (empty for entities without
+            a system), or None if not found
+        """
+        try:
+            if self._read_related_sql is None:
+                columns = self._get_columns()
+                entity_columns = ', '.join(f"e.{column}" for column in columns)
+                if 'system_id' in columns:
+                    self._read_related_sql = f"""
+                    SELECT {entity_columns}, s.system_name AS related_system_name,
+                           s.system_hierarchy AS related_system_hierarchy
+                    FROM {self.table_name} e
+                    LEFT JOIN systems s ON s.id = e.system_id
+                    WHERE e.id = ?
+                    """
+                else:
+                    self._read_related_sql = f"SELECT {entity_columns} FROM {self.table_name} e WHERE e.id = ?"
+            
+            row = self.connection.fetchone(self._read_related_sql, (entity_id,))
+            if not row:
+                return None
+            
+            related = {}
+            if 'related_system_name' in row.keys():
+                related = {
+                    'system_name': row['related_system_name'],
+                    'system_hierarchy': row['related_system_hierarchy']
+                }
+            
+            return self._row_to_entity(row), related
+            
+        except Exception as e:
+            logger.error(f"Failed to read {self.entity_class.__name__} {entity_id} with related data: {str(e)}")
+            return None
+    
     def list(self, baseline: str = WORKING_BASELINE) -> List[BaseEntity]:
         """
         List all entities of this type.
@@ -820,13 +1003,24 @@ class EntityRepository:
         """
         try:
             sql = f"SELECT * FROM {self.table_name} WHERE baseline = ? ORDER BY id"
-            rows = self.connection.fetchall(sql, (baseline,))
-            
-            return [self._row_to_entity(row) for row in rows]
+            return [self._row_to_entity(row) for row in self.connection.iterate(sql, (baseline,))]
         except Exception as e:
             logger.error(f"Failed to list all {self.entity_class.__name__}: {str(e)}")
             return []
     
+    def _get_columns(self) -> List[str]:
+        """
+        Get the table columns that map to entity fields, in field order.
+        
+        Returns:
+            List of column names
+        """
+        if self._columns is None:
+            rows = self.connection.fetchall(f"PRAGMA table_info({self.table_name})")
+            table_columns = {row[1] for row in rows}
+            self._columns = [f.name for f in fields(self.entity_class) if f.name in table_columns]
+        return self._columns
+    
     def _row_to_entity(self, row) -> BaseEntity:
         """
         Convert database row to entity instance.
@@ -837,19 +1031,7 @@ class EntityRepository:
         Returns:
             Entity instance
         """
-        # Convert row to dictionary
-        row_dict = dict(row)
-        
-        # Convert datetime strings back to datetime objects if needed
-        for key, value in row_dict.items():
-            if key in ['created_at', 'updated_at'] and isinstance(value, str):
-                try:
-                    row_dict[key] = datetime.fromisoformat(value)
-                except ValueError:
-                    row_dict[key] = None
-        
-        # Create entity instance
-        return self.entity_class(**row_dict)
+        return self.entity_class.from_row(row)
     
     def _generate_hierarchical_id(self, entity: BaseEntity):
         """
@@ -896,17 +1078,11 @@ class EntityRepository:
                                 child_seq += 1
                             
                             entity.system_hierarchy = child_hierarchy
-                            # For systems, set the hierarchical components
-                            if child_hierarchy.count('.') == 1:
-                                # Format: S-1.2
-                                parts = child_hierarchy.split('-')[1].split('.')
-                                entity.level_identifier = int(parts[0])
-                                entity.sequential_identifier = int(parts[1])
-                            else:
-                                # Format: S-1.2.3 (deeper nesting)
-                                parts = child_hierarchy.split('-')[1].split('.')
-                                entity.level_identifier = int(parts[0])
-                                entity.sequential_identifier = int(parts[-1])  # Use last part
+                            # For systems, set the hierarchical components: the first
+                            # and last parts of S-1.2 or S-1.2.3 (deeper nesting)
+                            hierarchy_part = child_hierarchy.partition('-')[2]
+                            entity.level_identifier = int(hierarchy_part.partition('.')[0])
+                            entity.sequential_identifier = int(hierarchy_part.rpartition('.')[2])
                             return
                 
                 # Root system - find next sequential number
@@ -939,16 +1115,10 @@ class EntityRepository:
                         # Example: F-1.2.1 (Function 1 in System S-1.2)
                         entity.system_hierarchy = f"{entity.type_identifier}-{system_hierarchy_part}.{seq_id}"
                         
-                        # Set hierarchical components
-                        hierarchy_parts = system_hierarchy_part.split('.')
-                        if len(hierarchy_parts) == 1:
-                            # Simple system hierarchy like "1"
-                            entity.level_identifier = int(hierarchy_parts[0])
-                            entity.sequential_identifier = seq_id
-                        else:
-                            # Complex system hierarchy like "1.2"
-                            entity.level_identifier = int(hierarchy_parts[0])
-                            entity.sequential_identifier = seq_id
+                        # Set hierarchical components from the first part of a
+                        # system hierarchy like "1" or "1.2"
+                        entity.level_identifier = int(system_hierarchy_part.partition('.')[0])
+                        entity.sequential_identifier = seq_id
                     else:
                         # System not found or no hierarchy, create simple sequential ID
                         seq_id = HierarchyManager.find_next_sequential_id(existing_ids, entity.type_identifier, 0)
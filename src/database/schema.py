@@ -347,10 +347,12 @@ INDEXES = {
     'idx_assets_system': 'CREATE INDEX idx_assets_system ON assets(system_id)',
     'idx_requirements_system': 'CREATE INDEX idx_requirements_system ON requirements(system_id)',
     
-    # Baseline queries
+    # Baseline queries; entries end in the rowid, so WHERE baseline ORDER BY id
+    # is a range scan without a sort
     'idx_systems_baseline': 'CREATE INDEX idx_systems_baseline ON systems(baseline)',
     'idx_functions_baseline': 'CREATE INDEX idx_functions_baseline ON functions(baseline)',
     'idx_requirements_baseline': 'CREATE INDEX idx_requirements_baseline ON requirements(baseline)',
+    'idx_control_structures_baseline': 'CREATE INDEX idx_control_structures_baseline ON control_structures(baseline)',
     
     # Audit log
     'idx_audit_table_row': 'CREATE INDEX idx_audit_table_row ON audit_log(table_name, row_id)',
@@ -358,7 +360,22 @@ INDEXES = {
     
     # Identifiers
     'idx_systems_identifiers': 'CREATE INDEX idx_systems_identifiers ON systems(type_identifier, level_identifier, sequential_identifier)',
-    'idx_functions_identifiers': 'CREATE INDEX idx_functions_identifiers ON functions(type_identifier, level_identifier, sequential_identifier)'
+    'idx_functions_identifiers': 'CREATE INDEX idx_functions_identifiers ON functions(type_identifier, level_identifier, sequential_identifier)',
+    
+    # Entity table loads (WHERE system_id/baseline ORDER BY system_hierarchy)
+    'idx_functions_system_baseline': 'CREATE INDEX idx_functions_system_baseline ON functions(system_id, baseline, system_hierarchy)',
+    'idx_requirements_system_baseline': 'CREATE INDEX idx_requirements_system_baseline ON requirements(system_id, baseline, system_hierarchy)',
+    'idx_interfaces_system_baseline': 'CREATE INDEX idx_interfaces_system_baseline ON interfaces(system_id, baseline, system_hierarchy)',
+    'idx_assets_system_baseline': 'CREATE INDEX idx_assets_system_baseline ON assets(system_id, baseline, system_hierarchy)',
+    'idx_control_structures_system_baseline': 'CREATE INDEX idx_control_structures_system_baseline ON control_structures(system_id, baseline, system_hierarchy)',
+    'idx_controllers_system_baseline': 'CREATE INDEX idx_controllers_system_baseline ON controllers(system_id, baseline, system_hierarchy)',
+    'idx_hazards_baseline': 'CREATE INDEX idx_hazards_baseline ON hazards(baseline, system_hierarchy)',
+    'idx_losses_baseline': 'CREATE INDEX idx_losses_baseline ON losses(baseline, system_hierarchy)',
+    
+    # System tree and child system loads (WHERE baseline ORDER BY system_hierarchy,
+    # WHERE parent_system_id/baseline)
+    'idx_systems_baseline_hierarchy': 'CREATE INDEX idx_systems_baseline_hierarchy ON systems(baseline, system_hierarchy)',
+    'idx_systems_parent_baseline': 'CREATE INDEX idx_systems_parent_baseline ON systems(parent_system_id, baseline)'
 }
 
 # Database constraints
@@ -400,6 +417,18 @@ CREATE TABLE {table_name} (
 );
 """
 
+def get_ensure_indexes_sql() -> str:
+    """
+    Generate SQL creating any missing indexes in an existing database.
+    
+    Returns:
+        SQL with one CREATE INDEX IF NOT EXISTS statement per index
+    """
+    return "\n".join(
+        index_sql.replace("CREATE INDEX", "CREATE INDEX IF NOT EXISTS", 1) + ";"
+        for index_sql in INDEXES.values()
+    )
+
 def get_full_schema_sql() -> str:
     """
     Generate complete database schema SQL.
@@ -184,24 +184,14 @@ class JsonExporter:
         """Get immediate child systems of a parent system."""
         try:
             # Use direct SQL query since we need to filter by parent_system_id
-            # which is not covered by the existing repository methods
-            with self.db_connection.get_cursor() as cursor:
-                cursor.execute(
+            # which is not covered by the existing repository methods; rows
+            # are streamed and built positionally by from_row
+            return [
+                System.from_row(row) for row in self.db_connection.iterate(
                     "SELECT * FROM systems WHERE parent_system_id = ? AND baseline = 'Working'",
                     (parent_system_id,)
                 )
-                
-                child_systems = []
-                for row in cursor.fetchall():
-                    system = System()
-                    # Populate system from database row using repository pattern
-                    columns = [desc[0] for desc in cursor.description]
-                    for i, column in enumerate(columns):
-                        if hasattr(system, column):
-                            setattr(system, column, row[i])
-                    child_systems.append(system)
-                
-                return child_systems
+            ]
         except Exception as e:
             logger.error(f"Error getting child systems for parent {parent_system_id}: {str(e)}")
             return []
@@ -5,6 +5,7 @@ Exports System of Interest data as formatted Markdown documents.
 
 from typing import List, Optional
 from datetime import datetime
+from operator import attrgetter
 
 from ..database.entities import (
     System, Function, Interface, Asset, Requirement,
@@ -15,6 +16,12 @@ from ..log_config.config import get_logger
 
 logger = get_logger(__name__)
 
+# Reads all security attribute flags of an entity in one call
+_SECURITY_ATTRIBUTES = attrgetter(
+    'confidentiality', 'integrity', 'availability', 'authenticity',
+    'non_repudiation', 'assurance', 'trustworthy', 'privacy'
+)
+
 
 class MarkdownExporter:
     """Handles Markdown export of STPA Tool data."""
@@ -245,36 +252,17 @@ class MarkdownExporter:
     
     def _get_child_systems(self, parent_system_id: int) -> List[System]:
         """Get immediate child systems of a parent system."""
-        with self.db_connection.get_cursor() as cursor:
-            cursor.execute(
+        # Rows are streamed and built positionally by from_row
+        return [
+            System.from_row(row) for row in self.db_connection.iterate(
                 "SELECT * FROM systems WHERE parent_system_id = ? AND baseline = 'Working'",
                 (parent_system_id,)
             )
-            
-            child_systems = []
-            for row in cursor.fetchall():
-                system = System()
-                # Populate system from database row
-                columns = [desc[0] for desc in cursor.description]
-                for i, column in enumerate(columns):
-                    if hasattr(system, column):
-                        setattr(system, column, row[i])
-                child_systems.append(system)
-            
-            return child_systems
+        ]
     
     def _has_critical_attributes(self, system: System) -> bool:
         """Check if system has any critical attributes set."""
-        critical_attrs = [
-            'confidentiality', 'integrity', 'availability', 'authenticity',
-            'non_repudiation', 'assurance', 'trustworthy', 'privacy'
-        ]
-        
-        for attr in critical_attrs:
-            if getattr(system, attr, False):
-                return True
-        
-        return system.criticality != "Non-Critical"
+        return any(_SECURITY_ATTRIBUTES(system)) or system.criticality != "Non-Critical"
     
     def export_to_file(self, system_id: int, file_path: str, export_type: str = "specification") -> bool:
         """
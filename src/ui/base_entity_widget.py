@@ -4,10 +4,10 @@ Provides common functionality for all entity management widgets.
 """
 
 from abc import ABC, abstractmethod, ABCMeta
-from typing import Optional, Dict, Any, List, Type, Callable
+from typing import Optional, Dict, Any, List, Set, Type, Callable
 from PySide6.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QFormLayout, QTableWidget,
-    QTableWidgetItem, QPushButton, QLabel, QLineEdit, QTextEdit,
+    QWidget, QVBoxLayout, QHBoxLayout, QFormLayout, QTableView,
+    QAbstractItemView, QPushButton, QLabel, QLineEdit, QTextEdit,
     QComboBox, QCheckBox, QSpinBox, QHeaderView, QMessageBox,
     QToolBar, QSplitter, QGroupBox, QScrollArea
 )
@@ -16,6 +16,7 @@ from PySide6.QtGui import QIcon, QFont, QAction
 
 from ..database.entities import BaseEntity, EntityFactory
 from ..database.init import DatabaseInitializer
+from .table_models import EntityTableModel
 from ..log_config.config import get_logger
 
 logger = get_logger(__name__)
@@ -147,13 +148,14 @@ class BaseEntityWidget(QWidget):
         self.current_entity: Optional[BaseEntity] = None
         self.selected_entity_id: Optional[int] = None
         self.current_system_id: Optional[int] = None  # Track current system for filtering
+        self._details_sql: Optional[str] = None  # Per-ID lookup, built on first use
         
         # Framework components
         self.validator = EntityValidator()
         self.change_tracker = EntityChangeTracker()
         
         # UI components will be set by subclasses
-        self.entity_table: Optional[QTableWidget] = None
+        self.entity_table: Optional[QTableView] = None
         self.toolbar: Optional[QToolBar] = None
         self.details_widget: Optional[QWidget] = None
         
@@ -238,11 +240,10 @@ class BaseEntityWidget(QWidget):
         splitter = QSplitter(Qt.Horizontal)
         
         # Entity table
-        self.entity_table = QTableWidget()
-        self.entity_table.setSelectionBehavior(QTableWidget.SelectRows)
-        self.entity_table.setSelectionMode(QTableWidget.SingleSelection)
+        self.entity_table = QTableView()
+        self.entity_table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.entity_table.setSelectionMode(QAbstractItemView.SingleSelection)
         self.entity_table.setAlternatingRowColors(True)
-        self.entity_table.itemSelectionChanged.connect(self._on_selection_changed)
         self.entity_table.doubleClicked.connect(self.edit_entity)
         
         splitter.addWidget(self.entity_table)
@@ -257,6 +258,20 @@ class BaseEntityWidget(QWidget):
         
         layout.addWidget(splitter)
     
+    def _set_table_headers(self, headers: List[str]):
+        """
+        Install the entity table model with the given column headers.
+        
+        Rows are set by _populate_table as (entity_id, column values...) tuples.
+        
+        Args:
+            headers: Column headers
+        """
+        self.entity_table.setModel(EntityTableModel(headers, self.entity_table))
+        self.entity_table.selectionModel().selectionChanged.connect(
+            lambda *_: self._on_selection_changed()
+        )
+    
     def set_current_system_id(self, system_id: Optional[int]):
         """Set the current system ID for filtering entities."""
         self.current_system_id = system_id
@@ -318,13 +333,43 @@ class BaseEntityWidget(QWidget):
         """Populate table with entity data. Must be implemented by subclasses."""
         pass
     
+    def _get_system_names(self, system_ids: Set[int]) -> Dict[int, str]:
+        """
+        Get display names for the given systems with a single IN (...) query.
+        
+        Args:
+            system_ids: IDs of the systems referenced by the loaded entities
+        
+        Returns:
+            Dictionary mapping system ID to "<hierarchy> - <name>"
+        """
+        if not system_ids:
+            return {}
+        
+        try:
+            db_manager = self.database_initializer.get_database_manager()
+            connection = db_manager.get_connection()
+            
+            placeholders = ",".join("?" * len(system_ids))
+            systems = connection.fetchall(
+                f"SELECT id, system_hierarchy, system_name FROM systems WHERE id IN ({placeholders})",
+                tuple(system_ids)
+            )
+            return {
+                system['id']: f"{system['system_hierarchy']} - {system['system_name']}"
+                for system in systems
+            }
+            
+        except Exception as e:
+            logger.error(f"Failed to load system names: {str(e)}")
+            return {}
+    
     def _on_selection_changed(self):
         """Handle selection change in entity table."""
-        selected_items = self.entity_table.selectedItems()
+        selected_rows = self.entity_table.selectionModel().selectedRows()
         
-        if selected_items:
-            row = selected_items[0].row()
-            entity_id = self.entity_table.item(row, 0).data(Qt.UserRole)
+        if selected_rows:
+            entity_id = self.entity_table.model().entity_id(selected_rows[0].row())
             
             if entity_id != self.selected_entity_id:
                 self.selected_entity_id = entity_id
@@ -345,15 +390,14 @@ class BaseEntityWidget(QWidget):
             db_manager = self.database_initializer.get_database_manager()
             connection = db_manager.get_connection()
             
-            table_name = self._get_table_name()
-            entity_data = connection.fetchone(
-                f"SELECT * FROM {table_name} WHERE id = ?",
-                (entity_id,)
-            )
+            # Reusing the same SQL text lets the connection's statement cache
+            # skip re-preparing the lookup on every selection
+            if self._details_sql is None:
+                self._details_sql = f"SELECT * FROM {self._get_table_name()} WHERE id = ?"
+            entity_data = connection.fetchone(self._details_sql, (entity_id,))
             
             if entity_data:
-                entity_dict = dict(entity_data)
-                self.current_entity = self.entity_class(**entity_dict)
+                self.current_entity = self.entity_class.from_row(entity_data)
                 self._populate_details(self.current_entity)
                 self.selection_changed.emit(self.current_entity)
                 
@@ -525,9 +569,9 @@ class BaseEntityWidget(QWidget):
     
     def select_entity(self, entity_id: int):
         """Select entity by ID."""
-        for row in range(self.entity_table.rowCount()):
-            item = self.entity_table.item(row, 0)
-            if item and item.data(Qt.UserRole) == entity_id:
+        model = self.entity_table.model()
+        for row in range(model.rowCount()):
+            if model.entity_id(row) == entity_id:
                 self.entity_table.selectRow(row)
                 break
 
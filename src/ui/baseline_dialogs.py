@@ -123,6 +123,12 @@ class BaselineCreationDialog(QDialog):
             logger.error(f"Error loading database status: {str(e)}")
             self.status_label.setText(f"Error loading database status: {str(e)}")
     
+    def reset(self):
+        """Clear the inputs and reload the status before a reused dialog is shown again."""
+        self.name_edit.clear()
+        self.description_edit.clear()
+        self._load_database_status()
+    
     def _create_baseline(self):
         """Create the baseline."""
         if not self.baseline_manager:
@@ -222,6 +228,7 @@ class BaselineManagementDialog(QDialog):
         # Baselines table
         self.baselines_table = QTableWidget()
         self.baselines_table.setSelectionBehavior(QTableWidget.SelectRows)
+        self.baselines_table.setEditTriggers(QTableWidget.NoEditTriggers)
         self.baselines_table.selectionModel().selectionChanged.connect(self._on_selection_changed)
         baselines_layout.addWidget(self.baselines_table)
         
@@ -273,6 +280,10 @@ class BaselineManagementDialog(QDialog):
         
         self.setLayout(layout)
     
+    def reset(self):
+        """Reload the baselines before a reused dialog is shown again."""
+        self._load_baselines()
+    
     def _load_baselines(self):
         """Load and display baselines."""
         if not self.baseline_manager:
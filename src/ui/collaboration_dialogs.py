@@ -18,12 +18,18 @@ from PySide6.QtCore import Qt, QThread, Signal
 from PySide6.QtGui import QFont
 
 from ..collaboration import BranchManager, MergeManager
+from ..config.constants import WORKING_BASELINE
 from ..database.connection import DatabaseConnection
-from ..database.entities import System, EntityRepository
 from ..log_config.config import get_logger
 
 logger = get_logger(__name__)
 
+# Only the columns the root system tree shows, read straight from the rows
+_SQL_LOAD_SYSTEMS = """
+SELECT id, parent_system_id, system_name, system_hierarchy, system_description
+FROM systems WHERE baseline = ? ORDER BY system_hierarchy
+"""
+
 
 class BranchCreationDialog(QDialog):
     """Dialog for creating new project branches."""
@@ -93,40 +99,39 @@ class BranchCreationDialog(QDialog):
         self.button_box = button_box
         self.setLayout(layout)
     
+    def reset(self):
+        """Clear the inputs and reload the systems before a reused dialog is shown again."""
+        self.name_edit.clear()
+        self.description_edit.clear()
+        self._load_systems()
+    
     def _load_systems(self):
         """Load and display systems in tree."""
         if not self.db_connection:
             return
         
         try:
-            system_repo = EntityRepository(self.db_connection, System)
-            cursor = self.db_connection.get_cursor()
-            cursor.execute("SELECT * FROM systems WHERE baseline = 'Working' ORDER BY hierarchical_id")
-            
             self.systems_tree.clear()
             system_items = {}
             
-            for row in cursor.fetchall():
-                system = System()
-                columns = [desc[0] for desc in cursor.description]
-                for i, column in enumerate(columns):
-                    if hasattr(system, column):
-                        setattr(system, column, row[i])
-                
+            for system_id, parent_id, name, hierarchy, description in self.db_connection.iterate(
+                _SQL_LOAD_SYSTEMS, (WORKING_BASELINE,)
+            ):
+                description = description or ""
                 item = QTreeWidgetItem([
-                    system.system_name,
-                    system.hierarchical_id,
-                    system.system_description[:50] + "..." if len(system.system_description) > 50 else system.system_description
+                    name,
+                    hierarchy,
+                    description[:50] + "..." if len(description) > 50 else description
                 ])
-                item.setData(0, Qt.UserRole, system.id)
+                item.setData(0, Qt.UserRole, system_id)
                 
                 # Build hierarchy
-                if system.parent_system_id and system.parent_system_id in system_items:
-                    system_items[system.parent_system_id].addChild(item)
+                if parent_id and parent_id in system_items:
+                    system_items[parent_id].addChild(item)
                 else:
                     self.systems_tree.addTopLevelItem(item)
                 
-                system_items[system.id] = item
+                system_items[system_id] = item
             
             self.systems_tree.expandAll()
             
@@ -210,6 +215,9 @@ class BranchManagementDialog(QDialog):
         self.branch_manager = branch_manager
         self.merge_manager = merge_manager
         
+        # Branch data by table row
+        self._branches: List[Dict[str, Any]] = []
+        
         self.setWindowTitle("Branch Management")
         self.setModal(True)
         self.resize(900, 700)
@@ -256,6 +264,7 @@ class BranchManagementDialog(QDialog):
         # Branches table
         self.branches_table = QTableWidget()
         self.branches_table.setSelectionBehavior(QTableWidget.SelectRows)
+        self.branches_table.setEditTriggers(QTableWidget.NoEditTriggers)
         self.branches_table.selectionModel().selectionChanged.connect(self._on_selection_changed)
         branches_layout.addWidget(self.branches_table)
         
@@ -287,6 +296,10 @@ class BranchManagementDialog(QDialog):
         
         self.setLayout(layout)
     
+    def reset(self):
+        """Reload the branches before a reused dialog is shown again."""
+        self._load_branches()
+    
     def _load_branches(self):
         """Load and display branches."""
         if not self.branch_manager:
@@ -294,6 +307,7 @@ class BranchManagementDialog(QDialog):
         
         try:
             branches = self.branch_manager.list_branches()
+            self._branches = branches
             
             # Set up table
             self.branches_table.setRowCount(len(branches))
@@ -311,9 +325,6 @@ class BranchManagementDialog(QDialog):
                 
                 status = "Ready" if branch['database_exists'] else "Incomplete"
                 self.branches_table.setItem(row, 4, QTableWidgetItem(status))
-                
-                # Store branch data
-                self.branches_table.item(row, 0).setData(Qt.UserRole, branch)
             
             # Resize columns
             header = self.branches_table.horizontalHeader()
@@ -337,8 +348,7 @@ class BranchManagementDialog(QDialog):
         
         if has_selection:
             row = selected_rows[0].row()
-            branch_data = self.branches_table.item(row, 0).data(Qt.UserRole)
-            self._display_branch_details(branch_data)
+            self._display_branch_details(self._branches[row])
         else:
             self.details_text.clear()
     
@@ -377,8 +387,7 @@ class BranchManagementDialog(QDialog):
             return
         
         row = selected_rows[0].row()
-        branch_data = self.branches_table.item(row, 0).data(Qt.UserRole)
-        branch_path = branch_data['branch_path']
+        branch_path = self._branches[row]['branch_path']
         
         if not self.merge_manager:
             QMessageBox.warning(self, "Error", "No merge manager available")
@@ -433,8 +442,7 @@ class BranchManagementDialog(QDialog):
             return
         
         row = selected_rows[0].row()
-        branch_data = self.branches_table.item(row, 0).data(Qt.UserRole)
-        branch_name = branch_data['branch_name']
+        branch_name = self._branches[row]['branch_name']
         
         reply = QMessageBox.question(
             self,
@@ -3,13 +3,12 @@ Specific entity widgets for STPA Tool
 Implements concrete entity management widgets for Interface, Asset, and other STPA entities.
 """
 
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Set
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QFormLayout, QGroupBox,
     QLineEdit, QTextEdit, QComboBox, QLabel, QPushButton,
-    QTableWidgetItem, QHeaderView, QScrollArea, QSpinBox
+    QHeaderView, QScrollArea, QSpinBox
 )
-from PySide6.QtCore import Qt
 from PySide6.QtGui import QFont
 
 from .base_entity_widget import BaseEntityWidget
@@ -40,8 +39,7 @@ class InterfaceWidget(BaseEntityWidget):
         self._setup_base_ui()
         
         # Configure table columns
-        self.entity_table.setColumnCount(4)
-        self.entity_table.setHorizontalHeaderLabels(["ID", "Name", "System", "Description"])
+        self._set_table_headers(["ID", "Name", "System", "Description"])
         
         header = self.entity_table.horizontalHeader()
         header.setSectionResizeMode(0, QHeaderView.ResizeToContents)
@@ -164,37 +162,22 @@ class InterfaceWidget(BaseEntityWidget):
     
     def _populate_table(self, entities: List[Interface]):
         """Populate table with interface data."""
-        self.entity_table.setRowCount(len(entities))
+        system_names = self._get_system_names({interface.system_id for interface in entities})
         
-        for row, interface in enumerate(entities):
+        rows = []
+        for interface in entities:
             # Get system name
-            system_name = self._get_system_name(interface.system_id)
+            system_name = system_names.get(interface.system_id, f"System {interface.system_id}")
             
-            self.entity_table.setItem(row, 0, QTableWidgetItem(interface.get_hierarchical_id()))
-            self.entity_table.setItem(row, 1, QTableWidgetItem(interface.interface_name))
-            self.entity_table.setItem(row, 2, QTableWidgetItem(system_name))
-            self.entity_table.setItem(row, 3, QTableWidgetItem(interface.interface_description or ""))
-            
-            # Store interface ID for selection
-            self.entity_table.item(row, 0).setData(Qt.UserRole, interface.id)
-    
-    def _get_system_name(self, system_id: int) -> str:
-        """Get system name by ID."""
-        try:
-            db_manager = self.database_initializer.get_database_manager()
-            connection = db_manager.get_connection()
-            
-            system = connection.fetchone(
-                "SELECT system_hierarchy, system_name FROM systems WHERE id = ?",
-                (system_id,)
-            )
-            
-            if system:
-                return f"{system['system_hierarchy']} - {system['system_name']}"
-            return f"System {system_id}"
-            
-        except Exception:
-            return f"System {system_id}"
+            rows.append((
+                interface.id,
+                interface.get_hierarchical_id(),
+                interface.interface_name,
+                system_name,
+                interface.interface_description or ""
+            ))
+        
+        self.entity_table.model().set_rows(rows)
     
     def _populate_details(self, entity: Interface):
         """Populate details widget with interface data."""
@@ -334,8 +317,7 @@ class AssetWidget(BaseEntityWidget):
         self._setup_base_ui()
         
         # Configure table columns
-        self.entity_table.setColumnCount(4)
-        self.entity_table.setHorizontalHeaderLabels(["ID", "Name", "System", "Description"])
+        self._set_table_headers(["ID", "Name", "System", "Description"])
         
         header = self.entity_table.horizontalHeader()
         header.setSectionResizeMode(0, QHeaderView.ResizeToContents)
@@ -458,37 +440,22 @@ class AssetWidget(BaseEntityWidget):
     
     def _populate_table(self, entities: List[Asset]):
         """Populate table with asset data."""
-        self.entity_table.setRowCount(len(entities))
+        system_names = self._get_system_names({asset.system_id for asset in entities})
         
-        for row, asset in enumerate(entities):
+        rows = []
+        for asset in entities:
             # Get system name
-            system_name = self._get_system_name(asset.system_id)
-            
-            self.entity_table.setItem(row, 0, QTableWidgetItem(asset.get_hierarchical_id()))
-            self.entity_table.setItem(row, 1, QTableWidgetItem(asset.asset_name))
-            self.entity_table.setItem(row, 2, QTableWidgetItem(system_name))
-            self.entity_table.setItem(row, 3, QTableWidgetItem(asset.asset_description or ""))
+            system_name = system_names.get(asset.system_id, f"System {asset.system_id}")
             
-            # Store asset ID for selection
-            self.entity_table.item(row, 0).setData(Qt.UserRole, asset.id)
-    
-    def _get_system_name(self, system_id: int) -> str:
-        """Get system name by ID."""
-        try:
-            db_manager = self.database_initializer.get_database_manager()
-            connection = db_manager.get_connection()
-            
-            system = connection.fetchone(
-                "SELECT system_hierarchy, system_name FROM systems WHERE id = ?",
-                (system_id,)
-            )
-            
-            if system:
-                return f"{system['system_hierarchy']} - {system['system_name']}"
-            return f"System {system_id}"
-            
-        except Exception:
-            return f"System {system_id}"
+            rows.append((
+                asset.id,
+                asset.get_hierarchical_id(),
+                asset.asset_name,
+                system_name,
+                asset.asset_description or ""
+            ))
+        
+        self.entity_table.model().set_rows(rows)
     
     def _populate_details(self, entity: Asset):
         """Populate details widget with asset data."""
@@ -628,8 +595,7 @@ class HazardWidget(BaseEntityWidget):
         self._setup_base_ui()
         
         # Configure table columns
-        self.entity_table.setColumnCount(5)
-        self.entity_table.setHorizontalHeaderLabels(["ID", "Name", "System", "Asset", "Description"])
+        self._set_table_headers(["ID", "Name", "System", "Asset", "Description"])
         
         header = self.entity_table.horizontalHeader()
         header.setSectionResizeMode(0, QHeaderView.ResizeToContents)
@@ -779,57 +745,47 @@ class HazardWidget(BaseEntityWidget):
     
     def _populate_table(self, entities: List[Hazard]):
         """Populate table with hazard data."""
-        self.entity_table.setRowCount(len(entities))
+        system_names = self._get_system_names({hazard.system_id for hazard in entities})
+        asset_names = self._get_asset_names({hazard.asset_id for hazard in entities if hazard.asset_id})
         
-        for row, hazard in enumerate(entities):
+        rows = []
+        for hazard in entities:
             # Get system and asset names
-            system_name = self._get_system_name(hazard.system_id)
-            asset_name = self._get_asset_name(hazard.asset_id) if hazard.asset_id else ""
-            
-            self.entity_table.setItem(row, 0, QTableWidgetItem(hazard.get_hierarchical_id()))
-            self.entity_table.setItem(row, 1, QTableWidgetItem(hazard.hazard_name))
-            self.entity_table.setItem(row, 2, QTableWidgetItem(system_name))
-            self.entity_table.setItem(row, 3, QTableWidgetItem(asset_name))
-            self.entity_table.setItem(row, 4, QTableWidgetItem(hazard.hazard_description or ""))
+            system_name = system_names.get(hazard.system_id, f"System {hazard.system_id}")
+            asset_name = asset_names.get(hazard.asset_id, f"Asset {hazard.asset_id}") if hazard.asset_id else ""
             
-            # Store hazard ID for selection
-            self.entity_table.item(row, 0).setData(Qt.UserRole, hazard.id)
+            rows.append((
+                hazard.id,
+                hazard.get_hierarchical_id(),
+                hazard.hazard_name,
+                system_name,
+                asset_name,
+                hazard.hazard_description or ""
+            ))
+        
+        self.entity_table.model().set_rows(rows)
     
-    def _get_system_name(self, system_id: int) -> str:
-        """Get system name by ID."""
+    def _get_asset_names(self, asset_ids: Set[int]) -> Dict[int, str]:
+        """Get display names for the given assets with a single query."""
+        if not asset_ids:
+            return {}
+        
         try:
             db_manager = self.database_initializer.get_database_manager()
             connection = db_manager.get_connection()
             
-            system = connection.fetchone(
-                "SELECT system_hierarchy, system_name FROM systems WHERE id = ?",
-                (system_id,)
+            placeholders = ",".join("?" * len(asset_ids))
+            assets = connection.fetchall(
+                f"SELECT id, system_hierarchy, asset_name FROM assets WHERE id IN ({placeholders})",
+                tuple(asset_ids)
             )
-            
-            if system:
-                return f"{system['system_hierarchy']} - {system['system_name']}"
-            return f"System {system_id}"
+            return {
+                asset['id']: f"{asset['system_hierarchy']} - {asset['asset_name']}"
+                for asset in assets
+            }
             
         except Exception:
-            return f"System {system_id}"
-    
-    def _get_asset_name(self, asset_id: int) -> str:
-        """Get asset name by ID."""
-        try:
-            db_manager = self.database_initializer.get_database_manager()
-            connection = db_manager.get_connection()
-            
-            asset = connection.fetchone(
-                "SELECT system_hierarchy, asset_name FROM assets WHERE id = ?",
-                (asset_id,)
-            )
-            
-            if asset:
-                return f"{asset['system_hierarchy']} - {asset['asset_name']}"
-            return f"Asset {asset_id}"
-            
-        except Exception:
-            return f"Asset {asset_id}"
+            return {}
     
     def _populate_details(self, entity: Hazard):
         """Populate details widget with hazard data."""
@@ -977,8 +933,7 @@ class LossWidget(BaseEntityWidget):
         self._setup_base_ui()
         
         # Configure table columns
-        self.entity_table.setColumnCount(4)
-        self.entity_table.setHorizontalHeaderLabels(["ID", "Name", "System", "Description"])
+        self._set_table_headers(["ID", "Name", "System", "Description"])
         
         header = self.entity_table.horizontalHeader()
         header.setSectionResizeMode(0, QHeaderView.ResizeToContents)
@@ -1089,37 +1044,22 @@ class LossWidget(BaseEntityWidget):
     
     def _populate_table(self, entities: List[Loss]):
         """Populate table with loss data."""
-        self.entity_table.setRowCount(len(entities))
+        system_names = self._get_system_names({loss.system_id for loss in entities})
         
-        for row, loss in enumerate(entities):
+        rows = []
+        for loss in entities:
             # Get system name
-            system_name = self._get_system_name(loss.system_id)
-            
-            self.entity_table.setItem(row, 0, QTableWidgetItem(loss.get_hierarchical_id()))
-            self.entity_table.setItem(row, 1, QTableWidgetItem(loss.loss_name))
-            self.entity_table.setItem(row, 2, QTableWidgetItem(system_name))
-            self.entity_table.setItem(row, 3, QTableWidgetItem(loss.loss_description or ""))
-            
-            # Store loss ID for selection
-            self.entity_table.item(row, 0).setData(Qt.UserRole, loss.id)
-    
-    def _get_system_name(self, system_id: int) -> str:
-        """Get system name by ID."""
-        try:
-            db_manager = self.database_initializer.get_database_manager()
-            connection = db_manager.get_connection()
-            
-            system = connection.fetchone(
-                "SELECT system_hierarchy, system_name FROM systems WHERE id = ?",
-                (system_id,)
-            )
+            system_name = system_names.get(loss.system_id, f"System {loss.system_id}")
             
-            if system:
-                return f"{system['system_hierarchy']} - {system['system_name']}"
-            return f"System {system_id}"
-            
-        except Exception:
-            return f"System {system_id}"
+            rows.append((
+                loss.id,
+                loss.get_hierarchical_id(),
+                loss.loss_name,
+                system_name,
+                loss.loss_description or ""
+            ))
+        
+        self.entity_table.model().set_rows(rows)
     
     def _populate_details(self, entity: Loss):
         """Populate details widget with loss data."""
@@ -1262,8 +1202,7 @@ class ControlStructureWidget(BaseEntityWidget):
         self._setup_base_ui()
         
         # Configure table columns
-        self.entity_table.setColumnCount(4)
-        self.entity_table.setHorizontalHeaderLabels(["ID", "Name", "System", "Description"])
+        self._set_table_headers(["ID", "Name", "System", "Description"])
         
         header = self.entity_table.horizontalHeader()
         header.setSectionResizeMode(0, QHeaderView.ResizeToContents)
@@ -1385,37 +1324,22 @@ class ControlStructureWidget(BaseEntityWidget):
     
     def _populate_table(self, entities: List[ControlStructure]):
         """Populate table with control structure data."""
-        self.entity_table.setRowCount(len(entities))
+        system_names = self._get_system_names({structure.system_id for structure in entities})
         
-        for row, structure in enumerate(entities):
+        rows = []
+        for structure in entities:
             # Get system name
-            system_name = self._get_system_name(structure.system_id)
-            
-            self.entity_table.setItem(row, 0, QTableWidgetItem(structure.get_hierarchical_id()))
-            self.entity_table.setItem(row, 1, QTableWidgetItem(structure.structure_name))
-            self.entity_table.setItem(row, 2, QTableWidgetItem(system_name))
-            self.entity_table.setItem(row, 3, QTableWidgetItem(structure.structure_description or ""))
-            
-            # Store structure ID for selection
-            self.entity_table.item(row, 0).setData(Qt.UserRole, structure.id)
-    
-    def _get_system_name(self, system_id: int) -> str:
-        """Get system name by ID."""
-        try:
-            db_manager = self.database_initializer.get_database_manager()
-            connection = db_manager.get_connection()
-            
-            system = connection.fetchone(
-                "SELECT system_hierarchy, system_name FROM systems WHERE id = ?",
-                (system_id,)
-            )
+            system_name = system_names.get(structure.system_id, f"System {structure.system_id}")
             
-            if system:
-                return f"{system['system_hierarchy']} - {system['system_name']}"
-            return f"System {system_id}"
-            
-        except Exception:
-            return f"System {system_id}"
+            rows.append((
+                structure.id,
+                structure.get_hierarchical_id(),
+                structure.structure_name,
+                system_name,
+                structure.structure_description or ""
+            ))
+        
+        self.entity_table.model().set_rows(rows)
     
     def _populate_details(self, entity: ControlStructure):
         """Populate details widget with control structure data."""
@@ -1552,8 +1476,7 @@ class ControllerWidget(BaseEntityWidget):
         self._setup_base_ui()
         
         # Configure table columns
-        self.entity_table.setColumnCount(4)
-        self.entity_table.setHorizontalHeaderLabels(["ID", "Name", "System", "Description"])
+        self._set_table_headers(["ID", "Name", "System", "Description"])
         
         header = self.entity_table.horizontalHeader()
         header.setSectionResizeMode(0, QHeaderView.ResizeToContents)
@@ -1676,37 +1599,22 @@ class ControllerWidget(BaseEntityWidget):
     
     def _populate_table(self, entities: List[Controller]):
         """Populate table with controller data."""
-        self.entity_table.setRowCount(len(entities))
+        system_names = self._get_system_names({controller.system_id for controller in entities})
         
-        for row, controller in enumerate(entities):
+        rows = []
+        for controller in entities:
             # Get system name
-            system_name = self._get_system_name(controller.system_id)
-            
-            self.entity_table.setItem(row, 0, QTableWidgetItem(controller.get_hierarchical_id()))
-            self.entity_table.setItem(row, 1, QTableWidgetItem(controller.controller_name))
-            self.entity_table.setItem(row, 2, QTableWidgetItem(system_name))
-            self.entity_table.setItem(row, 3, QTableWidgetItem(controller.controller_description or ""))
+            system_name = system_names.get(controller.system_id, f"System {controller.system_id}")
             
-            # Store controller ID for selection
-            self.entity_table.item(row, 0).setData(Qt.UserRole, controller.id)
-    
-    def _get_system_name(self, system_id: int) -> str:
-        """Get system name by ID."""
-        try:
-            db_manager = self.database_initializer.get_database_manager()
-            connection = db_manager.get_connection()
-            
-            system = connection.fetchone(
-                "SELECT system_hierarchy, system_name FROM systems WHERE id = ?",
-                (system_id,)
-            )
-            
-            if system:
-                return f"{system['system_hierarchy']} - {system['system_name']}"
-            return f"System {system_id}"
-            
-        except Exception:
-            return f"System {system_id}"
+            rows.append((
+                controller.id,
+                controller.get_hierarchical_id(),
+                controller.controller_name,
+                system_name,
+                controller.controller_description or ""
+            ))
+        
+        self.entity_table.model().set_rows(rows)
     
     def _populate_details(self, entity: Controller):
         """Populate details widget with controller data."""
@@ -103,6 +103,20 @@ class JsonExportDialog(QDialog):
         
         self.setLayout(layout)
     
+    def reset(self):
+        """Clear the preview before a reused dialog is shown again."""
+        self.preview_text.clear()
+    
+    def set_system_id(self, system_id: int):
+        """
+        Point the dialog at a system.
+        
+        Args:
+            system_id: System to export
+        """
+        self.system_id = system_id
+        self._load_system_info()
+    
     def _load_system_info(self):
         """Load and display system information."""
         if not self.json_exporter or not self.system_id:
@@ -294,6 +308,20 @@ class MarkdownExportDialog(QDialog):
         
         self.setLayout(layout)
     
+    def reset(self):
+        """Clear the preview before a reused dialog is shown again."""
+        self.preview_text.clear()
+    
+    def set_system_id(self, system_id: int):
+        """
+        Point the dialog at a system.
+        
+        Args:
+            system_id: System to export
+        """
+        self.system_id = system_id
+        self._load_system_info()
+    
     def _load_system_info(self):
         """Load and display system information."""
         if not self.markdown_exporter or not self.system_id:
@@ -417,6 +445,8 @@ class MarkdownExportDialog(QDialog):
 class ArchiveExportDialog(QDialog):
     """Dialog for working directory archive export."""
     
+    DEFAULT_EXCLUSIONS = "*.tmp\n*.log\n*~\n.DS_Store\nThumbs.db\n*.bak"
+    
     def __init__(self, parent=None, working_directory: str = None):
         super().__init__(parent)
         self.working_directory = working_directory
@@ -433,9 +463,9 @@ class ArchiveExportDialog(QDialog):
         layout = QVBoxLayout()
         
         # Directory info
-        if self.working_directory:
-            info_label = QLabel(f"Working Directory: {self.working_directory}")
-            layout.addWidget(info_label)
+        self.info_label = QLabel()
+        layout.addWidget(self.info_label)
+        self._load_directory_info()
         
         # Export options group
         options_group = QGroupBox("Export Options")
@@ -447,7 +477,7 @@ class ArchiveExportDialog(QDialog):
         
         self.exclusions_text = QPlainTextEdit()
         self.exclusions_text.setMaximumHeight(100)
-        self.exclusions_text.setPlainText("*.tmp\n*.log\n*~\n.DS_Store\nThumbs.db\n*.bak")
+        self.exclusions_text.setPlainText(self.DEFAULT_EXCLUSIONS)
         options_layout.addWidget(self.exclusions_text)
         
         options_group.setLayout(options_layout)
@@ -471,6 +501,25 @@ class ArchiveExportDialog(QDialog):
         
         self.setLayout(layout)
     
+    def set_working_directory(self, working_directory: Optional[str]):
+        """
+        Point the dialog at a working directory.
+        
+        Args:
+            working_directory: Directory to archive, or None if there is none
+        """
+        self.working_directory = working_directory
+        self._load_directory_info()
+    
+    def _load_directory_info(self):
+        """Display the working directory, hiding the label when there is none."""
+        self.info_label.setText(f"Working Directory: {self.working_directory}")
+        self.info_label.setVisible(bool(self.working_directory))
+    
+    def reset(self):
+        """Restore the default exclusions before a reused dialog is shown again."""
+        self.exclusions_text.setPlainText(self.DEFAULT_EXCLUSIONS)
+    
     def _export_archive(self):
         """Execute the archive export."""
         if not self.working_directory or not os.path.exists(self.working_directory):
@@ -149,13 +149,16 @@ class HierarchyTreeWidget(QTreeWidget):
             connection = db_manager.get_connection()
             system_repo = EntityFactory.get_repository(connection, System)
             
-            # Get all systems ordered by hierarchy
-            systems = connection.fetchall(
-                "SELECT * FROM systems WHERE baseline = ? ORDER BY system_hierarchy",
-                ("Working",)
-            )
+            # Get all systems ordered by hierarchy, building each entity as its
+            # row is streamed rather than holding every row first
+            system_entities = [
+                System.from_row(row) for row in connection.iterate(
+                    "SELECT * FROM systems WHERE baseline = ? ORDER BY system_hierarchy",
+                    ("Working",)
+                )
+            ]
             
-            if not systems:
+            if not system_entities:
                 # Add placeholder item
                 placeholder = QTreeWidgetItem(self)
                 placeholder.setText(0, "No systems found")
@@ -163,13 +166,6 @@ class HierarchyTreeWidget(QTreeWidget):
                 placeholder.setFlags(Qt.NoItemFlags)  # Make it non-selectable
                 return
             
-            # Convert to System entities
-            system_entities = []
-            for row in systems:
-                row_dict = dict(row)
-                system = System(**row_dict)
-                system_entities.append(system)
-            
             # Build tree structure
             self._build_tree_structure(system_entities)
             
@@ -471,6 +467,40 @@ class HierarchyTreeWidget(QTreeWidget):
             self.setCurrentItem(item)
             self.scrollToItem(item)
     
+    def get_neighbor_system_ids(self, system_id: int, limit: int) -> List[int]:
+        """
+        Get the systems most likely to be selected after a system.
+        
+        Args:
+            system_id: System ID
+            limit: Maximum number of systems to return
+            
+        Returns:
+            IDs of the system's parent, then its nearest siblings (at most half
+            the limit), its children, and further siblings
+        """
+        item = self._system_items.get(system_id)
+        if item is None:
+            return []
+        
+        parent = item.parent()
+        siblings = (
+            [parent.child(i) for i in range(parent.childCount())] if parent
+            else [self.topLevelItem(i) for i in range(self.topLevelItemCount())]
+        )
+        # Siblings ordered by distance from the item, alternating above and below
+        index = siblings.index(item)
+        nearest = sorted((i for i in range(len(siblings)) if i != index),
+                         key=lambda i: abs(i - index))
+        sibling_split = limit // 2
+        
+        neighbors = [parent] if parent else []
+        neighbors += [siblings[i] for i in nearest[:sibling_split]]
+        neighbors += [item.child(i) for i in range(min(item.childCount(), limit))]
+        neighbors += [siblings[i] for i in nearest[sibling_split:limit]]
+        return [neighbor.get_system_id() for neighbor in neighbors
+                if isinstance(neighbor, SystemTreeItem)][:limit]
+    
     def add_system(self, system: System):
         """Add a new system to the tree."""
         try:
@@ -4,21 +4,26 @@ Contains the primary user interface layout and components.
 """
 
 import os
+from collections import OrderedDict
+from functools import partial
+from typing import Optional
 from PySide6.QtWidgets import (
     QMainWindow, QVBoxLayout, QHBoxLayout, QWidget, QSplitter,
     QMenuBar, QStatusBar, QToolBar, QLabel, QTreeWidget, QTabWidget,
-    QTableWidget, QTableWidgetItem, QPushButton, QHeaderView, QMessageBox,
-    QComboBox, QDialog, QGroupBox
+    QTableWidget, QTableView, QAbstractItemView, QPushButton, QHeaderView,
+    QMessageBox, QComboBox, QDialog, QGroupBox
 )
-from PySide6.QtCore import Qt, QTimer
+from PySide6.QtCore import Qt, QTimer, QThreadPool
 from PySide6.QtGui import QAction, QIcon
 
 from ..config.settings import ConfigManager
 from ..config.constants import (
-    APP_NAME, WINDOW_MIN_WIDTH, WINDOW_MIN_HEIGHT, SPLITTER_DEFAULT_SIZES
+    APP_NAME, WINDOW_MIN_WIDTH, WINDOW_MIN_HEIGHT, SPLITTER_DEFAULT_SIZES, TABLE_PAGE_SIZE,
+    TABLE_PREFETCH_CACHE_SIZE, TABLE_PREFETCH_NEIGHBORS, WORKING_BASELINE, SYSTEM_SELECTION_DELAY_MS
 )
 from ..log_config.config import get_logger
 from .hierarchy_tree import HierarchyTreeWidget
+from .table_models import EntityTableModel, LoadRowsTask, LoadRowsBatchTask
 from .entity_dialogs import (
     SystemEditDialog, FunctionEditDialog, RequirementEditDialog,
     InterfaceEditDialog, AssetEditDialog, HazardEditDialog,
@@ -44,11 +49,120 @@ from ..collaboration import BranchManager, MergeManager
 logger = get_logger(__name__)
 
 
+def _paged_sql(columns: str, from_sql: str) -> tuple:
+    """
+    Build the statements used to page an entity query into a table.
+    
+    Args:
+        columns: Comma-separated columns the table displays
+        from_sql: FROM/WHERE clause of the query
+        
+    Returns:
+        Tuple of (count SQL, page SQL, single-row SQL)
+    """
+    return (
+        f"SELECT COUNT(*) {from_sql}",
+        f"SELECT {columns} {from_sql} ORDER BY system_hierarchy LIMIT ? OFFSET ?",
+        f"SELECT {columns} {from_sql} AND id = ?",
+    )
+
+
+# Entity table statements, built once so their text is identical on every
+# call and the connection's statement cache reuses the compiled queries
+_SQL_LOAD_FUNCTIONS = _paged_sql(
+    "id, system_hierarchy, function_name, function_description, criticality",
+    "FROM functions WHERE system_id = ? AND baseline = ?"
+)
+_SQL_LOAD_REQUIREMENTS = _paged_sql(
+    "id, system_hierarchy, alphanumeric_identifier, requirement_text, verification_method, criticality",
+    "FROM requirements WHERE system_id = ? AND baseline = ?"
+)
+_SQL_LOAD_INTERFACES = _paged_sql(
+    "id, system_hierarchy, interface_name, interface_description",
+    "FROM interfaces WHERE system_id = ? AND baseline = ?"
+)
+_SQL_LOAD_ASSETS = _paged_sql(
+    "id, system_hierarchy, asset_name, asset_description",
+    "FROM assets WHERE system_id = ? AND baseline = ?"
+)
+_SQL_LOAD_HAZARDS = _paged_sql(
+    "id, system_hierarchy, h_name, h_description",
+    "FROM hazards WHERE baseline = ?"
+)
+_SQL_LOAD_LOSSES = _paged_sql(
+    "id, system_hierarchy, l_name, loss_description",
+    "FROM losses WHERE baseline = ?"
+)
+_SQL_LOAD_CONTROL_STRUCTURES = _paged_sql(
+    "id, system_hierarchy, structure_name, structure_description",
+    "FROM control_structures WHERE system_id = ? AND baseline = ?"
+)
+_SQL_LOAD_CONTROLLERS = _paged_sql(
+    "id, system_hierarchy, controller_name, controller_description",
+    "FROM controllers WHERE system_id = ? AND baseline = ?"
+)
+_SQL_GET_SYSTEM_SUMMARY = "SELECT system_name, system_description FROM systems WHERE id = ? AND baseline = ?"
+
+
 class MainWindow(QMainWindow):
     """
     Main application window for STPA Tool.
     """
     
+    # Entity tabs: (name, plural, label, title, headers, resize_columns, elided_column)
+    ENTITY_TABS = (
+        ("function", "functions", "Function", "Functions",
+         ["ID", "Name", "Description", "Criticality"], (0, 1), 2),
+        ("requirement", "requirements", "Requirement", "Requirements",
+         ["ID", "Alphanumeric ID", "Requirement Text", "Verification Method", "Criticality"], (0, 1, 2, 3), 2),
+        ("interface", "interfaces", "Interface", "Interfaces",
+         ["ID", "Name", "System", "Description"], (0, 1, 2), 3),
+        ("asset", "assets", "Asset", "Assets",
+         ["ID", "Name", "System", "Description"], (0, 1, 2), 3),
+        ("hazard", "hazards", "Hazard", "Hazards",
+         ["ID", "Name", "System", "Description"], (0, 1, 2), 3),
+        ("loss", "losses", "Loss", "Losses",
+         ["ID", "Name", "System", "Description"], (0, 1, 2), 3),
+        ("control_structure", "control_structures", "Control Structure", "Control Structures",
+         ["ID", "Name", "System", "Description"], (0, 1, 2), 3),
+        ("controller", "controllers", "Controller", "Controllers",
+         ["ID", "Name", "System", "Description"], (0, 1, 2), 3),
+    )
+    
+    # Entity tabs showing the owning system's name
+    SYSTEM_NAME_TABS = ("interfaces", "assets", "control_structures", "controllers")
+    
+    # Menu bar: (title, entries) submenus, (text, handler) actions, None separators
+    MENU_SPEC = (
+        ("File", (
+            ("Export", (
+                ("Export JSON", "_export_json"),
+                ("Export Markdown", "_export_markdown"),
+                ("Export Archive", "_export_archive"),
+            )),
+            None,
+            ("Exit", "close"),
+        )),
+        ("Baseline", (
+            ("Create Baseline", "_create_baseline"),
+            ("Manage Baselines", "_manage_baselines"),
+        )),
+        ("Collaboration", (
+            ("Create Branch", "_create_branch"),
+            ("Manage Branches", "_manage_branches"),
+        )),
+        ("Help", (
+            ("About", "_show_about"),
+        )),
+    )
+    
+    # Main toolbar, in the same format as MENU_SPEC
+    TOOLBAR_SPEC = (
+        ("Add System", "_add_root_system"),
+        None,
+        ("Refresh", "_refresh_all"),
+    )
+    
     def __init__(self, config_manager: ConfigManager, database_initializer=None):
         """
         Initialize the main window.
@@ -62,6 +176,12 @@ class MainWindow(QMainWindow):
         self.config_manager = config_manager
         self.database_initializer = database_initializer
         
+        # Shared connection used by all loaders and save handlers
+        self._conn = (
+            database_initializer.get_database_manager().get_connection()
+            if database_initializer else None
+        )
+        
         # Window setup
         self.setWindowTitle(APP_NAME)
         self.setMinimumSize(WINDOW_MIN_WIDTH, WINDOW_MIN_HEIGHT)
@@ -73,6 +193,51 @@ class MainWindow(QMainWindow):
         self.splitter = None
         self.current_system_id = None
         
+        # Tables whose button state is waiting for the coalesced update
+        self._pending_buttons_state = {}
+        
+        # Tree selections are coalesced so that stepping through the tree
+        # only loads the system it stops on
+        self._pending_system_id = None
+        self._selection_timer = QTimer(self)
+        self._selection_timer.setSingleShot(True)
+        self._selection_timer.setInterval(SYSTEM_SELECTION_DELAY_MS)
+        self._selection_timer.timeout.connect(self._apply_system_selection)
+        
+        # (name, description) of systems by ID, cleared whenever systems may
+        # have changed; serves both the breadcrumb and the System columns
+        self._system_summary_cache = {}
+        
+        # Keys of tabs whose loaded rows may be stale, reloaded on refresh
+        self._dirty_tabs = set()
+        
+        # Single-row query, parameters and row builder per loaded entity table
+        self._row_sources = {}
+        
+        # First-page LoadRowsTask still running per entity table
+        self._row_loads = {}
+        
+        # Load tasks collected by _load_tabs for a single batch, else None
+        self._batched_loads = None
+        
+        # (total, first page) by (count SQL, parameters), least recently used
+        # first; the generation changes whenever the cached pages may be stale
+        self._first_pages = OrderedDict()
+        self._first_pages_generation = 0
+        
+        # Cache keys queued by _prefetch_neighbors while it runs, else None
+        self._prefetch_keys = None
+        
+        # Menu and toolbar actions by text
+        self._actions = {}
+        
+        # Export, baseline and branch dialogs by class, reused across opens
+        self._dialogs = {}
+        
+        # (entity, related) by (entity class, ID) for edit dialogs, kept in
+        # step with saves and deletes and cleared when rows may be stale
+        self._entity_cache = {}
+        
         # Diagram components
         self.diagram_generator = None
         self.diagram_renderer = None
@@ -188,7 +353,7 @@ class MainWindow(QMainWindow):
         self.hierarchy_tree.setMinimumWidth(250)
         
         # Connect signals
-        self.hierarchy_tree.system_selected.connect(self._on_system_selected)
+        self.hierarchy_tree.system_selected.connect(self._schedule_system_selection)
         self.hierarchy_tree.system_changed.connect(self._on_system_changed)
         
         # Add to splitter
@@ -229,32 +394,17 @@ class MainWindow(QMainWindow):
         # Overview tab
         self._setup_overview_tab()
         
-        # Functions tab
-        self._setup_functions_tab()
-        
-        # Requirements tab
-        self._setup_requirements_tab()
-        
-        # Interfaces tab
-        self._setup_interfaces_tab()
+        # Entity and diagram tabs are built on first activation
+        self._lazy_tabs = {}
+        self._tab_keys = {}
+        self._tab_built = set()
         
-        # Assets tab
-        self._setup_assets_tab()
-        
-        # Hazards tab
-        self._setup_hazards_tab()
-        
-        # Losses tab
-        self._setup_losses_tab()
-        
-        # Control Structure tab
-        self._setup_control_structures_tab()
-        
-        # Controllers tab
-        self._setup_controllers_tab()
-        
-        # Diagrams tab
-        self._setup_diagrams_tab()
+        # Built tabs still showing another system's rows, loaded on activation
+        self._pending_tabs = set()
+        for tab_spec in self.ENTITY_TABS:
+            self._add_lazy_tab(tab_spec[1], tab_spec[3],
+                               partial(self._setup_entity_tab, *tab_spec))
+        self._add_lazy_tab("diagrams", "Diagrams", self._setup_diagrams_tab)
         
         # Warnings tab
         warnings_widget = QWidget()
@@ -267,6 +417,145 @@ class MainWindow(QMainWindow):
         audit_layout = QVBoxLayout(audit_widget)
         audit_layout.addWidget(QLabel("Audit - Coming Soon"))
         self.content_tabs.addTab(audit_widget, "Audit")
+        
+        self.content_tabs.currentChanged.connect(self._on_tab_changed)
+    
+    def _add_lazy_tab(self, key: str, title: str, builder):
+        """
+        Add an empty placeholder tab whose contents are built on first activation.
+        
+        Args:
+            key: Tab key recorded in _tab_built once built (e.g. "functions")
+            title: Tab title
+            builder: Callable that fills the placeholder widget
+        """
+        placeholder = QWidget()
+        self._lazy_tabs[placeholder] = (key, builder)
+        self._tab_keys[placeholder] = key
+        self.content_tabs.addTab(placeholder, title)
+    
+    def _on_tab_changed(self, index: int):
+        """Build a lazy tab the first time it is activated, or load it if pending."""
+        widget = self.content_tabs.widget(index)
+        lazy_tab = self._lazy_tabs.pop(widget, None)
+        if lazy_tab is None:
+            key = self._tab_keys.get(widget)
+            if key in self._pending_tabs:
+                self._pending_tabs.discard(key)
+                self._load_tab(key)
+            return
+        
+        key, builder = lazy_tab
+        builder(widget)
+        self._tab_built.add(key)
+        self._load_tab(key)
+    
+    def _load_visible_tab(self, keys):
+        """
+        Load the current tab if it is among keys and defer the others.
+        
+        Deferred tabs are loaded when next activated. After a system selection
+        _prefetch_neighbors also reads their first pages into the first-page
+        cache in the background, so the activation needs no query.
+        
+        Args:
+            keys: Built tab keys to bring up to date
+        """
+        current = self._tab_keys.get(self.content_tabs.currentWidget())
+        self._pending_tabs.update(key for key in keys if key != current)
+        if current in keys:
+            self._pending_tabs.discard(current)
+            self._load_tabs((current,))
+    
+    def _load_tabs(self, keys):
+        """
+        Load the current system's data into several tabs with one worker.
+        
+        The tabs' first-page loads are collected and run in order by a single
+        LoadRowsBatchTask rather than one pool thread per table.
+        
+        Args:
+            keys: Tab keys (e.g. "functions")
+        """
+        self._batched_loads = []
+        try:
+            for key in keys:
+                self._load_tab(key)
+        finally:
+            tasks, self._batched_loads = self._batched_loads, None
+        
+        if tasks:
+            QThreadPool.globalInstance().start(LoadRowsBatchTask(tasks))
+    
+    def _load_tab(self, key: str):
+        """
+        Load the current system's data into a tab if it has been built.
+        
+        Args:
+            key: Tab key (e.g. "functions")
+        """
+        loader = getattr(self, f"_load_{key}_for_system", None)
+        if loader and key in self._tab_built and self.current_system_id:
+            loader(self.current_system_id)
+    
+    def _setup_entity_tab(self, name: str, plural: str, label: str, title: str,
+                          headers: list, resize_columns: tuple, elided_column: int,
+                          tab_widget: QWidget):
+        """
+        Setup an entity management tab with Add/Edit/Delete buttons and a table.
+        
+        Widgets are stored as add_<name>_btn, edit_<name>_btn, delete_<name>_btn
+        and <plural>_table; the buttons call _add_<name>, _edit_<name> and
+        _delete_<name>.
+        
+        Args:
+            name: Entity key used in widget and handler names (e.g. "function")
+            plural: Plural key used for the table name (e.g. "functions")
+            label: Entity label used on the buttons
+            title: Tab title
+            headers: Table column headers
+            resize_columns: Columns sized to their contents
+            elided_column: Long-text column shortened for display
+            tab_widget: Placeholder widget the tab is built into
+        """
+        tab_layout = QVBoxLayout(tab_widget)
+        
+        # Toolbar
+        toolbar = QHBoxLayout()
+        
+        buttons = []
+        for action in ("add", "edit", "delete"):
+            button = QPushButton(f"{action.capitalize()} {label}")
+            button.clicked.connect(getattr(self, f"_{action}_{name}"))
+            toolbar.addWidget(button)
+            setattr(self, f"{action}_{name}_btn", button)
+            buttons.append(button)
+        
+        # Edit and delete need a selected row
+        selection_buttons = tuple(buttons[1:])
+        for button in selection_buttons:
+            button.setEnabled(False)
+        
+        toolbar.addStretch()
+        tab_layout.addLayout(toolbar)
+        
+        # Entity table
+        table = QTableView()
+        table.setModel(EntityTableModel(headers, table, elided_column=elided_column))
+        
+        header = table.horizontalHeader()
+        header.setStretchLastSection(True)
+        for column in resize_columns:
+            header.setSectionResizeMode(column, QHeaderView.ResizeToContents)
+        
+        table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        table.selectionModel().selectionChanged.connect(
+            lambda *_: self._schedule_buttons_state(table, selection_buttons)
+        )
+        table.doubleClicked.connect(getattr(self, f"_edit_{name}"))
+        setattr(self, f"{plural}_table", table)
+        
+        tab_layout.addWidget(table)
     
     def _setup_overview_tab(self):
         """Setup system overview tab."""
@@ -304,701 +593,63 @@ class MainWindow(QMainWindow):
         overview_layout.addStretch()
         self.content_tabs.addTab(overview_widget, "Overview")
     
-    def _setup_functions_tab(self):
-        """Setup functions management tab."""
-        functions_widget = QWidget()
-        functions_layout = QVBoxLayout(functions_widget)
-        
-        # Toolbar
-        toolbar = QHBoxLayout()
-        
-        self.add_function_btn = QPushButton("Add Function")
-        self.add_function_btn.clicked.connect(self._add_function)
-        toolbar.addWidget(self.add_function_btn)
-        
-        self.edit_function_btn = QPushButton("Edit Function")
-        self.edit_function_btn.clicked.connect(self._edit_function)
-        self.edit_function_btn.setEnabled(False)
-        toolbar.addWidget(self.edit_function_btn)
-
-        self.delete_function_btn = QPushButton("Delete Function")
-        self.delete_function_btn.clicked.connect(self._delete_function)
-        self.delete_function_btn.setEnabled(False)
-        toolbar.addWidget(self.delete_function_btn)
-        
-        toolbar.addStretch()
-        functions_layout.addLayout(toolbar)
-        
-        # Functions table
-        self.functions_table = QTableWidget()
-        self.functions_table.setColumnCount(4)
-        self.functions_table.setHorizontalHeaderLabels(["ID", "Name", "Description", "Criticality"])
-        
-        header = self.functions_table.horizontalHeader()
-        header.setStretchLastSection(True)
-        header.setSectionResizeMode(0, QHeaderView.ResizeToContents)
-        header.setSectionResizeMode(1, QHeaderView.ResizeToContents)
-        
-        self.functions_table.setSelectionBehavior(QTableWidget.SelectRows)
-        self.functions_table.itemSelectionChanged.connect(self._update_function_buttons_state)
-        self.functions_table.doubleClicked.connect(self._edit_function)
-        
-        functions_layout.addWidget(self.functions_table)
-        
-        self.content_tabs.addTab(functions_widget, "Functions")
-    
-    def _update_function_buttons_state(self):
-        """Enable/disable function buttons based on selection."""
-        has_selection = bool(self.functions_table.selectedItems())
-        self.edit_function_btn.setEnabled(has_selection)
-        self.delete_function_btn.setEnabled(has_selection)
-        
     def _delete_function(self):
         """Delete the selected function."""
-        selected_items = self.functions_table.selectedItems()
-        if not selected_items:
-            return
-            
-        function_id = selected_items[0].data(Qt.UserRole)
-        function_name = selected_items[1].text()
-        
-        reply = QMessageBox.question(
-            self,
-            "Delete Function",
-            f"Are you sure you want to delete function '{function_name}'?",
-            QMessageBox.Yes | QMessageBox.No,
-            QMessageBox.No
-        )
-        
-        if reply == QMessageBox.Yes:
-            try:
-                db_manager = self.database_initializer.get_database_manager()
-                connection = db_manager.get_connection()
-                repo = EntityFactory.get_repository(connection, Function)
-                if repo.delete(function_id):
-                    logger.info(f"Deleted function: {function_name} (ID: {function_id})")
-                    if self.current_system_id:
-                        self._load_functions_for_system(self.current_system_id)
-                else:
-                    self._show_error("Delete Failed", "Failed to delete function from database.")
-            except Exception as e:
-                logger.error(f"Failed to delete function: {str(e)}")
-                self._show_error("Delete Failed", str(e))
+        self._delete_entity(self.functions_table, Function, "function")
     
-    def _setup_requirements_tab(self):
-        """Setup requirements management tab."""
-        requirements_widget = QWidget()
-        requirements_layout = QVBoxLayout(requirements_widget)
-        
-        # Toolbar
-        toolbar = QHBoxLayout()
-        
-        self.add_requirement_btn = QPushButton("Add Requirement")
-        self.add_requirement_btn.clicked.connect(self._add_requirement)
-        toolbar.addWidget(self.add_requirement_btn)
-        
-        self.edit_requirement_btn = QPushButton("Edit Requirement")
-        self.edit_requirement_btn.clicked.connect(self._edit_requirement)
-        self.edit_requirement_btn.setEnabled(False)
-        toolbar.addWidget(self.edit_requirement_btn)
-
-        self.delete_requirement_btn = QPushButton("Delete Requirement")
-        self.delete_requirement_btn.clicked.connect(self._delete_requirement)
-        self.delete_requirement_btn.setEnabled(False)
-        toolbar.addWidget(self.delete_requirement_btn)
-
-        toolbar.addStretch()
-        requirements_layout.addLayout(toolbar)
-        
-        # Requirements table
-        self.requirements_table = QTableWidget()
-        self.requirements_table.setColumnCount(5)
-        self.requirements_table.setHorizontalHeaderLabels(["ID", "Alphanumeric ID", "Requirement Text", "Verification Method", "Criticality"])
-        
-        header = self.requirements_table.horizontalHeader()
-        header.setStretchLastSection(True)
-        header.setSectionResizeMode(0, QHeaderView.ResizeToContents)
-        header.setSectionResizeMode(1, QHeaderView.ResizeToContents)
-        header.setSectionResizeMode(2, QHeaderView.ResizeToContents)
-        header.setSectionResizeMode(3, QHeaderView.ResizeToContents)
-        
-        self.requirements_table.setSelectionBehavior(QTableWidget.SelectRows)
-        self.requirements_table.itemSelectionChanged.connect(self._update_requirement_buttons_state)
-        self.requirements_table.doubleClicked.connect(self._edit_requirement)
-        
-        requirements_layout.addWidget(self.requirements_table)
-        
-        self.content_tabs.addTab(requirements_widget, "Requirements")
-
-    def _update_requirement_buttons_state(self):
-        """Enable/disable requirement buttons based on selection."""
-        has_selection = bool(self.requirements_table.selectedItems())
-        self.edit_requirement_btn.setEnabled(has_selection)
-        self.delete_requirement_btn.setEnabled(has_selection)
-
     def _delete_requirement(self):
         """Delete the selected requirement."""
-        selected_items = self.requirements_table.selectedItems()
-        if not selected_items:
-            return
-            
-        requirement_id = selected_items[0].data(Qt.UserRole)
-        requirement_name = selected_items[1].text()
-        
-        reply = QMessageBox.question(
-            self,
-            "Delete Requirement",
-            f"Are you sure you want to delete requirement '{requirement_name}'?",
-            QMessageBox.Yes | QMessageBox.No,
-            QMessageBox.No
-        )
-        
-        if reply == QMessageBox.Yes:
-            try:
-                db_manager = self.database_initializer.get_database_manager()
-                connection = db_manager.get_connection()
-                repo = EntityFactory.get_repository(connection, Requirement)
-                if repo.delete(requirement_id):
-                    logger.info(f"Deleted requirement: {requirement_name} (ID: {requirement_id})")
-                    if self.current_system_id:
-                        self._load_requirements_for_system(self.current_system_id)
-                else:
-                    self._show_error("Delete Failed", "Failed to delete requirement from database.")
-            except Exception as e:
-                logger.error(f"Failed to delete requirement: {str(e)}")
-                self._show_error("Delete Failed", str(e))
+        self._delete_entity(self.requirements_table, Requirement, "requirement")
 
     def _load_requirements_for_system(self, system_id: int):
         """Load requirements for the selected system."""
         try:
-            db_manager = self.database_initializer.get_database_manager()
-            connection = db_manager.get_connection()
-            
-            requirements = connection.fetchall(
-                "SELECT * FROM requirements WHERE system_id = ? AND baseline = ? ORDER BY system_hierarchy",
-                (system_id, "Working")
+            connection = self._conn
+            
+            # Populate requirements table one page at a time
+            def to_row(row):
+                return (
+                    row['id'],
+                    row['system_hierarchy'],
+                    row['alphanumeric_identifier'] or "",
+                    row['requirement_text'] or "",
+                    row['verification_method'] or "",
+                    row['criticality'] or "Medium"
+                )
+            
+            self._set_paged_rows(
+                self.requirements_table, connection, _SQL_LOAD_REQUIREMENTS, (system_id, "Working"), to_row
             )
             
-            # Clear and populate requirements table
-            self.requirements_table.setRowCount(len(requirements))
-            
-            for row, req_data in enumerate(requirements):
-                req_dict = dict(req_data)
-                requirement = Requirement(**req_dict)
-
-                items = [
-                    QTableWidgetItem(requirement.get_hierarchical_id()),
-                    QTableWidgetItem(requirement.alphanumeric_identifier or ""),
-                    QTableWidgetItem(requirement.requirement_text[:100] + "..." if len(requirement.requirement_text) > 100 else requirement.requirement_text),
-                    QTableWidgetItem(requirement.verification_method or ""),
-                    QTableWidgetItem(requirement.criticality or "Medium")
-                ]
-
-                for item in items:
-                    item.setFlags(item.flags() & ~Qt.ItemIsEditable)
-
-                for col, item in enumerate(items):
-                    self.requirements_table.setItem(row, col, item)
-                
-                # Store requirement ID for editing
-                self.requirements_table.item(row, 0).setData(Qt.UserRole, requirement.id)
-            
         except Exception as e:
             logger.error(f"Failed to load requirements: {str(e)}")
     
-    def _setup_interfaces_tab(self):
-        """Setup interfaces management tab."""
-        interfaces_widget = QWidget()
-        interfaces_layout = QVBoxLayout(interfaces_widget)
-        
-        # Toolbar
-        toolbar = QHBoxLayout()
-        
-        self.add_interface_btn = QPushButton("Add Interface")
-        self.add_interface_btn.clicked.connect(self._add_interface)
-        toolbar.addWidget(self.add_interface_btn)
-        
-        self.edit_interface_btn = QPushButton("Edit Interface")
-        self.edit_interface_btn.clicked.connect(self._edit_interface)
-        self.edit_interface_btn.setEnabled(False)
-        toolbar.addWidget(self.edit_interface_btn)
-
-        self.delete_interface_btn = QPushButton("Delete Interface")
-        self.delete_interface_btn.clicked.connect(self._delete_interface)
-        self.delete_interface_btn.setEnabled(False)
-        toolbar.addWidget(self.delete_interface_btn)
-        
-        toolbar.addStretch()
-        interfaces_layout.addLayout(toolbar)
-        
-        # Interfaces table
-        self.interfaces_table = QTableWidget()
-        self.interfaces_table.setColumnCount(4)
-        self.interfaces_table.setHorizontalHeaderLabels(["ID", "Name", "System", "Description"])
-        
-        header = self.interfaces_table.horizontalHeader()
-        header.setStretchLastSection(True)
-        header.setSectionResizeMode(0, QHeaderView.ResizeToContents)
-        header.setSectionResizeMode(1, QHeaderView.ResizeToContents)
-        header.setSectionResizeMode(2, QHeaderView.ResizeToContents)
-        
-        self.interfaces_table.setSelectionBehavior(QTableWidget.SelectRows)
-        self.interfaces_table.itemSelectionChanged.connect(self._update_interface_buttons_state)
-        self.interfaces_table.doubleClicked.connect(self._edit_interface)
-        
-        interfaces_layout.addWidget(self.interfaces_table)
-        
-        self.content_tabs.addTab(interfaces_widget, "Interfaces")
-
-    def _update_interface_buttons_state(self):
-        """Enable/disable interface buttons based on selection."""
-        has_selection = bool(self.interfaces_table.selectedItems())
-        self.edit_interface_btn.setEnabled(has_selection)
-        self.delete_interface_btn.setEnabled(has_selection)
-        
     def _delete_interface(self):
         """Delete the selected interface."""
-        selected_items = self.interfaces_table.selectedItems()
-        if not selected_items:
-            return
-            
-        interface_id = selected_items[0].data(Qt.UserRole)
-        interface_name = selected_items[1].text()
-        
-        reply = QMessageBox.question(
-            self,
-            "Delete Interface",
-            f"Are you sure you want to delete interface '{interface_name}'?",
-            QMessageBox.Yes | QMessageBox.No,
-            QMessageBox.No
-        )
-        
-        if reply == QMessageBox.Yes:
-            try:
-                db_manager = self.database_initializer.get_database_manager()
-                connection = db_manager.get_connection()
-                repo = EntityFactory.get_repository(connection, Interface)
-                if repo.delete(interface_id):
-                    logger.info(f"Deleted interface: {interface_name} (ID: {interface_id})")
-                    if self.current_system_id:
-                        self._load_interfaces_for_system(self.current_system_id)
-                else:
-                    self._show_error("Delete Failed", "Failed to delete interface from database.")
-            except Exception as e:
-                logger.error(f"Failed to delete interface: {str(e)}")
-                self._show_error("Delete Failed", str(e))
-
-    def _setup_assets_tab(self):
-        """Setup assets management tab."""
-        assets_widget = QWidget()
-        assets_layout = QVBoxLayout(assets_widget)
-        
-        # Toolbar
-        toolbar = QHBoxLayout()
-        
-        self.add_asset_btn = QPushButton("Add Asset")
-        self.add_asset_btn.clicked.connect(self._add_asset)
-        toolbar.addWidget(self.add_asset_btn)
-        
-        self.edit_asset_btn = QPushButton("Edit Asset")
-        self.edit_asset_btn.clicked.connect(self._edit_asset)
-        self.edit_asset_btn.setEnabled(False)
-        toolbar.addWidget(self.edit_asset_btn)
+        self._delete_entity(self.interfaces_table, Interface, "interface")
 
-        self.delete_asset_btn = QPushButton("Delete Asset")
-        self.delete_asset_btn.clicked.connect(self._delete_asset)
-        self.delete_asset_btn.setEnabled(False)
-        toolbar.addWidget(self.delete_asset_btn)
-        
-        toolbar.addStretch()
-        assets_layout.addLayout(toolbar)
-        
-        # Assets table
-        self.assets_table = QTableWidget()
-        self.assets_table.setColumnCount(4)
-        self.assets_table.setHorizontalHeaderLabels(["ID", "Name", "System", "Description"])
-        
-        header = self.assets_table.horizontalHeader()
-        header.setStretchLastSection(True)
-        header.setSectionResizeMode(0, QHeaderView.ResizeToContents)
-        header.setSectionResizeMode(1, QHeaderView.ResizeToContents)
-        header.setSectionResizeMode(2, QHeaderView.ResizeToContents)
-        
-        self.assets_table.setSelectionBehavior(QTableWidget.SelectRows)
-        self.assets_table.itemSelectionChanged.connect(self._update_asset_buttons_state)
-        self.assets_table.doubleClicked.connect(self._edit_asset)
-        
-        assets_layout.addWidget(self.assets_table)
-        
-        self.content_tabs.addTab(assets_widget, "Assets")
-
-    def _update_asset_buttons_state(self):
-        """Enable/disable asset buttons based on selection."""
-        has_selection = bool(self.assets_table.selectedItems())
-        self.edit_asset_btn.setEnabled(has_selection)
-        self.delete_asset_btn.setEnabled(has_selection)
-        
     def _delete_asset(self):
         """Delete the selected asset."""
-        selected_items = self.assets_table.selectedItems()
-        if not selected_items:
-            return
-            
-        asset_id = selected_items[0].data(Qt.UserRole)
-        asset_name = selected_items[1].text()
-        
-        reply = QMessageBox.question(
-            self,
-            "Delete Asset",
-            f"Are you sure you want to delete asset '{asset_name}'?",
-            QMessageBox.Yes | QMessageBox.No,
-            QMessageBox.No
-        )
-        
-        if reply == QMessageBox.Yes:
-            try:
-                db_manager = self.database_initializer.get_database_manager()
-                connection = db_manager.get_connection()
-                repo = EntityFactory.get_repository(connection, Asset)
-                if repo.delete(asset_id):
-                    logger.info(f"Deleted asset: {asset_name} (ID: {asset_id})")
-                    if self.current_system_id:
-                        self._load_assets_for_system(self.current_system_id)
-                else:
-                    self._show_error("Delete Failed", "Failed to delete asset from database.")
-            except Exception as e:
-                logger.error(f"Failed to delete asset: {str(e)}")
-                self._show_error("Delete Failed", str(e))
-
-    def _setup_hazards_tab(self):
-        """Setup hazards management tab."""
-        hazards_widget = QWidget()
-        hazards_layout = QVBoxLayout(hazards_widget)
-        
-        # Toolbar
-        toolbar = QHBoxLayout()
-        
-        self.add_hazard_btn = QPushButton("Add Hazard")
-        self.add_hazard_btn.clicked.connect(self._add_hazard)
-        toolbar.addWidget(self.add_hazard_btn)
-        
-        self.edit_hazard_btn = QPushButton("Edit Hazard")
-        self.edit_hazard_btn.clicked.connect(self._edit_hazard)
-        self.edit_hazard_btn.setEnabled(False)
-        toolbar.addWidget(self.edit_hazard_btn)
+        self._delete_entity(self.assets_table, Asset, "asset")
 
-        self.delete_hazard_btn = QPushButton("Delete Hazard")
-        self.delete_hazard_btn.clicked.connect(self._delete_hazard)
-        self.delete_hazard_btn.setEnabled(False)
-        toolbar.addWidget(self.delete_hazard_btn)
-        
-        toolbar.addStretch()
-        hazards_layout.addLayout(toolbar)
-        
-        # Hazards table
-        self.hazards_table = QTableWidget()
-        self.hazards_table.setColumnCount(4)
-        self.hazards_table.setHorizontalHeaderLabels(["ID", "Name", "System", "Description"])
-        
-        header = self.hazards_table.horizontalHeader()
-        header.setStretchLastSection(True)
-        header.setSectionResizeMode(0, QHeaderView.ResizeToContents)
-        header.setSectionResizeMode(1, QHeaderView.ResizeToContents)
-        header.setSectionResizeMode(2, QHeaderView.ResizeToContents)
-        
-        self.hazards_table.setSelectionBehavior(QTableWidget.SelectRows)
-        self.hazards_table.itemSelectionChanged.connect(self._update_hazard_buttons_state)
-        self.hazards_table.doubleClicked.connect(self._edit_hazard)
-        
-        hazards_layout.addWidget(self.hazards_table)
-        
-        self.content_tabs.addTab(hazards_widget, "Hazards")
-
-    def _update_hazard_buttons_state(self):
-        """Enable/disable hazard buttons based on selection."""
-        has_selection = bool(self.hazards_table.selectedItems())
-        self.edit_hazard_btn.setEnabled(has_selection)
-        self.delete_hazard_btn.setEnabled(has_selection)
-        
     def _delete_hazard(self):
         """Delete the selected hazard."""
-        selected_items = self.hazards_table.selectedItems()
-        if not selected_items:
-            return
-            
-        hazard_id = selected_items[0].data(Qt.UserRole)
-        hazard_name = selected_items[1].text()
-        
-        reply = QMessageBox.question(
-            self,
-            "Delete Hazard",
-            f"Are you sure you want to delete hazard '{hazard_name}'?",
-            QMessageBox.Yes | QMessageBox.No,
-            QMessageBox.No
-        )
-        
-        if reply == QMessageBox.Yes:
-            try:
-                db_manager = self.database_initializer.get_database_manager()
-                connection = db_manager.get_connection()
-                repo = EntityFactory.get_repository(connection, Hazard)
-                if repo.delete(hazard_id):
-                    logger.info(f"Deleted hazard: {hazard_name} (ID: {hazard_id})")
-                    self._load_hazards_for_system(self.current_system_id if self.current_system_id else 0)
-                else:
-                    self._show_error("Delete Failed", "Failed to delete hazard from database.")
-            except Exception as e:
-                logger.error(f"Failed to delete hazard: {str(e)}")
-                self._show_error("Delete Failed", str(e))
+        self._delete_entity(self.hazards_table, Hazard, "hazard")
 
-    def _setup_losses_tab(self):
-        """Setup losses management tab."""
-        losses_widget = QWidget()
-        losses_layout = QVBoxLayout(losses_widget)
-        
-        # Toolbar
-        toolbar = QHBoxLayout()
-        
-        self.add_loss_btn = QPushButton("Add Loss")
-        self.add_loss_btn.clicked.connect(self._add_loss)
-        toolbar.addWidget(self.add_loss_btn)
-        
-        self.edit_loss_btn = QPushButton("Edit Loss")
-        self.edit_loss_btn.clicked.connect(self._edit_loss)
-        self.edit_loss_btn.setEnabled(False)
-        toolbar.addWidget(self.edit_loss_btn)
-
-        self.delete_loss_btn = QPushButton("Delete Loss")
-        self.delete_loss_btn.clicked.connect(self._delete_loss)
-        self.delete_loss_btn.setEnabled(False)
-        toolbar.addWidget(self.delete_loss_btn)
-        
-        toolbar.addStretch()
-        losses_layout.addLayout(toolbar)
-        
-        # Losses table
-        self.losses_table = QTableWidget()
-        self.losses_table.setColumnCount(4)
-        self.losses_table.setHorizontalHeaderLabels(["ID", "Name", "System", "Description"])
-        
-        header = self.losses_table.horizontalHeader()
-        header.setStretchLastSection(True)
-        header.setSectionResizeMode(0, QHeaderView.ResizeToContents)
-        header.setSectionResizeMode(1, QHeaderView.ResizeToContents)
-        header.setSectionResizeMode(2, QHeaderView.ResizeToContents)
-        
-        self.losses_table.setSelectionBehavior(QTableWidget.SelectRows)
-        self.losses_table.itemSelectionChanged.connect(self._update_loss_buttons_state)
-        self.losses_table.doubleClicked.connect(self._edit_loss)
-        
-        losses_layout.addWidget(self.losses_table)
-        
-        self.content_tabs.addTab(losses_widget, "Losses")
-
-    def _update_loss_buttons_state(self):
-        """Enable/disable loss buttons based on selection."""
-        has_selection = bool(self.losses_table.selectedItems())
-        self.edit_loss_btn.setEnabled(has_selection)
-        self.delete_loss_btn.setEnabled(has_selection)
-        
     def _delete_loss(self):
         """Delete the selected loss."""
-        selected_items = self.losses_table.selectedItems()
-        if not selected_items:
-            return
-            
-        loss_id = selected_items[0].data(Qt.UserRole)
-        loss_name = selected_items[1].text()
-        
-        reply = QMessageBox.question(
-            self,
-            "Delete Loss",
-            f"Are you sure you want to delete loss '{loss_name}'?",
-            QMessageBox.Yes | QMessageBox.No,
-            QMessageBox.No
-        )
-        
-        if reply == QMessageBox.Yes:
-            try:
-                db_manager = self.database_initializer.get_database_manager()
-                connection = db_manager.get_connection()
-                repo = EntityFactory.get_repository(connection, Loss)
-                if repo.delete(loss_id):
-                    logger.info(f"Deleted loss: {loss_name} (ID: {loss_id})")
-                    self._load_losses_for_system(self.current_system_id if self.current_system_id else 0)
-                else:
-                    self._show_error("Delete Failed", "Failed to delete loss from database.")
-            except Exception as e:
-                logger.error(f"Failed to delete loss: {str(e)}")
-                self._show_error("Delete Failed", str(e))
-
-    def _setup_control_structures_tab(self):
-        """Setup control structures management tab."""
-        control_structures_widget = QWidget()
-        control_structures_layout = QVBoxLayout(control_structures_widget)
-        
-        # Toolbar
-        toolbar = QHBoxLayout()
-        
-        self.add_control_structure_btn = QPushButton("Add Control Structure")
-        self.add_control_structure_btn.clicked.connect(self._add_control_structure)
-        toolbar.addWidget(self.add_control_structure_btn)
-        
-        self.edit_control_structure_btn = QPushButton("Edit Control Structure")
-        self.edit_control_structure_btn.clicked.connect(self._edit_control_structure)
-        self.edit_control_structure_btn.setEnabled(False)
-        toolbar.addWidget(self.edit_control_structure_btn)
+        self._delete_entity(self.losses_table, Loss, "loss")
 
-        self.delete_control_structure_btn = QPushButton("Delete Control Structure")
-        self.delete_control_structure_btn.clicked.connect(self._delete_control_structure)
-        self.delete_control_structure_btn.setEnabled(False)
-        toolbar.addWidget(self.delete_control_structure_btn)
-        
-        toolbar.addStretch()
-        control_structures_layout.addLayout(toolbar)
-        
-        # Control structures table
-        self.control_structures_table = QTableWidget()
-        self.control_structures_table.setColumnCount(4)
-        self.control_structures_table.setHorizontalHeaderLabels(["ID", "Name", "System", "Description"])
-        
-        header = self.control_structures_table.horizontalHeader()
-        header.setStretchLastSection(True)
-        header.setSectionResizeMode(0, QHeaderView.ResizeToContents)
-        header.setSectionResizeMode(1, QHeaderView.ResizeToContents)
-        header.setSectionResizeMode(2, QHeaderView.ResizeToContents)
-        
-        self.control_structures_table.setSelectionBehavior(QTableWidget.SelectRows)
-        self.control_structures_table.itemSelectionChanged.connect(self._update_control_structure_buttons_state)
-        self.control_structures_table.doubleClicked.connect(self._edit_control_structure)
-        
-        control_structures_layout.addWidget(self.control_structures_table)
-        
-        self.content_tabs.addTab(control_structures_widget, "Control Structures")
-
-    def _update_control_structure_buttons_state(self):
-        """Enable/disable control structure buttons based on selection."""
-        has_selection = bool(self.control_structures_table.selectedItems())
-        self.edit_control_structure_btn.setEnabled(has_selection)
-        self.delete_control_structure_btn.setEnabled(has_selection)
-        
     def _delete_control_structure(self):
         """Delete the selected control structure."""
-        selected_items = self.control_structures_table.selectedItems()
-        if not selected_items:
-            return
-            
-        control_structure_id = selected_items[0].data(Qt.UserRole)
-        control_structure_name = selected_items[1].text()
-        
-        reply = QMessageBox.question(
-            self,
-            "Delete Control Structure",
-            f"Are you sure you want to delete control structure '{control_structure_name}'?",
-            QMessageBox.Yes | QMessageBox.No,
-            QMessageBox.No
-        )
-        
-        if reply == QMessageBox.Yes:
-            try:
-                db_manager = self.database_initializer.get_database_manager()
-                connection = db_manager.get_connection()
-                repo = EntityFactory.get_repository(connection, ControlStructure)
-                if repo.delete(control_structure_id):
-                    logger.info(f"Deleted control structure: {control_structure_name} (ID: {control_structure_id})")
-                    if self.current_system_id:
-                        self._load_control_structures_for_system(self.current_system_id)
-                else:
-                    self._show_error("Delete Failed", "Failed to delete control structure from database.")
-            except Exception as e:
-                logger.error(f"Failed to delete control structure: {str(e)}")
-                self._show_error("Delete Failed", str(e))
+        self._delete_entity(self.control_structures_table, ControlStructure, "control structure")
 
-    def _setup_controllers_tab(self):
-        """Setup controllers management tab."""
-        controllers_widget = QWidget()
-        controllers_layout = QVBoxLayout(controllers_widget)
-        
-        # Toolbar
-        toolbar = QHBoxLayout()
-        
-        self.add_controller_btn = QPushButton("Add Controller")
-        self.add_controller_btn.clicked.connect(self._add_controller)
-        toolbar.addWidget(self.add_controller_btn)
-        
-        self.edit_controller_btn = QPushButton("Edit Controller")
-        self.edit_controller_btn.clicked.connect(self._edit_controller)
-        self.edit_controller_btn.setEnabled(False)
-        toolbar.addWidget(self.edit_controller_btn)
-
-        self.delete_controller_btn = QPushButton("Delete Controller")
-        self.delete_controller_btn.clicked.connect(self._delete_controller)
-        self.delete_controller_btn.setEnabled(False)
-        toolbar.addWidget(self.delete_controller_btn)
-        
-        toolbar.addStretch()
-        controllers_layout.addLayout(toolbar)
-        
-        # Controllers table
-        self.controllers_table = QTableWidget()
-        self.controllers_table.setColumnCount(4)
-        self.controllers_table.setHorizontalHeaderLabels(["ID", "Name", "System", "Description"])
-        
-        header = self.controllers_table.horizontalHeader()
-        header.setStretchLastSection(True)
-        header.setSectionResizeMode(0, QHeaderView.ResizeToContents)
-        header.setSectionResizeMode(1, QHeaderView.ResizeToContents)
-        header.setSectionResizeMode(2, QHeaderView.ResizeToContents)
-        
-        self.controllers_table.setSelectionBehavior(QTableWidget.SelectRows)
-        self.controllers_table.itemSelectionChanged.connect(self._update_controller_buttons_state)
-        self.controllers_table.doubleClicked.connect(self._edit_controller)
-        
-        controllers_layout.addWidget(self.controllers_table)
-        
-        self.content_tabs.addTab(controllers_widget, "Controllers")
-
-    def _update_controller_buttons_state(self):
-        """Enable/disable controller buttons based on selection."""
-        has_selection = bool(self.controllers_table.selectedItems())
-        self.edit_controller_btn.setEnabled(has_selection)
-        self.delete_controller_btn.setEnabled(has_selection)
-        
     def _delete_controller(self):
         """Delete the selected controller."""
-        selected_items = self.controllers_table.selectedItems()
-        if not selected_items:
-            return
-            
-        controller_id = selected_items[0].data(Qt.UserRole)
-        controller_name = selected_items[1].text()
-        
-        reply = QMessageBox.question(
-            self,
-            "Delete Controller",
-            f"Are you sure you want to delete controller '{controller_name}'?",
-            QMessageBox.Yes | QMessageBox.No,
-            QMessageBox.No
-        )
-        
-        if reply == QMessageBox.Yes:
-            try:
-                db_manager = self.database_initializer.get_database_manager()
-                connection = db_manager.get_connection()
-                repo = EntityFactory.get_repository(connection, Controller)
-                if repo.delete(controller_id):
-                    logger.info(f"Deleted controller: {controller_name} (ID: {controller_id})")
-                    if self.current_system_id:
-                        self._load_controllers_for_system(self.current_system_id)
-                else:
-                    self._show_error("Delete Failed", "Failed to delete controller from database.")
-            except Exception as e:
-                logger.error(f"Failed to delete controller: {str(e)}")
-                self._show_error("Delete Failed", str(e))
+        self._delete_entity(self.controllers_table, Controller, "controller")
 
-    def _setup_diagrams_tab(self):
+    def _setup_diagrams_tab(self, diagrams_widget: QWidget):
         """Setup diagrams management tab."""
-        diagrams_widget = QWidget()
         diagrams_layout = QVBoxLayout(diagrams_widget)
         
         # Toolbar
@@ -1031,13 +682,10 @@ class MainWindow(QMainWindow):
         self.diagrams_list.doubleClicked.connect(self._view_diagram)
         
         diagrams_layout.addWidget(self.diagrams_list)
-        
-        self.content_tabs.addTab(diagrams_widget, "Diagrams")
 
     def _update_diagram_buttons_state(self):
         """Enable/disable diagram buttons based on selection."""
-        has_selection = bool(self.diagrams_list.selectedItems())
-        self.view_diagram_btn.setEnabled(has_selection)
+        self._schedule_buttons_state(self.diagrams_list, (self.view_diagram_btn,))
     
     def _generate_diagram(self):
         """Generate a system diagram."""
@@ -1069,8 +717,7 @@ class MainWindow(QMainWindow):
         
         try:
             # Get system from database
-            db_manager = self.database_initializer.get_database_manager()
-            connection = db_manager.get_connection()
+            connection = self._conn
             system_repo = EntityFactory.get_repository(connection, System)
             system = system_repo.get_by_id(self.current_system_id)
             
@@ -1083,10 +730,13 @@ class MainWindow(QMainWindow):
             if dialog.exec() == QDialog.Accepted:
                 updated_system = dialog.get_system()
                 if updated_system and system_repo.update(updated_system):
+                    self._system_summary_cache.pop(updated_system.id, None)
+                    self._dirty_tabs.update(self.SYSTEM_NAME_TABS)
+                    self._clear_first_pages()
                     # Refresh hierarchy tree
                     self.hierarchy_tree.refresh_from_database()
                     # Update breadcrumb
-                    self._update_breadcrumb(updated_system)
+                    self._update_breadcrumb(updated_system.system_name, updated_system.system_description)
                     logger.info(f"Updated system: {updated_system.system_name}")
                 else:
                     QMessageBox.warning(self, "Update Failed", "Failed to update system.")
@@ -1107,28 +757,19 @@ class MainWindow(QMainWindow):
     
     def _edit_function(self):
         """Edit selected function."""
-        current_row = self.functions_table.currentRow()
+        current_row = self.functions_table.currentIndex().row()
         if current_row < 0:
             return
         
-        function_id = self.functions_table.item(current_row, 0).data(Qt.UserRole)
+        function_id = self.functions_table.model().entity_id(current_row)
         if not function_id:
             return
         
         try:
-            # Get function from database
-            db_manager = self.database_initializer.get_database_manager()
-            connection = db_manager.get_connection()
+            # Get function and its owning system from database
+            function = self._load_entity_for_edit(Function, function_id)
             
-            function_data = connection.fetchone(
-                "SELECT * FROM functions WHERE id = ?",
-                (function_id,)
-            )
-            
-            if function_data:
-                func_dict = dict(function_data)
-                function = Function(**func_dict)
-                
+            if function:
                 dialog = FunctionEditDialog(function, parent=self)
                 dialog.function_saved.connect(self._on_function_saved)
                 dialog.exec()
@@ -1139,29 +780,11 @@ class MainWindow(QMainWindow):
     def _on_function_saved(self, function: Function):
         """Handle function saved event."""
         try:
-            db_manager = self.database_initializer.get_database_manager()
-            connection = db_manager.get_connection()
-            function_repo = EntityFactory.get_repository(connection, Function)
-            
-            if function.id is None:
-                # New function
-                new_id = function_repo.create(function)
-                if new_id:
-                    function.id = new_id
-                    logger.info(f"Created function: {function.function_name}")
-                else:
-                    QMessageBox.critical(self, "Save Failed", "Failed to create function in database")
-                    return
-            else:
-                # Update existing function
-                if not function_repo.update(function):
-                    QMessageBox.critical(self, "Save Failed", "Failed to update function in database")
-                    return
-                logger.info(f"Updated function: {function.function_name}")
-            
-            # Refresh the functions table
-            if self.current_system_id:
-                self._load_functions_for_system(self.current_system_id)
+            is_new = function.id is None
+            # Save and refresh its row in the functions table in one transaction
+            if not self._save_entity(function, "function", partial(self._reload_row, "functions", function)):
+                return
+            logger.info(f"{'Created' if is_new else 'Updated'} function: {function.function_name}")
             
         except Exception as e:
             logger.error(f"Failed to save function: {str(e)}")
@@ -1179,28 +802,19 @@ class MainWindow(QMainWindow):
     
     def _edit_interface(self):
         """Edit selected interface."""
-        current_row = self.interfaces_table.currentRow()
+        current_row = self.interfaces_table.currentIndex().row()
         if current_row < 0:
             return
         
-        interface_id = self.interfaces_table.item(current_row, 0).data(Qt.UserRole)
+        interface_id = self.interfaces_table.model().entity_id(current_row)
         if not interface_id:
             return
         
         try:
-            # Get interface from database
-            db_manager = self.database_initializer.get_database_manager()
-            connection = db_manager.get_connection()
+            # Get interface and its owning system from database
+            interface = self._load_entity_for_edit(Interface, interface_id)
             
-            interface_data = connection.fetchone(
-                "SELECT * FROM interfaces WHERE id = ?",
-                (interface_id,)
-            )
-            
-            if interface_data:
-                int_dict = dict(interface_data)
-                interface = Interface(**int_dict)
-                
+            if interface:
                 dialog = InterfaceEditDialog(interface, parent=self)
                 dialog.interface_saved.connect(self._on_interface_saved)
                 dialog.exec()
@@ -1211,30 +825,11 @@ class MainWindow(QMainWindow):
     def _on_interface_saved(self, interface: Interface):
         """Handle interface saved event."""
         try:
-            # Save to database
-            db_manager = self.database_initializer.get_database_manager()
-            connection = db_manager.get_connection()
-            interface_repo = EntityFactory.get_repository(connection, Interface)
-            
-            if interface.id is None:
-                # New interface
-                new_id = interface_repo.create(interface)
-                if new_id:
-                    interface.id = new_id
-                    logger.info(f"Created interface: {interface.interface_name}")
-                else:
-                    QMessageBox.critical(self, "Save Failed", "Failed to create interface in database")
-                    return
-            else:
-                # Update existing interface
-                if not interface_repo.update(interface):
-                    QMessageBox.critical(self, "Save Failed", "Failed to update interface in database")
-                    return
-                logger.info(f"Updated interface: {interface.interface_name}")
-            
-            # Refresh the interfaces table
-            if self.current_system_id:
-                self._load_interfaces_for_system(self.current_system_id)
+            is_new = interface.id is None
+            # Save and refresh its row in the interfaces table in one transaction
+            if not self._save_entity(interface, "interface", partial(self._reload_row, "interfaces", interface)):
+                return
+            logger.info(f"{'Created' if is_new else 'Updated'} interface: {interface.interface_name}")
             
         except Exception as e:
             logger.error(f"Failed to save interface: {str(e)}")
@@ -1252,28 +847,19 @@ class MainWindow(QMainWindow):
     
     def _edit_asset(self):
         """Edit selected asset."""
-        current_row = self.assets_table.currentRow()
+        current_row = self.assets_table.currentIndex().row()
         if current_row < 0:
             return
         
-        asset_id = self.assets_table.item(current_row, 0).data(Qt.UserRole)
+        asset_id = self.assets_table.model().entity_id(current_row)
         if not asset_id:
             return
         
         try:
-            # Get asset from database
-            db_manager = self.database_initializer.get_database_manager()
-            connection = db_manager.get_connection()
+            # Get asset and its owning system from database
+            asset = self._load_entity_for_edit(Asset, asset_id)
             
-            asset_data = connection.fetchone(
-                "SELECT * FROM assets WHERE id = ?",
-                (asset_id,)
-            )
-            
-            if asset_data:
-                asset_dict = dict(asset_data)
-                asset = Asset(**asset_dict)
-                
+            if asset:
                 dialog = AssetEditDialog(asset, parent=self)
                 dialog.asset_saved.connect(self._on_asset_saved)
                 dialog.exec()
@@ -1284,30 +870,11 @@ class MainWindow(QMainWindow):
     def _on_asset_saved(self, asset: Asset):
         """Handle asset saved event."""
         try:
-            # Save to database
-            db_manager = self.database_initializer.get_database_manager()
-            connection = db_manager.get_connection()
-            asset_repo = EntityFactory.get_repository(connection, Asset)
-            
-            if asset.id is None:
-                # New asset
-                new_id = asset_repo.create(asset)
-                if new_id:
-                    asset.id = new_id
-                    logger.info(f"Created asset: {asset.asset_name}")
-                else:
-                    QMessageBox.critical(self, "Save Failed", "Failed to create asset in database")
-                    return
-            else:
-                # Update existing asset
-                if not asset_repo.update(asset):
-                    QMessageBox.critical(self, "Save Failed", "Failed to update asset in database")
-                    return
-                logger.info(f"Updated asset: {asset.asset_name}")
-            
-            # Refresh the assets table
-            if self.current_system_id:
-                self._load_assets_for_system(self.current_system_id)
+            is_new = asset.id is None
+            # Save and refresh its row in the assets table in one transaction
+            if not self._save_entity(asset, "asset", partial(self._reload_row, "assets", asset)):
+                return
+            logger.info(f"{'Created' if is_new else 'Updated'} asset: {asset.asset_name}")
             
         except Exception as e:
             logger.error(f"Failed to save asset: {str(e)}")
@@ -1321,28 +888,19 @@ class MainWindow(QMainWindow):
     
     def _edit_hazard(self):
         """Edit selected hazard."""
-        current_row = self.hazards_table.currentRow()
+        current_row = self.hazards_table.currentIndex().row()
         if current_row < 0:
             return
         
-        hazard_id = self.hazards_table.item(current_row, 0).data(Qt.UserRole)
+        hazard_id = self.hazards_table.model().entity_id(current_row)
         if not hazard_id:
             return
         
         try:
-            # Get hazard from database
-            db_manager = self.database_initializer.get_database_manager()
-            connection = db_manager.get_connection()
+            # Get hazard and its owning system from database
+            hazard = self._load_entity_for_edit(Hazard, hazard_id)
             
-            hazard_data = connection.fetchone(
-                "SELECT * FROM hazards WHERE id = ?",
-                (hazard_id,)
-            )
-            
-            if hazard_data:
-                hazard_dict = dict(hazard_data)
-                hazard = Hazard(**hazard_dict)
-                
+            if hazard:
                 dialog = HazardEditDialog(hazard, parent=self)
                 dialog.hazard_saved.connect(self._on_hazard_saved)
                 dialog.exec()
@@ -1353,29 +911,12 @@ class MainWindow(QMainWindow):
     def _on_hazard_saved(self, hazard: Hazard):
         """Handle hazard saved event."""
         try:
-            # Save to database
-            db_manager = self.database_initializer.get_database_manager()
-            connection = db_manager.get_connection()
-            hazard_repo = EntityFactory.get_repository(connection, Hazard)
-            
-            if hazard.id is None:
-                # New hazard
-                new_id = hazard_repo.create(hazard)
-                if new_id:
-                    hazard.id = new_id
-                    logger.info(f"Created hazard: {hazard.hazard_name}")
-                else:
-                    QMessageBox.critical(self, "Save Failed", "Failed to create hazard in database")
-                    return
-            else:
-                # Update existing hazard
-                if not hazard_repo.update(hazard):
-                    QMessageBox.critical(self, "Save Failed", "Failed to update hazard in database")
-                    return
-                logger.info(f"Updated hazard: {hazard.hazard_name}")
-            
-            # Refresh the hazards table
-            self._load_hazards_for_system(self.current_system_id if self.current_system_id else 0)
+            is_new = hazard.id is None
+            # Save and refresh its row in the hazards table in one transaction
+            reload = partial(self._reload_row, "hazards", hazard)
+            if not self._save_entity(hazard, "hazard", reload):
+                return
+            logger.info(f"{'Created' if is_new else 'Updated'} hazard: {hazard.hazard_name}")
             
         except Exception as e:
             logger.error(f"Failed to save hazard: {str(e)}")
@@ -1389,28 +930,19 @@ class MainWindow(QMainWindow):
     
     def _edit_loss(self):
         """Edit selected loss."""
-        current_row = self.losses_table.currentRow()
+        current_row = self.losses_table.currentIndex().row()
         if current_row < 0:
             return
         
-        loss_id = self.losses_table.item(current_row, 0).data(Qt.UserRole)
+        loss_id = self.losses_table.model().entity_id(current_row)
         if not loss_id:
             return
         
         try:
-            # Get loss from database
-            db_manager = self.database_initializer.get_database_manager()
-            connection = db_manager.get_connection()
-            
-            loss_data = connection.fetchone(
-                "SELECT * FROM losses WHERE id = ?",
-                (loss_id,)
-            )
+            # Get loss and its owning system from database
+            loss = self._load_entity_for_edit(Loss, loss_id)
             
-            if loss_data:
-                loss_dict = dict(loss_data)
-                loss = Loss(**loss_dict)
-                
+            if loss:
                 dialog = LossEditDialog(loss, parent=self)
                 dialog.loss_saved.connect(self._on_loss_saved)
                 dialog.exec()
@@ -1421,29 +953,12 @@ class MainWindow(QMainWindow):
     def _on_loss_saved(self, loss: Loss):
         """Handle loss saved event."""
         try:
-            # Save to database
-            db_manager = self.database_initializer.get_database_manager()
-            connection = db_manager.get_connection()
-            loss_repo = EntityFactory.get_repository(connection, Loss)
-            
-            if loss.id is None:
-                # New loss
-                new_id = loss_repo.create(loss)
-                if new_id:
-                    loss.id = new_id
-                    logger.info(f"Created loss: {loss.loss_name}")
-                else:
-                    QMessageBox.critical(self, "Save Failed", "Failed to create loss in database")
-                    return
-            else:
-                # Update existing loss
-                if not loss_repo.update(loss):
-                    QMessageBox.critical(self, "Save Failed", "Failed to update loss in database")
-                    return
-                logger.info(f"Updated loss: {loss.loss_name}")
-            
-            # Refresh the losses table
-            self._load_losses_for_system(self.current_system_id if self.current_system_id else 0)
+            is_new = loss.id is None
+            # Save and refresh its row in the losses table in one transaction
+            reload = partial(self._reload_row, "losses", loss)
+            if not self._save_entity(loss, "loss", reload):
+                return
+            logger.info(f"{'Created' if is_new else 'Updated'} loss: {loss.loss_name}")
             
         except Exception as e:
             logger.error(f"Failed to save loss: {str(e)}")
@@ -1461,28 +976,19 @@ class MainWindow(QMainWindow):
     
     def _edit_control_structure(self):
         """Edit selected control structure."""
-        current_row = self.control_structures_table.currentRow()
+        current_row = self.control_structures_table.currentIndex().row()
         if current_row < 0:
             return
         
-        control_structure_id = self.control_structures_table.item(current_row, 0).data(Qt.UserRole)
+        control_structure_id = self.control_structures_table.model().entity_id(current_row)
         if not control_structure_id:
             return
         
         try:
-            # Get control structure from database
-            db_manager = self.database_initializer.get_database_manager()
-            connection = db_manager.get_connection()
-            
-            control_structure_data = connection.fetchone(
-                "SELECT * FROM control_structures WHERE id = ?",
-                (control_structure_id,)
-            )
+            # Get control structure and its owning system from database
+            control_structure = self._load_entity_for_edit(ControlStructure, control_structure_id)
             
-            if control_structure_data:
-                cs_dict = dict(control_structure_data)
-                control_structure = ControlStructure(**cs_dict)
-                
+            if control_structure:
                 dialog = ControlStructureEditDialog(control_structure, parent=self)
                 dialog.control_structure_saved.connect(self._on_control_structure_saved)
                 dialog.exec()
@@ -1493,30 +999,12 @@ class MainWindow(QMainWindow):
     def _on_control_structure_saved(self, control_structure: ControlStructure):
         """Handle control structure saved event."""
         try:
-            # Save to database
-            db_manager = self.database_initializer.get_database_manager()
-            connection = db_manager.get_connection()
-            control_structure_repo = EntityFactory.get_repository(connection, ControlStructure)
-            
-            if control_structure.id is None:
-                # New control structure
-                new_id = control_structure_repo.create(control_structure)
-                if new_id:
-                    control_structure.id = new_id
-                    logger.info(f"Created control structure: {control_structure.structure_name}")
-                else:
-                    QMessageBox.critical(self, "Save Failed", "Failed to create control structure in database")
-                    return
-            else:
-                # Update existing control structure
-                if not control_structure_repo.update(control_structure):
-                    QMessageBox.critical(self, "Save Failed", "Failed to update control structure in database")
-                    return
-                logger.info(f"Updated control structure: {control_structure.structure_name}")
-            
-            # Refresh the control structures table
-            if self.current_system_id:
-                self._load_control_structures_for_system(self.current_system_id)
+            is_new = control_structure.id is None
+            # Save and refresh its row in the control structures table in one transaction
+            reload = partial(self._reload_row, "control_structures", control_structure)
+            if not self._save_entity(control_structure, "control structure", reload):
+                return
+            logger.info(f"{'Created' if is_new else 'Updated'} control structure: {control_structure.structure_name}")
             
         except Exception as e:
             logger.error(f"Failed to save control structure: {str(e)}")
@@ -1534,28 +1022,19 @@ class MainWindow(QMainWindow):
     
     def _edit_controller(self):
         """Edit selected controller."""
-        current_row = self.controllers_table.currentRow()
+        current_row = self.controllers_table.currentIndex().row()
         if current_row < 0:
             return
         
-        controller_id = self.controllers_table.item(current_row, 0).data(Qt.UserRole)
+        controller_id = self.controllers_table.model().entity_id(current_row)
         if not controller_id:
             return
         
         try:
-            # Get controller from database
-            db_manager = self.database_initializer.get_database_manager()
-            connection = db_manager.get_connection()
-            
-            controller_data = connection.fetchone(
-                "SELECT * FROM controllers WHERE id = ?",
-                (controller_id,)
-            )
+            # Get controller and its owning system from database
+            controller = self._load_entity_for_edit(Controller, controller_id)
             
-            if controller_data:
-                controller_dict = dict(controller_data)
-                controller = Controller(**controller_dict)
-                
+            if controller:
                 dialog = ControllerEditDialog(controller, parent=self)
                 dialog.controller_saved.connect(self._on_controller_saved)
                 dialog.exec()
@@ -1566,30 +1045,11 @@ class MainWindow(QMainWindow):
     def _on_controller_saved(self, controller: Controller):
         """Handle controller saved event."""
         try:
-            # Save to database
-            db_manager = self.database_initializer.get_database_manager()
-            connection = db_manager.get_connection()
-            controller_repo = EntityFactory.get_repository(connection, Controller)
-            
-            if controller.id is None:
-                # New controller
-                new_id = controller_repo.create(controller)
-                if new_id:
-                    controller.id = new_id
-                    logger.info(f"Created controller: {controller.controller_name}")
-                else:
-                    QMessageBox.critical(self, "Save Failed", "Failed to create controller in database")
-                    return
-            else:
-                # Update existing controller
-                if not controller_repo.update(controller):
-                    QMessageBox.critical(self, "Save Failed", "Failed to update controller in database")
-                    return
-                logger.info(f"Updated controller: {controller.controller_name}")
-            
-            # Refresh the controllers table
-            if self.current_system_id:
-                self._load_controllers_for_system(self.current_system_id)
+            is_new = controller.id is None
+            # Save and refresh its row in the controllers table in one transaction
+            if not self._save_entity(controller, "controller", partial(self._reload_row, "controllers", controller)):
+                return
+            logger.info(f"{'Created' if is_new else 'Updated'} controller: {controller.controller_name}")
             
         except Exception as e:
             logger.error(f"Failed to save controller: {str(e)}")
@@ -1598,222 +1058,144 @@ class MainWindow(QMainWindow):
     def _load_interfaces_for_system(self, system_id: int):
         """Load interfaces for the selected system."""
         try:
-            db_manager = self.database_initializer.get_database_manager()
-            connection = db_manager.get_connection()
-            
-            interfaces = connection.fetchall(
-                "SELECT * FROM interfaces WHERE system_id = ? AND baseline = ? ORDER BY system_hierarchy",
-                (system_id, "Working")
+            connection = self._conn
+            
+            # Populate interfaces table one page at a time
+            # Every row belongs to system_id, so its name is looked up once
+            system_name = self._get_system_name(system_id)
+            
+            def to_row(row):
+                return (
+                    row['id'],
+                    row['system_hierarchy'],
+                    row['interface_name'],
+                    system_name,
+                    row['interface_description'] or ""
+                )
+            
+            self._set_paged_rows(
+                self.interfaces_table, connection, _SQL_LOAD_INTERFACES, (system_id, "Working"), to_row
             )
             
-            # Clear and populate interfaces table
-            self.interfaces_table.setRowCount(len(interfaces))
-            
-            for row, int_data in enumerate(interfaces):
-                int_dict = dict(int_data)
-                interface = Interface(**int_dict)
-                
-                items = [
-                    QTableWidgetItem(interface.get_hierarchical_id()),
-                    QTableWidgetItem(interface.interface_name),
-                    QTableWidgetItem(self._get_system_name(interface.system_id)),
-                    QTableWidgetItem(interface.interface_description[:100] + "..." if len(interface.interface_description or "") > 100 else interface.interface_description or "")
-                ]
-
-                for item in items:
-                    item.setFlags(item.flags() & ~Qt.ItemIsEditable)
-
-                for col, item in enumerate(items):
-                    self.interfaces_table.setItem(row, col, item)
-                
-                # Store interface ID for editing
-                self.interfaces_table.item(row, 0).setData(Qt.UserRole, interface.id)
-            
         except Exception as e:
             logger.error(f"Failed to load interfaces: {str(e)}")
     
     def _load_assets_for_system(self, system_id: int):
         """Load assets for the selected system."""
         try:
-            db_manager = self.database_initializer.get_database_manager()
-            connection = db_manager.get_connection()
-            
-            assets = connection.fetchall(
-                "SELECT * FROM assets WHERE system_id = ? AND baseline = ? ORDER BY system_hierarchy",
-                (system_id, "Working")
+            connection = self._conn
+            
+            # Populate assets table one page at a time
+            # Every row belongs to system_id, so its name is looked up once
+            system_name = self._get_system_name(system_id)
+            
+            def to_row(row):
+                return (
+                    row['id'],
+                    row['system_hierarchy'],
+                    row['asset_name'],
+                    system_name,
+                    row['asset_description'] or ""
+                )
+            
+            self._set_paged_rows(
+                self.assets_table, connection, _SQL_LOAD_ASSETS, (system_id, "Working"), to_row
             )
             
-            # Clear and populate assets table
-            self.assets_table.setRowCount(len(assets))
-            
-            for row, asset_data in enumerate(assets):
-                asset_dict = dict(asset_data)
-                asset = Asset(**asset_dict)
-                
-                items = [
-                    QTableWidgetItem(asset.get_hierarchical_id()),
-                    QTableWidgetItem(asset.asset_name),
-                    QTableWidgetItem(self._get_system_name(asset.system_id)),
-                    QTableWidgetItem(asset.asset_description[:100] + "..." if len(asset.asset_description or "") > 100 else asset.asset_description or "")
-                ]
-
-                for item in items:
-                    item.setFlags(item.flags() & ~Qt.ItemIsEditable)
-
-                for col, item in enumerate(items):
-                    self.assets_table.setItem(row, col, item)
-
-                # Store asset ID for editing
-                self.assets_table.item(row, 0).setData(Qt.UserRole, asset.id)
-            
         except Exception as e:
             logger.error(f"Failed to load assets: {str(e)}")
     
     def _load_hazards_for_system(self, system_id: int):
         """Load hazards for the selected system."""
         try:
-            db_manager = self.database_initializer.get_database_manager()
-            connection = db_manager.get_connection()
-            
-            hazards = connection.fetchall(
-                "SELECT * FROM hazards WHERE baseline = ? ORDER BY system_hierarchy",
-                ("Working",)
+            connection = self._conn
+            
+            # Populate hazards table one page at a time
+            def to_row(row):
+                return (
+                    row['id'],
+                    row['system_hierarchy'],
+                    row['h_name'],
+                    "All Systems",  # Hazards are system-wide
+                    row['h_description'] or ""
+                )
+            
+            self._set_paged_rows(
+                self.hazards_table, connection, _SQL_LOAD_HAZARDS, ("Working",), to_row
             )
             
-            # Clear and populate hazards table
-            self.hazards_table.setRowCount(len(hazards))
-            
-            for row, hazard_data in enumerate(hazards):
-                hazard_dict = dict(hazard_data)
-                hazard = Hazard(**hazard_dict)
-                
-                items = [
-                    QTableWidgetItem(hazard.get_hierarchical_id()),
-                    QTableWidgetItem(hazard.hazard_name),
-                    QTableWidgetItem("All Systems"),  # Hazards are system-wide
-                    QTableWidgetItem(hazard.hazard_description[:100] + "..." if len(hazard.hazard_description or "") > 100 else hazard.hazard_description or "")
-                ]
-
-                for item in items:
-                    item.setFlags(item.flags() & ~Qt.ItemIsEditable)
-
-                for col, item in enumerate(items):
-                    self.hazards_table.setItem(row, col, item)
-                
-                # Store hazard ID for editing
-                self.hazards_table.item(row, 0).setData(Qt.UserRole, hazard.id)
-            
         except Exception as e:
             logger.error(f"Failed to load hazards: {str(e)}")
     
     def _load_losses_for_system(self, system_id: int):
         """Load losses for the selected system."""
         try:
-            db_manager = self.database_initializer.get_database_manager()
-            connection = db_manager.get_connection()
-            
-            losses = connection.fetchall(
-                "SELECT * FROM losses WHERE baseline = ? ORDER BY system_hierarchy",
-                ("Working",)
+            connection = self._conn
+            
+            # Populate losses table one page at a time
+            def to_row(row):
+                return (
+                    row['id'],
+                    row['system_hierarchy'],
+                    row['l_name'],
+                    "All Systems",  # Losses are system-wide
+                    row['loss_description'] or ""
+                )
+            
+            self._set_paged_rows(
+                self.losses_table, connection, _SQL_LOAD_LOSSES, ("Working",), to_row
             )
             
-            # Clear and populate losses table
-            self.losses_table.setRowCount(len(losses))
-            
-            for row, loss_data in enumerate(losses):
-                loss_dict = dict(loss_data)
-                loss = Loss(**loss_dict)
-                
-                items = [
-                    QTableWidgetItem(loss.get_hierarchical_id()),
-                    QTableWidgetItem(loss.loss_name),
-                    QTableWidgetItem("All Systems"),  # Losses are system-wide
-                    QTableWidgetItem(loss.loss_description[:100] + "..." if len(loss.loss_description or "") > 100 else loss.loss_description or "")
-                ]
-
-                for item in items:
-                    item.setFlags(item.flags() & ~Qt.ItemIsEditable)
-
-                for col, item in enumerate(items):
-                    self.losses_table.setItem(row, col, item)
-                
-                # Store loss ID for editing
-                self.losses_table.item(row, 0).setData(Qt.UserRole, loss.id)
-            
         except Exception as e:
             logger.error(f"Failed to load losses: {str(e)}")
     
     def _load_control_structures_for_system(self, system_id: int):
         """Load control structures for the selected system."""
         try:
-            db_manager = self.database_initializer.get_database_manager()
-            connection = db_manager.get_connection()
-            
-            control_structures = connection.fetchall(
-                "SELECT * FROM control_structures WHERE system_id = ? AND baseline = ? ORDER BY system_hierarchy",
-                (system_id, "Working")
+            connection = self._conn
+            
+            # Populate control structures table one page at a time
+            # Every row belongs to system_id, so its name is looked up once
+            system_name = self._get_system_name(system_id)
+            
+            def to_row(row):
+                return (
+                    row['id'],
+                    row['system_hierarchy'],
+                    row['structure_name'],
+                    system_name,
+                    row['structure_description'] or ""
+                )
+            
+            self._set_paged_rows(
+                self.control_structures_table, connection, _SQL_LOAD_CONTROL_STRUCTURES, (system_id, "Working"), to_row
             )
             
-            # Clear and populate control structures table
-            self.control_structures_table.setRowCount(len(control_structures))
-            
-            for row, cs_data in enumerate(control_structures):
-                cs_dict = dict(cs_data)
-                control_structure = ControlStructure(**cs_dict)
-                
-                items = [
-                    QTableWidgetItem(control_structure.get_hierarchical_id()),
-                    QTableWidgetItem(control_structure.structure_name),
-                    QTableWidgetItem(self._get_system_name(control_structure.system_id)),
-                    QTableWidgetItem(control_structure.structure_description[:100] + "..." if len(control_structure.structure_description or "") > 100 else control_structure.structure_description or "")
-                ]
-
-                for item in items:
-                    item.setFlags(item.flags() & ~Qt.ItemIsEditable)
-
-                for col, item in enumerate(items):
-                    self.control_structures_table.setItem(row, col, item)
-                
-                # Store control structure ID for editing
-                self.control_structures_table.item(row, 0).setData(Qt.UserRole, control_structure.id)
-            
         except Exception as e:
             logger.error(f"Failed to load control structures: {str(e)}")
     
     def _load_controllers_for_system(self, system_id: int):
         """Load controllers for the selected system."""
         try:
-            db_manager = self.database_initializer.get_database_manager()
-            connection = db_manager.get_connection()
-            
-            controllers = connection.fetchall(
-                "SELECT * FROM controllers WHERE system_id = ? AND baseline = ? ORDER BY system_hierarchy",
-                (system_id, "Working")
+            connection = self._conn
+            
+            # Populate controllers table one page at a time
+            # Every row belongs to system_id, so its name is looked up once
+            system_name = self._get_system_name(system_id)
+            
+            def to_row(row):
+                return (
+                    row['id'],
+                    row['system_hierarchy'],
+                    row['controller_name'],
+                    system_name,
+                    row['controller_description'] or ""
+                )
+            
+            self._set_paged_rows(
+                self.controllers_table, connection, _SQL_LOAD_CONTROLLERS, (system_id, "Working"), to_row
             )
             
-            # Clear and populate controllers table
-            self.controllers_table.setRowCount(len(controllers))
-            
-            for row, controller_data in enumerate(controllers):
-                controller_dict = dict(controller_data)
-                controller = Controller(**controller_dict)
-                
-                items = [
-                    QTableWidgetItem(controller.get_hierarchical_id()),
-                    QTableWidgetItem(controller.controller_name),
-                    QTableWidgetItem(self._get_system_name(controller.system_id)),
-                    QTableWidgetItem(controller.controller_description[:100] + "..." if len(controller.controller_description or "") > 100 else controller.controller_description or "")
-                ]
-
-                for item in items:
-                    item.setFlags(item.flags() & ~Qt.ItemIsEditable)
-
-                for col, item in enumerate(items):
-                    self.controllers_table.setItem(row, col, item)
-                
-                # Store controller ID for editing
-                self.controllers_table.item(row, 0).setData(Qt.UserRole, controller.id)
-            
         except Exception as e:
             logger.error(f"Failed to load controllers: {str(e)}")
     
@@ -1829,28 +1211,19 @@ class MainWindow(QMainWindow):
     
     def _edit_requirement(self):
         """Edit selected requirement."""
-        current_row = self.requirements_table.currentRow()
+        current_row = self.requirements_table.currentIndex().row()
         if current_row < 0:
             return
         
-        requirement_id = self.requirements_table.item(current_row, 0).data(Qt.UserRole)
+        requirement_id = self.requirements_table.model().entity_id(current_row)
         if not requirement_id:
             return
         
         try:
-            # Get requirement from database
-            db_manager = self.database_initializer.get_database_manager()
-            connection = db_manager.get_connection()
+            # Get requirement and its owning system from database
+            requirement = self._load_entity_for_edit(Requirement, requirement_id)
             
-            requirement_data = connection.fetchone(
-                "SELECT * FROM requirements WHERE id = ?",
-                (requirement_id,)
-            )
-            
-            if requirement_data:
-                req_dict = dict(requirement_data)
-                requirement = Requirement(**req_dict)
-                
+            if requirement:
                 dialog = RequirementEditDialog(requirement, parent=self)
                 dialog.requirement_saved.connect(self._on_requirement_saved)
                 dialog.exec()
@@ -1861,30 +1234,11 @@ class MainWindow(QMainWindow):
     def _on_requirement_saved(self, requirement: Requirement):
         """Handle requirement saved event."""
         try:
-            # Save to database
-            db_manager = self.database_initializer.get_database_manager()
-            connection = db_manager.get_connection()
-            requirement_repo = EntityFactory.get_repository(connection, Requirement)
-            
-            if requirement.id is None:
-                # New requirement
-                new_id = requirement_repo.create(requirement)
-                if new_id:
-                    requirement.id = new_id
-                    logger.info(f"Created requirement: {requirement.alphanumeric_identifier}")
-                else:
-                    QMessageBox.critical(self, "Save Failed", "Failed to create requirement in database")
-                    return
-            else:
-                # Update existing requirement
-                if not requirement_repo.update(requirement):
-                    QMessageBox.critical(self, "Save Failed", "Failed to update requirement in database")
-                    return
-                logger.info(f"Updated requirement: {requirement.alphanumeric_identifier}")
-            
-            # Refresh the requirements table
-            if self.current_system_id:
-                self._load_requirements_for_system(self.current_system_id)
+            is_new = requirement.id is None
+            # Save and refresh its row in the requirements table in one transaction
+            if not self._save_entity(requirement, "requirement", partial(self._reload_row, "requirements", requirement)):
+                return
+            logger.info(f"{'Created' if is_new else 'Updated'} requirement: {requirement.alphanumeric_identifier}")
             
         except Exception as e:
             logger.error(f"Failed to save requirement: {str(e)}")
@@ -1892,79 +1246,40 @@ class MainWindow(QMainWindow):
     
     def _setup_menus(self):
         """Setup the application menus."""
-        # Create menu bar
-        menubar = self.menuBar()
-        
-        # File menu
-        file_menu = menubar.addMenu("File")
-        
-        # Export submenu
-        export_menu = file_menu.addMenu("Export")
-        
-        export_json_action = QAction("Export JSON", self)
-        export_json_action.triggered.connect(self._export_json)
-        export_menu.addAction(export_json_action)
-        
-        export_markdown_action = QAction("Export Markdown", self)
-        export_markdown_action.triggered.connect(self._export_markdown)
-        export_menu.addAction(export_markdown_action)
-        
-        export_archive_action = QAction("Export Archive", self)
-        export_archive_action.triggered.connect(self._export_archive)
-        export_menu.addAction(export_archive_action)
-        
-        file_menu.addSeparator()
-        
-        exit_action = QAction("Exit", self)
-        exit_action.triggered.connect(self.close)
-        file_menu.addAction(exit_action)
-        
-        # Baseline menu
-        baseline_menu = menubar.addMenu("Baseline")
-        
-        create_baseline_action = QAction("Create Baseline", self)
-        create_baseline_action.triggered.connect(self._create_baseline)
-        baseline_menu.addAction(create_baseline_action)
-        
-        manage_baselines_action = QAction("Manage Baselines", self)
-        manage_baselines_action.triggered.connect(self._manage_baselines)
-        baseline_menu.addAction(manage_baselines_action)
-        
-        # Collaboration menu
-        collaboration_menu = menubar.addMenu("Collaboration")
-        
-        create_branch_action = QAction("Create Branch", self)
-        create_branch_action.triggered.connect(self._create_branch)
-        collaboration_menu.addAction(create_branch_action)
-        
-        manage_branches_action = QAction("Manage Branches", self)
-        manage_branches_action.triggered.connect(self._manage_branches)
-        collaboration_menu.addAction(manage_branches_action)
-        
-        # Help menu
-        help_menu = menubar.addMenu("Help")
-        
-        about_action = QAction("About", self)
-        about_action.triggered.connect(self._show_about)
-        help_menu.addAction(about_action)
+        self._build_menu(self.menuBar(), self.MENU_SPEC)
     
     def _setup_toolbar(self):
         """Setup the application toolbar."""
-        # Create toolbar
         toolbar = self.addToolBar("Main Toolbar")
         toolbar.setMovable(False)
+        self._build_menu(toolbar, self.TOOLBAR_SPEC)
+    
+    def _build_menu(self, parent, spec: tuple):
+        """
+        Build menus, submenus and actions from a declarative spec.
         
-        # Add system button
-        add_system_action = QAction("Add System", self)
-        add_system_action.triggered.connect(self._add_root_system)
-        toolbar.addAction(add_system_action)
-        
-        toolbar.addSeparator()
+        Each entry is None for a separator, (title, entries) for a submenu, or
+        (text, handler_name) for an action. Actions are created once and kept
+        in _actions by their text.
         
-        # Refresh button
-        refresh_action = QAction("Refresh", self)
-        refresh_action.triggered.connect(self._refresh_all)
-        toolbar.addAction(refresh_action)
+        Args:
+            parent: Menu bar, menu or toolbar to add to
+            spec: Tuple of spec entries
+        """
+        for entry in spec:
+            if entry is None:
+                parent.addSeparator()
+                continue
+            
+            text, target = entry
+            if isinstance(target, tuple):
+                self._build_menu(parent.addMenu(text), target)
+                continue
+            
+            action = QAction(text, self)
+            action.triggered.connect(getattr(self, target))
+            parent.addAction(action)
+            self._actions[text] = action
     
     def _setup_status_bar(self):
         """Setup the application status bar."""
@@ -1998,7 +1313,8 @@ class MainWindow(QMainWindow):
             QMessageBox.warning(self, "No System Selected", "Please select a system first.")
             return
         
-        dialog = JsonExportDialog(self.current_system_id, parent=self)
+        dialog = self._cached_dialog(JsonExportDialog, db_connection=self._conn)
+        dialog.set_system_id(self.current_system_id)
         dialog.exec()
     
     def _export_markdown(self):
@@ -2007,7 +1323,8 @@ class MainWindow(QMainWindow):
             QMessageBox.warning(self, "No System Selected", "Please select a system first.")
             return
         
-        dialog = MarkdownExportDialog(self.current_system_id, parent=self)
+        dialog = self._cached_dialog(MarkdownExportDialog, db_connection=self._conn)
+        dialog.set_system_id(self.current_system_id)
         dialog.exec()
     
     def _export_archive(self):
@@ -2016,7 +1333,9 @@ class MainWindow(QMainWindow):
             QMessageBox.warning(self, "No System Selected", "Please select a system first.")
             return
         
-        dialog = ArchiveExportDialog(self.current_system_id, parent=self)
+        working_dir = self.config_manager.working_directory
+        dialog = self._cached_dialog(ArchiveExportDialog)
+        dialog.set_working_directory(str(working_dir) if working_dir else None)
         dialog.exec()
     
     def _create_baseline(self):
@@ -2025,8 +1344,10 @@ class MainWindow(QMainWindow):
             QMessageBox.warning(self, "Baseline Manager Not Available", "Baseline management is not available.")
             return
         
-        dialog = BaselineCreationDialog(self.baseline_manager, parent=self)
+        dialog = self._cached_dialog(BaselineCreationDialog, baseline_manager=self.baseline_manager)
         dialog.exec()
+        self._dirty_tabs.update(self._tab_built)
+        self._clear_row_caches()
     
     def _manage_baselines(self):
         """Manage existing baselines."""
@@ -2034,8 +1355,10 @@ class MainWindow(QMainWindow):
             QMessageBox.warning(self, "Baseline Manager Not Available", "Baseline management is not available.")
             return
         
-        dialog = BaselineManagementDialog(self.baseline_manager, parent=self)
+        dialog = self._cached_dialog(BaselineManagementDialog, baseline_manager=self.baseline_manager)
         dialog.exec()
+        self._dirty_tabs.update(self._tab_built)
+        self._clear_row_caches()
     
     def _create_branch(self):
         """Create a new branch."""
@@ -2043,8 +1366,12 @@ class MainWindow(QMainWindow):
             QMessageBox.warning(self, "Branch Manager Not Available", "Branch management is not available.")
             return
         
-        dialog = BranchCreationDialog(self.branch_manager, parent=self)
+        dialog = self._cached_dialog(
+            BranchCreationDialog, branch_manager=self.branch_manager, db_connection=self._conn
+        )
         dialog.exec()
+        self._dirty_tabs.update(self._tab_built)
+        self._clear_row_caches()
     
     def _manage_branches(self):
         """Manage existing branches."""
@@ -2052,8 +1379,34 @@ class MainWindow(QMainWindow):
             QMessageBox.warning(self, "Branch Manager Not Available", "Branch management is not available.")
             return
         
-        dialog = BranchManagementDialog(self.branch_manager, parent=self)
+        dialog = self._cached_dialog(
+            BranchManagementDialog, branch_manager=self.branch_manager, merge_manager=self.merge_manager
+        )
         dialog.exec()
+        self._dirty_tabs.update(self._tab_built)
+        self._clear_row_caches()
+    
+    def _cached_dialog(self, dialog_class, **kwargs) -> QDialog:
+        """
+        Get the window's dialog of a class, creating it on first use.
+        
+        A reused dialog is reset so it opens as a new one would, without
+        rebuilding its widgets.
+        
+        Args:
+            dialog_class: Dialog class
+            **kwargs: Constructor arguments used when the dialog is created
+            
+        Returns:
+            Dialog instance
+        """
+        dialog = self._dialogs.get(dialog_class)
+        if dialog is None:
+            dialog = dialog_class(parent=self, **kwargs)
+            self._dialogs[dialog_class] = dialog
+        else:
+            dialog.reset()
+        return dialog
     
     def _show_about(self):
         """Show about dialog."""
@@ -2072,30 +1425,15 @@ class MainWindow(QMainWindow):
     def _on_system_saved(self, system: System):
         """Handle system saved event."""
         try:
-            # Save to database
-            db_manager = self.database_initializer.get_database_manager()
-            connection = db_manager.get_connection()
-            system_repo = EntityFactory.get_repository(connection, System)
-            
-            if system.id is None:
-                # New system
-                new_id = system_repo.create(system)
-                if new_id:
-                    system.id = new_id
-                    logger.info(f"Created system: {system.system_name}")
-                else:
-                    QMessageBox.critical(self, "Save Failed", "Failed to create system in database")
-                    return
-            else:
-                # Update existing system
-                if not system_repo.update(system):
-                    QMessageBox.critical(self, "Save Failed", "Failed to update system in database")
-                    return
-                logger.info(f"Updated system: {system.system_name}")
-            
-            # Refresh the hierarchy tree
-            if self.hierarchy_tree:
-                self.hierarchy_tree.refresh_from_database()
+            is_new = system.id is None
+            # Save and refresh the hierarchy tree in one transaction
+            reload = self.hierarchy_tree.refresh_from_database if self.hierarchy_tree else None
+            if not self._save_entity(system, "system", reload):
+                return
+            logger.info(f"{'Created' if is_new else 'Updated'} system: {system.system_name}")
+            self._system_summary_cache.pop(system.id, None)
+            self._dirty_tabs.update(self.SYSTEM_NAME_TABS)
+            self._clear_first_pages()
             
         except Exception as e:
             logger.error(f"Failed to save system: {str(e)}")
@@ -2103,88 +1441,490 @@ class MainWindow(QMainWindow):
     
     def _refresh_all(self):
         """Refresh all data."""
+        # Keep actions from re-entering while the refresh runs
+        for action in self._actions.values():
+            action.setEnabled(False)
+        
         try:
+            self._system_summary_cache.clear()
+            self._clear_row_caches()
+            
             # Refresh hierarchy tree
             if self.hierarchy_tree:
                 self.hierarchy_tree.refresh_from_database()
             
-            # Refresh current system data if selected
+            # Reload only the current system's tabs that may be stale, off the
+            # GUI thread and hidden ones on activation; saves and deletes
+            # already keep their own rows up to date
             if self.current_system_id:
-                self._on_system_selected(self.current_system_id)
+                self._load_visible_tab(self._dirty_tabs & self._tab_built)
+            self._dirty_tabs.clear()
             
             self.status_bar.showMessage("Data refreshed", 3000)
             
         except Exception as e:
             logger.error(f"Failed to refresh data: {str(e)}")
             self.status_bar.showMessage("Failed to refresh data", 3000)
+        finally:
+            for action in self._actions.values():
+                action.setEnabled(True)
+    
+    def _set_paged_rows(self, table: QTableView, connection, statements: tuple,
+                        params: tuple, to_row):
+        """
+        Page an entity query into a table, ordered by hierarchical ID.
+        
+        First pages of recently loaded or prefetched queries are taken from
+        the first-page cache without querying. Under _prefetch_neighbors
+        the first page is only read into that cache.
+        
+        The row count and first page are read by a LoadRowsTask on the thread
+        pool and handed to the model when they arrive; the model fetches
+        further pages with LIMIT/OFFSET as the table is scrolled. Under
+        _load_tabs the task joins the batch instead of starting on its own.
+        Inside an open transaction the first page is read here instead, so
+        it sees the transaction's own writes.
+        
+        Args:
+            table: Entity table view
+            connection: Database connection
+            statements: (count, page, single-row) SQL from _paged_sql
+            params: Parameters for the WHERE clause
+            to_row: Callable turning a database row into a row tuple
+        """
+        count_sql, page_sql, row_sql = statements
+        cache_key = (count_sql, params)
+        
+        def fetch_page(offset: int, limit: int) -> list:
+            return [to_row(row) for row in connection.iterate(page_sql, params + (limit, offset))]
+        
+        def load_first_page() -> tuple:
+            total = connection.fetchone(count_sql, params)[0]
+            return total, fetch_page(0, TABLE_PAGE_SIZE) if total else []
+        
+        if self._prefetch_keys is not None:
+            # Only warm the first-page cache; the table is left alone
+            if cache_key not in self._first_pages and cache_key not in self._prefetch_keys:
+                self._prefetch_keys.add(cache_key)
+                task = LoadRowsTask(load_first_page)
+                task.signals.rows_ready.connect(
+                    partial(self._cache_first_page, self._first_pages_generation, cache_key)
+                )
+                self._batched_loads.append(task)
+            return
+        
+        self._row_sources[table] = (row_sql, params, to_row)
+        
+        if connection.in_transaction:
+            # Supersede any load still running for this table
+            self._row_loads.pop(table, None)
+            table.model().set_source(fetch_page, *load_first_page())
+            return
+        
+        cached = self._first_pages.get(cache_key)
+        if cached is not None:
+            self._row_loads.pop(table, None)
+            self._first_pages.move_to_end(cache_key)
+            total, rows = cached
+            # The model extends its row list as it pages, so it gets a copy
+            table.model().set_source(fetch_page, total, list(rows))
+            return
+        
+        task = LoadRowsTask(load_first_page)
+        self._row_loads[table] = task
+        task.signals.rows_ready.connect(
+            partial(self._on_rows_loaded, table, task, fetch_page, self._first_pages_generation, cache_key)
+        )
+        task.signals.load_failed.connect(partial(self._on_rows_load_failed, table, task))
+        if self._batched_loads is not None:
+            self._batched_loads.append(task)
+        else:
+            QThreadPool.globalInstance().start(task)
+    
+    def _on_rows_loaded(self, table: QTableView, task: LoadRowsTask, fetch_page,
+                        generation: int, cache_key: tuple, total: int, rows: list):
+        """
+        Hand a finished first-page load to its table's model.
+        
+        Results of a load superseded by a newer one for the same table are
+        dropped.
+        
+        Args:
+            table: Entity table view
+            task: Task that produced the rows
+            fetch_page: Page fetcher for the model's later pages
+            generation: First-page cache generation when the load started
+            cache_key: First-page cache key of the query
+            total: Total row count
+            rows: First page of row tuples
+        """
+        if self._row_loads.get(table) is not task:
+            return
+        del self._row_loads[table]
+        self._cache_first_page(generation, cache_key, total, rows)
+        table.model().set_source(fetch_page, total, list(rows))
+    
+    def _cache_first_page(self, generation: int, cache_key: tuple, total: int, rows: list):
+        """
+        Keep a query's first page for later selections of its system.
+        
+        Pages read before the cache was last cleared are dropped, since a
+        save or delete may have happened after they were read.
+        
+        Args:
+            generation: First-page cache generation when the load started
+            cache_key: (count SQL, parameters) of the query
+            total: Total row count
+            rows: First page of row tuples
+        """
+        if generation != self._first_pages_generation:
+            return
+        self._first_pages[cache_key] = (total, rows)
+        self._first_pages.move_to_end(cache_key)
+        if len(self._first_pages) > TABLE_PREFETCH_CACHE_SIZE:
+            self._first_pages.popitem(last=False)
+    
+    def _prefetch_neighbors(self, system_id: int):
+        """
+        Read first pages for a system's hidden tabs and its neighbors in the background.
+        
+        The selected system's pending tabs come first, then the built tabs of
+        up to TABLE_PREFETCH_NEIGHBORS of its parent, nearest siblings and
+        children, the likeliest next selections.
+        The pages go to the first-page cache on one low-priority worker.
+        
+        Args:
+            system_id: Selected system ID
+        """
+        if not self.hierarchy_tree or not self._tab_built:
+            return
+        
+        targets = [(system_id, self._pending_tabs)]
+        targets += [(neighbor_id, self._tab_built)
+                    for neighbor_id in self.hierarchy_tree.get_neighbor_system_ids(
+                        system_id, TABLE_PREFETCH_NEIGHBORS)]
+        
+        self._prefetch_keys = set()
+        self._batched_loads = []
+        try:
+            for target_id, keys in targets:
+                for key in keys:
+                    loader = getattr(self, f"_load_{key}_for_system", None)
+                    if loader:
+                        loader(target_id)
+        finally:
+            tasks, self._batched_loads = self._batched_loads, None
+            self._prefetch_keys = None
+        
+        if tasks:
+            QThreadPool.globalInstance().start(LoadRowsBatchTask(tasks), -1)
+    
+    def _clear_first_pages(self):
+        """Drop cached first pages, including those still being read."""
+        self._first_pages.clear()
+        self._first_pages_generation += 1
+    
+    def _clear_row_caches(self):
+        """Drop cached entities and first pages after rows may have changed."""
+        self._entity_cache.clear()
+        self._clear_first_pages()
+    
+    def _forget_entity(self, entity_class, entity_id: int):
+        """
+        Drop a deleted entity from the edit cache and the cached first pages.
+        
+        Args:
+            entity_class: Entity class
+            entity_id: Entity ID
+        """
+        self._entity_cache.pop((entity_class, entity_id), None)
+        self._clear_first_pages()
+    
+    def _on_rows_load_failed(self, table: QTableView, task: LoadRowsTask, message: str):
+        """Forget a failed first-page load and report it in the status bar."""
+        if self._row_loads.get(table) is not task:
+            return
+        del self._row_loads[table]
+        self.status_bar.showMessage(f"Failed to load table: {message}", 5000)
+    
+    def _reload_row(self, key: str, entity):
+        """
+        Refresh a saved entity's row in its tab instead of reloading the table.
+        
+        The row is re-read with the tab's own query and row builder, so it
+        matches what a full load would show. The whole tab is reloaded only
+        when the model cannot place the row without moving others.
+        
+        Args:
+            key: Tab key (e.g. "functions")
+            entity: Saved entity with its assigned ID
+        """
+        # Tabs not built or still pending load the saved row with the rest
+        if key not in self._tab_built or key in self._pending_tabs:
+            return
+        
+        table = getattr(self, f"{key}_table")
+        source = self._row_sources.get(table)
+        # A load still running may have read the table before this save
+        if source is not None and table not in self._row_loads:
+            row_sql, params, to_row = source
+            row = self._conn.fetchone(row_sql, params + (entity.id,))
+            if row is not None and table.model().update_row(to_row(row)):
+                return
+        
+        getattr(self, f"_load_{key}_for_system")(self.current_system_id or 0)
+    
+    def _restore_row(self, table: QTableView, row: int, values: tuple):
+        """
+        Put back a row removed before a failed delete and reselect it.
+        
+        Args:
+            table: Entity table view
+            row: Row number the values were removed from
+            values: Removed row tuple
+        """
+        table.model().insert_row(row, values)
+        table.selectRow(row)
+    
+    def _schedule_buttons_state(self, table: QAbstractItemView, buttons: tuple):
+        """
+        Queue a button-state update for a table.
+        
+        Selection changes arrive once per row during range selections; they are
+        coalesced so the buttons are updated once per event loop turn.
+        
+        Args:
+            table: Table whose selection changed
+            buttons: Buttons enabled only while the table has a selection
+        """
+        if not self._pending_buttons_state:
+            QTimer.singleShot(0, self._apply_buttons_state)
+        self._pending_buttons_state[table] = buttons
+    
+    def _apply_buttons_state(self):
+        """Enable/disable queued buttons based on their table's selection."""
+        pending = self._pending_buttons_state
+        self._pending_buttons_state = {}
+        
+        for table, buttons in pending.items():
+            has_selection = table.selectionModel().hasSelection()
+            for button in buttons:
+                button.setEnabled(has_selection)
+    
+    def _load_entity_for_edit(self, entity_class, entity_id: int):
+        """
+        Load an entity for its edit dialog with a single query.
+        
+        The owning system is fetched in the same statement and shown in the
+        status bar while the dialog is open. Entities opened before are
+        taken from the edit cache without querying.
+        
+        Args:
+            entity_class: Entity class to load
+            entity_id: Entity ID
+            
+        Returns:
+            Entity instance or None if not found
+        """
+        key = (entity_class, entity_id)
+        result = self._entity_cache.get(key)
+        if result is None:
+            connection = self._conn
+            repo = EntityFactory.get_repository(connection, entity_class)
+            
+            result = repo.get_by_id_with_related(entity_id)
+            if not result:
+                return None
+            self._entity_cache[key] = result
+        
+        entity, related = result
+        if related.get('system_name'):
+            self.status_bar.showMessage(
+                f"Editing {entity.get_hierarchical_id()} in {related['system_hierarchy']} {related['system_name']}",
+                5000
+            )
+        return entity
     
     def _show_error(self, title: str, message: str):
         """Show error message dialog."""
         QMessageBox.critical(self, title, message)
     
+    def _save_entity(self, entity, label: str, reload=None) -> bool:
+        """
+        Save an entity with a single upsert and record its assigned ID.
+        
+        Only the upsert runs in the transaction; the ID is recorded and the
+        view reloaded once it has committed, so a failing reload cannot roll
+        back a good save and no Qt work runs under the write lock.
+        
+        Args:
+            entity: Entity emitted by an edit dialog
+            label: Human-readable entity type for error messages
+            reload: Callable refreshing the affected view after a successful save
+            
+        Returns:
+            True if the entity was saved
+        """
+        connection = self._conn
+        repo = EntityFactory.get_repository(connection, type(entity))
+        
+        action = "create" if entity.id is None else "update"
+        # Edit dialogs change the cached entity in place before emitting it,
+        # so it is dropped unless the save commits
+        cache_key = (type(entity), entity.id)
+        new_id = None
+        try:
+            with connection.transaction():
+                saved_id = repo.upsert(entity)
+            # Set only once the transaction has committed
+            new_id = saved_id
+        finally:
+            if not new_id:
+                self._entity_cache.pop(cache_key, None)
+            self._clear_first_pages()
+        
+        # Report failures once the transaction is closed
+        if not new_id:
+            QMessageBox.critical(self, "Save Failed", f"Failed to {action} {label} in database")
+            return False
+        
+        entity.id = new_id
+        if reload:
+            reload()
+        
+        return True
+    
+    def _delete_entity(self, table: QTableView, entity_class, label: str) -> bool:
+        """
+        Delete the entity selected in a table after the user confirms.
+        
+        The row is removed from the view up front and put back if the delete
+        fails, so the table does not wait on the database.
+        
+        Args:
+            table: Entity table view
+            entity_class: Entity class shown in the table
+            label: Human-readable entity type for messages
+            
+        Returns:
+            True if the entity was deleted
+        """
+        current_row = table.currentIndex().row()
+        if current_row < 0:
+            return False
+        
+        model = table.model()
+        entity_id = model.entity_id(current_row)
+        entity_name = model.index(current_row, 1).data()
+        
+        reply = QMessageBox.question(
+            self,
+            f"Delete {label.title()}",
+            f"Are you sure you want to delete {label} '{entity_name}'?",
+            QMessageBox.Yes | QMessageBox.No,
+            QMessageBox.No
+        )
+        if reply != QMessageBox.Yes:
+            return False
+        
+        # Remove the row up front and put it back if the delete fails
+        removed_row = model.take_row(current_row)
+        try:
+            repo = EntityFactory.get_repository(self._conn, entity_class)
+            if repo.delete(entity_id):
+                logger.info(f"Deleted {label}: {entity_name} (ID: {entity_id})")
+                self._forget_entity(entity_class, entity_id)
+                return True
+            self._restore_row(table, current_row, removed_row)
+            self._show_error("Delete Failed", f"Failed to delete {label} from database.")
+        except Exception as e:
+            self._restore_row(table, current_row, removed_row)
+            logger.error(f"Failed to delete {label}: {str(e)}")
+            self._show_error("Delete Failed", str(e))
+        return False
+    
+    def _get_system_summary(self, system_id: int) -> Optional[tuple]:
+        """
+        Get a working system's name and description, querying only on first use.
+        
+        Args:
+            system_id: System ID
+            
+        Returns:
+            Tuple of (name, description), or None if there is no such system
+        """
+        if system_id in self._system_summary_cache:
+            return self._system_summary_cache[system_id]
+        
+        row = self._conn.fetchone(_SQL_GET_SYSTEM_SUMMARY, (system_id, WORKING_BASELINE))
+        summary = (row['system_name'], row['system_description']) if row else None
+        if summary:
+            self._system_summary_cache[system_id] = summary
+        return summary
+    
     def _get_system_name(self, system_id: int) -> str:
         """Get system name by ID."""
         try:
             if not self.database_initializer:
                 return "Unknown"
             
-            db_manager = self.database_initializer.get_database_manager()
-            connection = db_manager.get_connection()
-            
-            system_data = connection.fetchone(
-                "SELECT system_name FROM systems WHERE id = ?",
-                (system_id,)
-            )
-            
-            if system_data:
-                return system_data['system_name']
-            else:
-                return "Unknown"
+            summary = self._get_system_summary(system_id)
+            return summary[0] if summary else "Unknown"
                 
         except Exception as e:
             logger.error(f"Failed to get system name: {str(e)}")
             return "Unknown"
     
+    def _schedule_system_selection(self, system_id: int):
+        """Remember the latest tree selection and (re)start the selection timer."""
+        self._pending_system_id = system_id
+        self._selection_timer.start()
+    
+    def _apply_system_selection(self):
+        """Load the system selected last once the tree selection settles."""
+        self._on_system_selected(self._pending_system_id)
+    
     def _on_system_selected(self, system_id: int):
         """Handle system selection from hierarchy tree."""
+        # The tables already show this system and nothing has gone stale
+        if system_id == self.current_system_id and not self._dirty_tabs:
+            return
+        
         try:
             self.current_system_id = system_id
             
-            # Update breadcrumb
+            # Update breadcrumb from the two columns it shows, without
+            # building a System entity
             if self.database_initializer:
-                db_manager = self.database_initializer.get_database_manager()
-                connection = db_manager.get_connection()
-                system_repo = EntityFactory.get_repository(connection, System)
-                system = system_repo.get_by_id(system_id)
+                system = self._get_system_summary(system_id)
                 
                 if system:
-                    self._update_breadcrumb(system)
+                    self._update_breadcrumb(*system)
                     self._enable_system_buttons()
                     
-                    # Load data for all tabs
-                    self._load_functions_for_system(system_id)
-                    self._load_requirements_for_system(system_id)
-                    self._load_interfaces_for_system(system_id)
-                    self._load_assets_for_system(system_id)
-                    self._load_hazards_for_system(system_id)
-                    self._load_losses_for_system(system_id)
-                    self._load_control_structures_for_system(system_id)
-                    self._load_controllers_for_system(system_id)
+                    # Load the visible tab; other built tabs load on activation
+                    # and unbuilt ones when first built
+                    self._dirty_tabs.clear()
+                    self._load_visible_tab(self._tab_built)
+                    self._prefetch_neighbors(system_id)
                     
         except Exception as e:
             logger.error(f"Failed to handle system selection: {str(e)}")
     
     def _on_system_changed(self):
         """Handle system change notification."""
+        self._system_summary_cache.clear()
+        self._dirty_tabs.update(self.SYSTEM_NAME_TABS)
+        self._clear_first_pages()
         if self.hierarchy_tree:
             self.hierarchy_tree.refresh_from_database()
     
-    def _update_breadcrumb(self, system: System):
+    def _update_breadcrumb(self, system_name: Optional[str], system_description: Optional[str] = None):
         """Update the breadcrumb with system information."""
-        if system:
-            breadcrumb_text = f"System: {system.system_name}"
-            if system.system_description:
-                breadcrumb_text += f" - {system.system_description[:50]}..."
+        if system_name is not None:
+            breadcrumb_text = f"System: {system_name}"
+            if system_description:
+                breadcrumb_text += f" - {system_description[:50]}..."
             self.breadcrumb_label.setText(breadcrumb_text)
         else:
             self.breadcrumb_label.setText("No system selected")
@@ -2194,13 +1934,12 @@ class MainWindow(QMainWindow):
         self.edit_system_btn.setEnabled(True)
         self.add_child_system_btn.setEnabled(True)
         
-        # Enable add buttons for all entity types
-        self.add_function_btn.setEnabled(True)
-        self.add_requirement_btn.setEnabled(True)
-        self.add_interface_btn.setEnabled(True)
-        self.add_asset_btn.setEnabled(True)
-        self.add_control_structure_btn.setEnabled(True)
-        self.add_controller_btn.setEnabled(True)
+        # Enable add buttons for the entity tabs built so far
+        for name in ("function", "requirement", "interface", "asset",
+                     "control_structure", "controller"):
+            add_button = getattr(self, f"add_{name}_btn", None)
+            if add_button:
+                add_button.setEnabled(True)
     
     def _add_child_system(self):
         """Add a child system to the currently selected system."""
@@ -2215,37 +1954,22 @@ class MainWindow(QMainWindow):
     def _load_functions_for_system(self, system_id: int):
         """Load functions for the selected system."""
         try:
-            db_manager = self.database_initializer.get_database_manager()
-            connection = db_manager.get_connection()
-            
-            functions = connection.fetchall(
-                "SELECT * FROM functions WHERE system_id = ? AND baseline = ? ORDER BY system_hierarchy",
-                (system_id, "Working")
+            connection = self._conn
+            
+            # Populate functions table one page at a time
+            def to_row(row):
+                return (
+                    row['id'],
+                    row['system_hierarchy'],
+                    row['function_name'],
+                    row['function_description'] or "",
+                    row['criticality'] or "Medium"
+                )
+            
+            self._set_paged_rows(
+                self.functions_table, connection, _SQL_LOAD_FUNCTIONS, (system_id, "Working"), to_row
             )
             
-            # Clear and populate functions table
-            self.functions_table.setRowCount(len(functions))
-            
-            for row, func_data in enumerate(functions):
-                func_dict = dict(func_data)
-                function = Function(**func_dict)
-                
-                items = [
-                    QTableWidgetItem(function.get_hierarchical_id()),
-                    QTableWidgetItem(function.function_name),
-                    QTableWidgetItem(function.function_description[:100] + "..." if len(function.function_description or "") > 100 else function.function_description or ""),
-                    QTableWidgetItem(function.criticality or "Medium")
-                ]
-
-                for item in items:
-                    item.setFlags(item.flags() & ~Qt.ItemIsEditable)
-
-                for col, item in enumerate(items):
-                    self.functions_table.setItem(row, col, item)
-                
-                # Store function ID for editing
-                self.functions_table.item(row, 0).setData(Qt.UserRole, function.id)
-            
         except Exception as e:
             logger.error(f"Failed to load functions: {str(e)}")
     
@@ -0,0 +1,287 @@
+"""
+Table models for STPA Tool
+Provides read-only Qt item models backing the entity tables, and the
+background task that loads their rows.
+"""
+
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from PySide6.QtCore import Qt, QAbstractTableModel, QModelIndex, QObject, QRunnable, Signal
+
+from ..config.constants import TABLE_PAGE_SIZE, TABLE_TEXT_PREVIEW_LENGTH
+from ..log_config.config import get_logger
+
+logger = get_logger(__name__)
+
+
+class EntityTableModel(QAbstractTableModel):
+    """
+    Read-only table model holding one tuple per entity.
+    
+    Each row is stored as (entity_id, column_0, column_1, ...), so the entity ID
+    lives alongside the displayed values instead of in a per-cell data role.
+    
+    Rows can be given all at once with set_rows, or paged in with set_source,
+    in which case further pages are fetched as the view scrolls to them.
+    
+    Long text in the elided column is stored whole and only shortened when a
+    cell is displayed, so rows that are never shown cost no string work.
+    
+    Rows are expected in ascending order of their first column (the
+    hierarchical ID), which update_row relies on to place a saved entity.
+    """
+    
+    _FLAGS = Qt.ItemIsSelectable | Qt.ItemIsEnabled
+    
+    def __init__(self, headers: Sequence[str], parent=None, elided_column: Optional[int] = None):
+        """
+        Initialize entity table model.
+        
+        Args:
+            headers: Column headers
+            parent: Parent object
+            elided_column: Column whose text is shortened for display
+        """
+        super().__init__(parent)
+        self._headers = tuple(headers)
+        self._elided_column = elided_column
+        self._rows: List[tuple] = []
+        self._fetch_page: Optional[Callable[[int, int], List[tuple]]] = None
+        self._total = 0
+        self._row_by_id: Optional[Dict[int, int]] = None
+    
+    def set_rows(self, rows: List[tuple]):
+        """
+        Replace all rows.
+        
+        Args:
+            rows: Row tuples of (entity_id, column values...)
+        """
+        self.beginResetModel()
+        self._rows = rows
+        self._fetch_page = None
+        self._total = len(rows)
+        self._row_by_id = None
+        self.endResetModel()
+    
+    def set_source(self, fetch_page: Callable[[int, int], List[tuple]], total: int,
+                   first_page: Optional[List[tuple]] = None):
+        """
+        Replace all rows with a paged source and load its first page.
+        
+        Args:
+            fetch_page: Callable taking (offset, limit) and returning row tuples
+            total: Total number of rows the source can return
+            first_page: First page if already fetched, e.g. by a LoadRowsTask
+        """
+        if first_page is None:
+            first_page = fetch_page(0, TABLE_PAGE_SIZE) if total else []
+        
+        self.beginResetModel()
+        self._fetch_page = fetch_page
+        self._total = total
+        self._rows = first_page
+        self._row_by_id = None
+        self.endResetModel()
+    
+    def canFetchMore(self, parent: QModelIndex = QModelIndex()) -> bool:
+        """Check whether the paged source has rows not loaded yet."""
+        if parent.isValid() or self._fetch_page is None:
+            return False
+        return len(self._rows) < self._total
+    
+    def fetchMore(self, parent: QModelIndex = QModelIndex()):
+        """Load the next page from the paged source."""
+        if not self.canFetchMore(parent):
+            return
+        
+        page = self._fetch_page(len(self._rows), TABLE_PAGE_SIZE)
+        if not page:
+            # Rows were removed since the total was counted
+            self._total = len(self._rows)
+            return
+        
+        first = len(self._rows)
+        self.beginInsertRows(QModelIndex(), first, first + len(page) - 1)
+        self._rows.extend(page)
+        if self._row_by_id is not None:
+            for row, values in enumerate(page, first):
+                self._row_by_id[values[0]] = row
+        self.endInsertRows()
+    
+    def take_row(self, row: int) -> tuple:
+        """
+        Remove a row and return it.
+        
+        Args:
+            row: Row number
+            
+        Returns:
+            The removed row tuple
+        """
+        self.beginRemoveRows(QModelIndex(), row, row)
+        removed = self._rows.pop(row)
+        self._total -= 1
+        self._row_by_id = None
+        self.endRemoveRows()
+        return removed
+    
+    def insert_row(self, row: int, values: tuple):
+        """
+        Insert a row tuple.
+        
+        Args:
+            row: Row number to insert at
+            values: Row tuple of (entity_id, column values...)
+        """
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._rows.insert(row, values)
+        self._total += 1
+        self._row_by_id = None
+        self.endInsertRows()
+    
+    def update_row(self, values: tuple) -> bool:
+        """
+        Apply a saved entity's row without reloading the table.
+        
+        A loaded row with the same entity ID is replaced in place. A new row
+        sorting after every loaded row is appended, or just counted if the
+        paged source has rows not loaded yet, since it then lands on a later
+        page. Anything else would move rows, so it is left to a full reload.
+        
+        Args:
+            values: Row tuple of (entity_id, column values...)
+            
+        Returns:
+            True if the model now reflects the row, False if a reload is needed
+        """
+        if self._row_by_id is None:
+            self._row_by_id = {existing[0]: row for row, existing in enumerate(self._rows)}
+        
+        row = self._row_by_id.get(values[0])
+        if row is not None:
+            if self._rows[row][1] != values[1]:
+                # The ordering key changed, so the row may need to move
+                return False
+            self._rows[row] = values
+            self.dataChanged.emit(self.index(row, 0), self.index(row, len(self._headers) - 1))
+            return True
+        
+        if self._rows and (values[1] or "") <= (self._rows[-1][1] or ""):
+            return False
+        
+        if self.canFetchMore():
+            self._total += 1
+            return True
+        
+        row = len(self._rows)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._rows.append(values)
+        self._total += 1
+        self._row_by_id[values[0]] = row
+        self.endInsertRows()
+        return True
+    
+    def entity_id(self, row: int) -> Optional[int]:
+        """
+        Get the entity ID stored for a row.
+        
+        Args:
+            row: Row number
+        
+        Returns:
+            Entity ID or None if the row does not exist
+        """
+        if 0 <= row < len(self._rows):
+            return self._rows[row][0]
+        return None
+    
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        """Get number of rows."""
+        return 0 if parent.isValid() else len(self._rows)
+    
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        """Get number of columns."""
+        return 0 if parent.isValid() else len(self._headers)
+    
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole) -> Any:
+        """Get display data for a cell."""
+        if role == Qt.DisplayRole and index.isValid():
+            value = self._rows[index.row()][index.column() + 1]
+            if index.column() == self._elided_column and len(value) > TABLE_TEXT_PREVIEW_LENGTH:
+                return value[:TABLE_TEXT_PREVIEW_LENGTH] + "..."
+            return value
+        return None
+    
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.DisplayRole) -> Any:
+        """Get header text."""
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self._headers[section]
+        return None
+    
+    def flags(self, index: QModelIndex) -> Qt.ItemFlags:
+        """Cells are selectable but not editable."""
+        return self._FLAGS
+
+
+class LoadRowsSignals(QObject):
+    """Signals of a LoadRowsTask, delivered on the thread that created it."""
+    rows_ready = Signal(int, list)  # Total row count, first page of row tuples
+    load_failed = Signal(str)       # Error message
+
+
+class LoadRowsTask(QRunnable):
+    """
+    Run a table's first-page query on a QThreadPool thread.
+    
+    DatabaseConnection hands each thread its own SQLite connection, and WAL
+    lets it read while the GUI thread's connection is in use. The load
+    callable must only touch the database and its own locals; the results
+    are handed back to the GUI thread through signals.
+    """
+    
+    def __init__(self, load: Callable[[], Tuple[int, List[tuple]]]):
+        """
+        Initialize load task.
+        
+        Args:
+            load: Callable returning (total row count, first page of row tuples)
+        """
+        super().__init__()
+        self._load = load
+        self.signals = LoadRowsSignals()
+    
+    def run(self):
+        """Run the load and emit its result."""
+        try:
+            total, rows = self._load()
+        except Exception as e:
+            logger.error(f"Failed to load table rows: {str(e)}")
+            self.signals.load_failed.emit(str(e))
+            return
+        self.signals.rows_ready.emit(total, rows)
+
+
+class LoadRowsBatchTask(QRunnable):
+    """
+    Run several LoadRowsTasks one after another on a single pool thread.
+    
+    Loading every tab of a newly selected system this way uses one worker
+    and its one SQLite connection instead of a thread per table. Each task
+    still emits its own signals, so tables fill in as their rows arrive.
+    """
+    
+    def __init__(self, tasks: List[LoadRowsTask]):
+        """
+        Initialize batch task.
+        
+        Args:
+            tasks: Load tasks to run in order
+        """
+        super().__init__()
+        self._tasks = tasks
+    
+    def run(self):
+        """Run each load task in turn."""
+        for task in self._tasks:
+            task.run()
@@ -3,34 +3,62 @@ Warnings tab widget for displaying validation issues.
 Implements the warnings tab as specified in the SRS.
 """
 
-from PySide6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QTableWidget, 
-                               QTableWidgetItem, QHeaderView, QPushButton, QLabel,
+from PySide6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QTableView,
+                               QHeaderView, QPushButton, QLabel,
                                QComboBox, QProgressBar, QTextEdit, QSplitter,
                                QGroupBox, QGridLayout, QFrame)
-from PySide6.QtCore import Qt, QTimer, Signal, QThread, pyqtSignal
-from PySide6.QtGui import QIcon, QPixmap, QPainter, QColor
+from PySide6.QtCore import (Qt, QTimer, Signal, QThread, QAbstractTableModel,
+                            QModelIndex, QRegularExpression, QSortFilterProxyModel)
+from PySide6.QtGui import QIcon, QPixmap, QPainter, QColor, QBrush
 from typing import List, Optional, Dict, Any
 import logging
 
+from ..config.constants import VALIDATION_ISSUE_BATCH_SIZE
 from ..validation.engine import ValidationEngine, ValidationIssue, ValidationSeverity
 from ..database.connection import DatabaseConnection
 
 
 logger = logging.getLogger(__name__)
 
+# Severity labels, cell backgrounds and detail label styles, built once
+_SEVERITY_LABELS = {severity: severity.value.title() for severity in ValidationSeverity}
+_SEVERITY_BACKGROUNDS = {
+    ValidationSeverity.ERROR: QBrush(QColor(255, 200, 200)),    # Light red
+    ValidationSeverity.WARNING: QBrush(QColor(255, 255, 200)),  # Light yellow
+    ValidationSeverity.INFO: QBrush(QColor(200, 255, 200)),     # Light green
+}
+_SEVERITY_STYLES = {
+    ValidationSeverity.ERROR: "color: #d32f2f; font-weight: bold;",
+    ValidationSeverity.WARNING: "color: #f57c00; font-weight: bold;",
+    ValidationSeverity.INFO: "color: #388e3c; font-weight: bold;",
+}
 
 class ValidationWorker(QThread):
-    """Worker thread for running validation in background."""
-    
-    validation_finished = pyqtSignal(list)  # List of ValidationIssue
-    validation_progress = pyqtSignal(str)    # Progress message
-    validation_error = pyqtSignal(str)       # Error message
-    
-    def __init__(self, connection: DatabaseConnection, system_id: Optional[int] = None):
+    """
+    Worker thread for running validation in background.
+    
+    Issues are sent in batches as the rules produce them, so the table fills
+    in while validation continues and the worker keeps no copy of them.
+    """
+    
+    validation_batch = Signal(list)     # Batch of ValidationIssue
+    validation_finished = Signal(int)   # Total number of issues
+    validation_progress = Signal(str)   # Progress message
+    validation_error = Signal(str)      # Error message
+    
+    def __init__(self, validation_engine: ValidationEngine, system_id: Optional[int] = None):
+        """
+        Initialize validation worker.
+        
+        Args:
+            validation_engine: Engine shared with the warnings tab; its rules hold
+                no per-run state and its connection gives this thread its own
+                SQLite connection
+            system_id: System to validate, or None for all systems
+        """
         super().__init__()
-        self.connection = connection
         self.system_id = system_id
-        self.validation_engine = ValidationEngine(connection)
+        self.validation_engine = validation_engine
     
     def run(self):
         """Run validation in background thread."""
@@ -39,137 +67,204 @@ class ValidationWorker(QThread):
             
             if self.system_id:
                 self.validation_progress.emit(f"Validating system ID {self.system_id}...")
-                issues = self.validation_engine.validate_system(self.system_id)
+                issues = self.validation_engine.iter_validate(self.system_id)
             else:
                 self.validation_progress.emit("Validating all systems...")
-                issues = self.validation_engine.validate_all()
+                issues = self.validation_engine.iter_validate()
             
-            self.validation_progress.emit(f"Validation complete: {len(issues)} issues found")
-            self.validation_finished.emit(issues)
+            total = 0
+            batch = []
+            for issue in issues:
+                batch.append(issue)
+                if len(batch) == VALIDATION_ISSUE_BATCH_SIZE:
+                    self.validation_batch.emit(batch)
+                    total += len(batch)
+                    batch = []
+            if batch:
+                self.validation_batch.emit(batch)
+                total += len(batch)
+            
+            self.validation_progress.emit(f"Validation complete: {total} issues found")
+            self.validation_finished.emit(total)
             
         except Exception as e:
             logger.error(f"Validation error: {e}")
             self.validation_error.emit(str(e))
 
 
-class ValidationIssueTableWidget(QTableWidget):
-    """Table widget for displaying validation issues."""
+class ValidationIssueModel(QAbstractTableModel):
+    """Read-only table model holding one ValidationIssue per row."""
+    
+    # Column headers and initial widths
+    COLUMNS = (
+        ("Severity", 80),
+        ("Entity Type", 100),
+        ("Entity Name", 150),
+        ("Issue Type", 120),
+        ("Message", 300),
+        ("Hierarchical ID", 120),
+        ("Suggestion", 250)
+    )
+    
+    # Display text of each column, indexed by column number
+    COLUMN_TEXT = (
+        lambda issue: _SEVERITY_LABELS[issue.severity],
+        lambda issue: issue.entity_type,
+        lambda issue: issue.entity_name,
+        lambda issue: issue.issue_type.replace('_', ' ').title(),
+        lambda issue: issue.message,
+        lambda issue: issue.hierarchical_id or "",
+        lambda issue: issue.suggestion or "",
+    )
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.issues: List[ValidationIssue] = []
+    
+    def set_issues(self, issues: List[ValidationIssue]):
+        """Replace all issues."""
+        self.beginResetModel()
+        self.issues = issues
+        self.endResetModel()
+    
+    def append_issues(self, issues: List[ValidationIssue]):
+        """Add a batch of issues after the existing ones."""
+        if not issues:
+            return
+        first = len(self.issues)
+        self.beginInsertRows(QModelIndex(), first, first + len(issues) - 1)
+        self.issues.extend(issues)
+        self.endInsertRows()
+    
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        """Get number of rows."""
+        return 0 if parent.isValid() else len(self.issues)
+    
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        """Get number of columns."""
+        return 0 if parent.isValid() else len(self.COLUMNS)
+    
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole) -> Any:
+        """Get display text, and the severity color for the first column."""
+        if not index.isValid():
+            return None
+        
+        issue = self.issues[index.row()]
+        column = index.column()
+        
+        if role == Qt.DisplayRole:
+            return self.COLUMN_TEXT[column](issue)
+        
+        if role == Qt.BackgroundRole and column == 0:
+            # Color code by severity
+            return _SEVERITY_BACKGROUNDS[issue.severity]
+        
+        return None
+    
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.DisplayRole) -> Any:
+        """Get header text."""
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.COLUMNS[section][0]
+        return None
+    
+    def flags(self, index: QModelIndex) -> Qt.ItemFlags:
+        """Cells are selectable but not editable."""
+        return Qt.ItemIsSelectable | Qt.ItemIsEnabled
+
+
+def _exact_match(text: Optional[str]) -> QRegularExpression:
+    """Build a filter expression matching text exactly, or everything for None."""
+    if text is None:
+        return QRegularExpression()
+    return QRegularExpression(f"^{QRegularExpression.escape(text)}$")
+
+
+class ValidationIssueTableView(QTableView):
+    """
+    Table view for displaying validation issues.
+    
+    The issues are held by a ValidationIssueModel behind two chained
+    QSortFilterProxyModels, one filtering the severity column and one the
+    entity type column, so filtering and sorting run inside Qt.
+    """
     
     issue_selected = Signal(ValidationIssue)
     
     def __init__(self):
         super().__init__()
+        self.issue_model = ValidationIssueModel(self)
+        
+        self._severity_proxy = QSortFilterProxyModel(self)
+        self._severity_proxy.setSourceModel(self.issue_model)
+        self._severity_proxy.setFilterKeyColumn(0)
+        
+        self._entity_type_proxy = QSortFilterProxyModel(self)
+        self._entity_type_proxy.setSourceModel(self._severity_proxy)
+        self._entity_type_proxy.setFilterKeyColumn(1)
+        
+        self.setModel(self._entity_type_proxy)
         self.setup_table()
-        self.issues = []
+    
+    @property
+    def issues(self) -> List[ValidationIssue]:
+        """Issues shown in the table, in the order they were given."""
+        return self.issue_model.issues
     
     def setup_table(self):
         """Set up the table columns and appearance."""
-        columns = [
-            ("Severity", 80),
-            ("Entity Type", 100),
-            ("Entity Name", 150),
-            ("Issue Type", 120),
-            ("Message", 300),
-            ("Hierarchical ID", 120),
-            ("Suggestion", 250)
-        ]
-        
-        self.setColumnCount(len(columns))
-        self.setHorizontalHeaderLabels([col[0] for col in columns])
-        
         # Set column widths
         header = self.horizontalHeader()
-        for i, (name, width) in enumerate(columns):
+        for i, (name, width) in enumerate(ValidationIssueModel.COLUMNS):
             header.resizeSection(i, width)
         
         header.setStretchLastSection(True)
         
         # Set table properties
         self.setAlternatingRowColors(True)
-        self.setSelectionBehavior(QTableWidget.SelectRows)
-        self.setSelectionMode(QTableWidget.SingleSelection)
+        self.setSelectionBehavior(QTableView.SelectRows)
+        self.setSelectionMode(QTableView.SingleSelection)
         self.setSortingEnabled(True)
         
         # Connect signals
-        self.cellDoubleClicked.connect(self._on_row_double_clicked)
+        self.doubleClicked.connect(self._on_row_double_clicked)
     
     def populate_issues(self, issues: List[ValidationIssue]):
         """Populate the table with validation issues."""
-        self.issues = issues
-        self.setRowCount(len(issues))
-        
-        for row, issue in enumerate(issues):
-            # Severity (with color coding)
-            severity_item = QTableWidgetItem(issue.severity.value.title())
-            severity_item.setData(Qt.UserRole, issue)
-            
-            # Color code by severity
-            if issue.severity == ValidationSeverity.ERROR:
-                severity_item.setBackground(QColor(255, 200, 200))  # Light red
-            elif issue.severity == ValidationSeverity.WARNING:
-                severity_item.setBackground(QColor(255, 255, 200))  # Light yellow
-            else:
-                severity_item.setBackground(QColor(200, 255, 200))  # Light green
-            
-            self.setItem(row, 0, severity_item)
-            
-            # Entity Type
-            self.setItem(row, 1, QTableWidgetItem(issue.entity_type))
-            
-            # Entity Name
-            self.setItem(row, 2, QTableWidgetItem(issue.entity_name))
-            
-            # Issue Type
-            issue_type_item = QTableWidgetItem(issue.issue_type.replace('_', ' ').title())
-            self.setItem(row, 3, issue_type_item)
-            
-            # Message
-            self.setItem(row, 4, QTableWidgetItem(issue.message))
-            
-            # Hierarchical ID
-            hierarchical_id = issue.hierarchical_id or ""
-            self.setItem(row, 5, QTableWidgetItem(hierarchical_id))
-            
-            # Suggestion
-            suggestion = issue.suggestion or ""
-            self.setItem(row, 6, QTableWidgetItem(suggestion))
+        self.issue_model.set_issues(issues)
         
         # Sort by severity (errors first)
         self.sortByColumn(0, Qt.AscendingOrder)
     
-    def _on_row_double_clicked(self, row: int, column: int):
+    def append_issues(self, issues: List[ValidationIssue]):
+        """Add a batch of validation issues; the proxies keep them sorted and filtered."""
+        self.issue_model.append_issues(issues)
+    
+    def _issue_at(self, index: QModelIndex) -> Optional[ValidationIssue]:
+        """Get the issue shown at a view index."""
+        if not index.isValid():
+            return None
+        source_index = self._severity_proxy.mapToSource(self._entity_type_proxy.mapToSource(index))
+        return self.issue_model.issues[source_index.row()]
+    
+    def _on_row_double_clicked(self, index: QModelIndex):
         """Handle double-click on table row."""
-        if 0 <= row < len(self.issues):
-            issue = self.issues[row]
+        issue = self._issue_at(index)
+        if issue:
             self.issue_selected.emit(issue)
     
     def filter_by_severity(self, severity: Optional[ValidationSeverity]):
         """Filter issues by severity level."""
-        for row in range(self.rowCount()):
-            item = self.item(row, 0)
-            if item and item.data(Qt.UserRole):
-                issue = item.data(Qt.UserRole)
-                if severity is None or issue.severity == severity:
-                    self.showRow(row)
-                else:
-                    self.hideRow(row)
+        self._severity_proxy.setFilterRegularExpression(
+            _exact_match(_SEVERITY_LABELS[severity] if severity else None)
+        )
     
     def filter_by_entity_type(self, entity_type: Optional[str]):
         """Filter issues by entity type."""
-        for row in range(self.rowCount()):
-            entity_type_item = self.item(row, 1)
-            if entity_type_item:
-                if entity_type is None or entity_type_item.text() == entity_type:
-                    self.showRow(row)
-                else:
-                    self.hideRow(row)
+        self._entity_type_proxy.setFilterRegularExpression(_exact_match(entity_type))
     
     def get_selected_issue(self) -> Optional[ValidationIssue]:
         """Get the currently selected validation issue."""
-        current_row = self.currentRow()
-        if 0 <= current_row < len(self.issues):
-            return self.issues[current_row]
-        return None
+        return self._issue_at(self.currentIndex())
 
 
 class ValidationSummaryWidget(QWidget):
@@ -195,9 +290,9 @@ class ValidationSummaryWidget(QWidget):
         self.info_label = QLabel("Info: 0")
         
         # Style labels with colors
-        self.errors_label.setStyleSheet("color: #d32f2f; font-weight: bold;")
-        self.warnings_label.setStyleSheet("color: #f57c00; font-weight: bold;")
-        self.info_label.setStyleSheet("color: #388e3c; font-weight: bold;")
+        self.errors_label.setStyleSheet(_SEVERITY_STYLES[ValidationSeverity.ERROR])
+        self.warnings_label.setStyleSheet(_SEVERITY_STYLES[ValidationSeverity.WARNING])
+        self.info_label.setStyleSheet(_SEVERITY_STYLES[ValidationSeverity.INFO])
         
         layout.addWidget(self.total_label, 1, 0)
         layout.addWidget(self.errors_label, 1, 1)
@@ -288,18 +383,13 @@ class ValidationDetailWidget(QWidget):
         self.current_issue = issue
         
         # Update labels
-        self.severity_label.setText(issue.severity.value.title())
+        self.severity_label.setText(_SEVERITY_LABELS[issue.severity])
         self.entity_label.setText(f"{issue.entity_type}: {issue.entity_name}")
         self.issue_type_label.setText(issue.issue_type.replace('_', ' ').title())
         self.hierarchical_id_label.setText(issue.hierarchical_id or "N/A")
         
         # Color code severity
-        if issue.severity == ValidationSeverity.ERROR:
-            self.severity_label.setStyleSheet("color: #d32f2f; font-weight: bold;")
-        elif issue.severity == ValidationSeverity.WARNING:
-            self.severity_label.setStyleSheet("color: #f57c00; font-weight: bold;")
-        else:
-            self.severity_label.setStyleSheet("color: #388e3c; font-weight: bold;")
+        self.severity_label.setStyleSheet(_SEVERITY_STYLES[issue.severity])
         
         # Update text areas
         self.message_text.setPlainText(issue.message)
@@ -325,6 +415,13 @@ class WarningsTab(QWidget):
     
     navigate_to_entity = Signal(str, int)  # entity_type, entity_id
     
+    # Severity filter choices; "All" maps to no filter
+    SEVERITY_FILTERS = {
+        "Error": ValidationSeverity.ERROR,
+        "Warning": ValidationSeverity.WARNING,
+        "Info": ValidationSeverity.INFO
+    }
+    
     def __init__(self, connection: DatabaseConnection):
         super().__init__()
         self.connection = connection
@@ -358,7 +455,7 @@ class WarningsTab(QWidget):
         # Filter controls
         controls_layout.addWidget(QLabel("Filter by Severity:"))
         self.severity_filter = QComboBox()
-        self.severity_filter.addItems(["All", "Error", "Warning", "Info"])
+        self.severity_filter.addItems(["All", *self.SEVERITY_FILTERS])
         controls_layout.addWidget(self.severity_filter)
         
         controls_layout.addWidget(QLabel("Filter by Entity:"))
@@ -389,7 +486,7 @@ class WarningsTab(QWidget):
         left_layout.addWidget(self.summary_widget)
         
         # Issues table
-        self.issues_table = ValidationIssueTableWidget()
+        self.issues_table = ValidationIssueTableView()
         left_layout.addWidget(self.issues_table)
         
         main_splitter.addWidget(left_widget)
@@ -452,11 +549,18 @@ class WarningsTab(QWidget):
         if self.validation_worker and self.validation_worker.isRunning():
             return  # Already running
         
-        self.validation_worker = ValidationWorker(self.connection, system_id)
+        # Only one worker runs at a time, so they can share the tab's engine,
+        # which reuses rule results while the database is unchanged
+        self.validation_worker = ValidationWorker(self.validation_engine, system_id)
+        self.validation_worker.validation_batch.connect(self.issues_table.append_issues)
         self.validation_worker.validation_finished.connect(self._on_validation_finished)
         self.validation_worker.validation_progress.connect(self._on_validation_progress)
         self.validation_worker.validation_error.connect(self._on_validation_error)
         
+        # Start from an empty table; batches are appended as they arrive
+        self.issues_table.populate_issues([])
+        self.detail_widget.clear_details()
+        
         # Update UI for validation start
         self.progress_bar.setVisible(True)
         self.progress_bar.setRange(0, 0)  # Indeterminate
@@ -466,9 +570,10 @@ class WarningsTab(QWidget):
         
         self.validation_worker.start()
     
-    def _on_validation_finished(self, issues: List[ValidationIssue]):
+    def _on_validation_finished(self, total: int):
         """Handle validation completion."""
-        logger.info(f"Validation completed with {len(issues)} issues")
+        logger.info(f"Validation completed with {total} issues")
+        issues = self.issues_table.issues
         
         # Update UI
         self.progress_bar.setVisible(False)
@@ -476,9 +581,6 @@ class WarningsTab(QWidget):
         self.validate_all_button.setEnabled(True)
         self.refresh_button.setEnabled(True)
         
-        # Update issues table
-        self.issues_table.populate_issues(issues)
-        
         # Update summary
         summary = self.validation_engine.get_validation_summary(issues)
         self.summary_widget.update_summary(summary)
@@ -496,9 +598,6 @@ class WarningsTab(QWidget):
             )
         else:
             self.status_label.setText("Validation complete: No issues found")
-        
-        # Clear detail view
-        self.detail_widget.clear_details()
     
     def _on_validation_progress(self, message: str):
         """Handle validation progress updates."""
@@ -518,31 +617,23 @@ class WarningsTab(QWidget):
     
     def _update_entity_filter(self, entity_types: Dict[str, int]):
         """Update the entity filter combo box."""
-        self.entity_filter.clear()
-        self.entity_filter.addItem("All")
+        # Each clear/addItem would re-apply the filter; refill silently and apply once
+        self.entity_filter.blockSignals(True)
+        try:
+            self.entity_filter.clear()
+            self.entity_filter.addItems(["All", *sorted(entity_types)])
+        finally:
+            self.entity_filter.blockSignals(False)
         
-        for entity_type in sorted(entity_types.keys()):
-            self.entity_filter.addItem(entity_type)
+        self.apply_entity_filter(self.entity_filter.currentText())
     
     def apply_severity_filter(self, severity_text: str):
         """Apply severity filter to issues table."""
-        if severity_text == "All":
-            self.issues_table.filter_by_severity(None)
-        else:
-            severity_map = {
-                "Error": ValidationSeverity.ERROR,
-                "Warning": ValidationSeverity.WARNING,
-                "Info": ValidationSeverity.INFO
-            }
-            severity = severity_map.get(severity_text)
-            self.issues_table.filter_by_severity(severity)
+        self.issues_table.filter_by_severity(self.SEVERITY_FILTERS.get(severity_text))
     
     def apply_entity_filter(self, entity_type: str):
         """Apply entity type filter to issues table."""
-        if entity_type == "All":
-            self.issues_table.filter_by_entity_type(None)
-        else:
-            self.issues_table.filter_by_entity_type(entity_type)
+        self.issues_table.filter_by_entity_type(None if entity_type == "All" else entity_type)
     
     def _on_issue_selected(self, issue: ValidationIssue):
         """Handle issue selection in table."""
@@ -3,25 +3,39 @@ Working directory management utilities for STPA Tool
 Handles directory validation, initialization, and management.
 """
 
+import errno
 import os
 import shutil
+import stat
+import time
+from collections import OrderedDict
 from pathlib import Path
-from typing import Optional, List
+from typing import Optional, List, Tuple
 
 from ..config.constants import (
     DEFAULT_DB_NAME, DIAGRAMS_DIR, BASELINES_DIR, TEMP_DIR,
-    CONFIG_FILE_JSON, DEFAULT_DIR_PERMISSIONS
+    CONFIG_FILE_JSON, DEFAULT_DIR_PERMISSIONS, DIRECTORY_VALIDATION_CACHE_SIZE
 )
 from ..log_config.config import get_logger
 
 logger = get_logger(__name__)
 
+# copy_file_range errors meaning the kernel or filesystem cannot do the copy
+_COPY_FILE_RANGE_UNSUPPORTED = frozenset(
+    {errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP, errno.ENOTSUP, errno.EPERM}
+)
+
 
 class DirectoryManager:
     """
     Manages working directory operations for the STPA Tool.
     """
     
+    # Write probe results by resolved path, with the directory identity and
+    # change times they were taken at, shared by all managers; a directory
+    # that has not changed is not probed again. Least recently used first
+    _validation_cache: "OrderedDict[str, Tuple[tuple, Tuple[bool, Optional[str]]]]" = OrderedDict()
+    
     def __init__(self, working_directory: Optional[Path] = None):
         """
         Initialize directory manager.
@@ -31,6 +45,33 @@ class DirectoryManager:
         """
         self.working_directory = working_directory
     
+    @property
+    def working_directory(self) -> Optional[Path]:
+        """Current working directory, or None if none is set."""
+        return self._working_directory
+    
+    @working_directory.setter
+    def working_directory(self, working_directory: Optional[Path]):
+        # The file and folder paths are derived here once instead of per getter call
+        self._working_directory = working_directory
+        if working_directory:
+            self._database_path = working_directory / DEFAULT_DB_NAME
+            self._config_path = working_directory / CONFIG_FILE_JSON
+            self._diagrams_path = working_directory / DIAGRAMS_DIR
+            self._baselines_path = working_directory / BASELINES_DIR
+            self._temp_path = working_directory / TEMP_DIR
+            # String forms for the backup copy, which works on raw paths
+            self._working_directory_str = os.fspath(working_directory)
+            self._database_path_str = os.fspath(self._database_path)
+        else:
+            self._database_path = None
+            self._config_path = None
+            self._diagrams_path = None
+            self._baselines_path = None
+            self._temp_path = None
+            self._working_directory_str = None
+            self._database_path_str = None
+    
     def validate_directory(self, directory_path: Path) -> tuple[bool, Optional[str]]:
         """
         Validate a directory for use as working directory.
@@ -41,35 +82,62 @@ class DirectoryManager:
         Returns:
             Tuple of (is_valid, error_message)
         """
+        # One stat answers existence and type; the test file is then the
+        # authoritative write check
         try:
-            # Check if path exists
-            if not directory_path.exists():
-                return False, "Directory does not exist"
-            
-            # Check if it's actually a directory
-            if not directory_path.is_dir():
-                return False, "Path is not a directory"
-            
-            # Check read permissions
-            if not os.access(directory_path, os.R_OK):
-                return False, "No read permission for directory"
-            
-            # Check write permissions
-            if not os.access(directory_path, os.W_OK):
-                return False, "No write permission for directory"
-            
-            # Check if directory is writable by creating a test file
-            test_file = directory_path / ".stpa_tool_test"
-            try:
-                test_file.touch()
-                test_file.unlink()
-            except Exception:
-                return False, "Cannot write to directory"
-            
-            return True, None
-            
+            st = os.stat(directory_path)
+        except (FileNotFoundError, NotADirectoryError):
+            return False, "Directory does not exist"
+        except PermissionError:
+            return False, "No read permission for directory"
         except Exception as e:
             return False, f"Error validating directory: {str(e)}"
+        
+        if not stat.S_ISDIR(st.st_mode):
+            return False, "Path is not a directory"
+        
+        # stat succeeds on a directory that cannot be listed (mode -wx)
+        if not os.access(directory_path, os.R_OK):
+            return False, "No read permission for directory"
+        
+        # Permission changes move ctime and entry changes move mtime
+        resolved_path = os.path.realpath(directory_path)
+        cached = self._validation_cache.get(resolved_path)
+        if cached is not None and cached[0] == self._validation_key(st):
+            self._validation_cache.move_to_end(resolved_path)
+            return cached[1]
+        
+        # Check if directory is writable by creating a test file
+        test_file = os.path.join(directory_path, ".stpa_tool_test")
+        try:
+            os.close(os.open(test_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600))
+            os.unlink(test_file)
+            result = (True, None)
+        except PermissionError:
+            result = (False, "No write permission for directory")
+        except Exception:
+            result = (False, "Cannot write to directory")
+        
+        # The probe itself changes the directory's mtime, so record the state
+        # after it; this replaces any older entry for the directory
+        try:
+            self._validation_cache[resolved_path] = (self._validation_key(os.stat(directory_path)), result)
+        except OSError:
+            return result
+        self._validation_cache.move_to_end(resolved_path)
+        if len(self._validation_cache) > DIRECTORY_VALIDATION_CACHE_SIZE:
+            self._validation_cache.popitem(last=False)
+        return result
+    
+    @staticmethod
+    def _validation_key(st: os.stat_result) -> tuple:
+        """Identity and last change of a directory, checked by the validation cache."""
+        return st.st_dev, st.st_ino, st.st_mtime_ns, st.st_ctime_ns
+    
+    @classmethod
+    def invalidate(cls):
+        """Forget cached directory validation results."""
+        cls._validation_cache.clear()
     
     def initialize_directory(self, directory_path: Path) -> tuple[bool, Optional[str]]:
         """
@@ -87,18 +155,30 @@ class DirectoryManager:
             if not is_valid:
                 return False, error_msg
             
-            # Create subdirectories
-            subdirs = [DIAGRAMS_DIR, BASELINES_DIR, TEMP_DIR]
-            for subdir in subdirs:
-                subdir_path = directory_path / subdir
-                subdir_path.mkdir(exist_ok=True, parents=True)
-                
-                # Set permissions
+            # One directory listing tells which subdirectories already exist
+            with os.scandir(directory_path) as entries:
+                existing = {entry.name for entry in entries if entry.is_dir()}
+            
+            # Create missing subdirectories; mkdir applies the permissions
+            missing = [subdir for subdir in (DIAGRAMS_DIR, BASELINES_DIR, TEMP_DIR)
+                       if subdir not in existing]
+            for subdir in missing:
+                subdir_path = os.path.join(directory_path, subdir)
                 try:
-                    subdir_path.chmod(DEFAULT_DIR_PERMISSIONS)
-                except Exception:
-                    # Permissions might not be supported on all systems
-                    pass
+                    os.mkdir(subdir_path, mode=DEFAULT_DIR_PERMISSIONS)
+                except FileExistsError:
+                    # Created since the listing; mkdir's mode did not apply
+                    if not os.path.isdir(subdir_path):
+                        raise
+                    try:
+                        os.chmod(subdir_path, DEFAULT_DIR_PERMISSIONS)
+                    except OSError:
+                        # Permissions might not be supported on all systems
+                        pass
+            
+            # Creating subdirectories changed the directory
+            if missing:
+                self.invalidate()
             
             # Update working directory
             self.working_directory = directory_path
@@ -118,10 +198,7 @@ class DirectoryManager:
         Returns:
             Path to database file or None if no working directory set
         """
-        if not self.working_directory:
-            return None
-        
-        return self.working_directory / DEFAULT_DB_NAME
+        return self._database_path
     
     def get_config_path(self) -> Optional[Path]:
         """
@@ -130,10 +207,7 @@ class DirectoryManager:
         Returns:
             Path to configuration file or None if no working directory set
         """
-        if not self.working_directory:
-            return None
-        
-        return self.working_directory / CONFIG_FILE_JSON
+        return self._config_path
     
     def get_diagrams_path(self) -> Optional[Path]:
         """
@@ -142,10 +216,7 @@ class DirectoryManager:
         Returns:
             Path to diagrams directory or None if no working directory set
         """
-        if not self.working_directory:
-            return None
-        
-        return self.working_directory / DIAGRAMS_DIR
+        return self._diagrams_path
     
     def get_baselines_path(self) -> Optional[Path]:
         """
@@ -154,10 +225,7 @@ class DirectoryManager:
         Returns:
             Path to baselines directory or None if no working directory set
         """
-        if not self.working_directory:
-            return None
-        
-        return self.working_directory / BASELINES_DIR
+        return self._baselines_path
     
     def get_temp_path(self) -> Optional[Path]:
         """
@@ -166,10 +234,7 @@ class DirectoryManager:
         Returns:
             Path to temp directory or None if no working directory set
         """
-        if not self.working_directory:
-            return None
-        
-        return self.working_directory / TEMP_DIR
+        return self._temp_path
     
     def list_existing_files(self) -> List[str]:
         """
@@ -181,23 +246,19 @@ class DirectoryManager:
         if not self.working_directory:
             return []
         
-        existing_files = []
-        
-        # Check for database
-        db_path = self.get_database_path()
-        if db_path and db_path.exists():
-            existing_files.append(db_path.name)
-        
-        # Check for config file
-        config_path = self.get_config_path()
-        if config_path and config_path.exists():
-            existing_files.append(config_path.name)
+        # One listing of the working directory answers every check
+        try:
+            with os.scandir(self.working_directory) as entries:
+                found = {entry.name: entry.is_dir() for entry in entries}
+        except OSError:
+            return []
         
-        # Check for directories
-        for dir_name in [DIAGRAMS_DIR, BASELINES_DIR, TEMP_DIR]:
-            dir_path = self.working_directory / dir_name
-            if dir_path.exists() and dir_path.is_dir():
-                existing_files.append(f"{dir_name}/")
+        # Database and config file, then the tool's directories
+        existing_files = [name for name in (DEFAULT_DB_NAME, CONFIG_FILE_JSON) if name in found]
+        existing_files.extend(
+            f"{dir_name}/" for dir_name in (DIAGRAMS_DIR, BASELINES_DIR, TEMP_DIR)
+            if found.get(dir_name)
+        )
         
         return existing_files
     
@@ -210,15 +271,21 @@ class DirectoryManager:
         """
         try:
             temp_path = self.get_temp_path()
-            if not temp_path or not temp_path.exists():
+            if not temp_path:
                 return True
             
-            # Remove all files in temp directory
-            for item in temp_path.iterdir():
-                if item.is_file():
-                    item.unlink()
-                elif item.is_dir():
-                    shutil.rmtree(item)
+            # Remove all files in temp directory; links are removed, not followed.
+            # A missing temp directory is found by scandir, not a separate stat
+            try:
+                entries = os.scandir(temp_path)
+            except FileNotFoundError:
+                return True
+            with entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        shutil.rmtree(entry.path)
+                    else:
+                        os.unlink(entry.path)
             
             logger.info("Cleaned up temporary files")
             return True
@@ -238,25 +305,57 @@ class DirectoryManager:
             Tuple of (success, backup_path or error_message)
         """
         try:
-            db_path = self.get_database_path()
-            if not db_path or not db_path.exists():
+            db_path = self._database_path_str
+            if not db_path:
                 return False, "Database file not found"
             
             # Generate backup name if not provided
             if not backup_name:
-                from datetime import datetime
-                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                backup_name = f"stpa_backup_{timestamp}.db"
+                backup_name = f"stpa_backup_{time.strftime('%Y%m%d_%H%M%S')}.db"
             
-            backup_path = self.working_directory / backup_name
+            backup_path = os.path.join(self._working_directory_str, backup_name)
             
-            # Copy database file
-            shutil.copy2(db_path, backup_path)
+            # Copy database file, sharing extents where the filesystem allows it
+            try:
+                if not self._copy_file_range(db_path, backup_path):
+                    shutil.copy2(db_path, backup_path)
+            except FileNotFoundError:
+                if not os.path.exists(db_path):
+                    return False, "Database file not found"
+                raise
             
             logger.info(f"Created database backup: {backup_path}")
-            return True, str(backup_path)
+            return True, backup_path
             
         except Exception as e:
             error_msg = f"Error creating database backup: {str(e)}"
             logger.error(error_msg)
-            return False, error_msg
\ No newline at end of file
+            return False, error_msg
+    
+    @staticmethod
+    def _copy_file_range(source: str, destination: str) -> bool:
+        """
+        Copy a file with copy_file_range, which reflinks on copy-on-write filesystems.
+        
+        Args:
+            source: File to copy
+            destination: File to create or overwrite
+            
+        Returns:
+            True if the file was copied, False if the caller should fall back
+            to an ordinary copy
+        """
+        if not hasattr(os, "copy_file_range"):
+            return False
+        
+        with open(source, "rb") as src, open(destination, "wb") as dst:
+            try:
+                while os.copy_file_range(src.fileno(), dst.fileno(), 1 << 30):
+                    pass
+            except OSError as e:
+                if e.errno in _COPY_FILE_RANGE_UNSUPPORTED:
+                    return False
+                raise
+        
+        shutil.copystat(source, destination)
+        return True
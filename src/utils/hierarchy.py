@@ -3,7 +3,10 @@ Hierarchical ID management utilities for STPA Tool
 Handles generation, validation, and parsing of hierarchical identifiers.
 """
 
+import logging
 import re
+from functools import lru_cache
+from operator import itemgetter
 from typing import Tuple, Optional, List, Dict
 from dataclasses import dataclass
 
@@ -20,8 +23,11 @@ from ..log_config.config import get_logger
 
 logger = get_logger(__name__)
 
+# TYPE_CONFIG lookup default for types that are not valid at all
+_UNKNOWN_TYPE = object()
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class HierarchicalID:
     """
     Represents a hierarchical identifier.
@@ -48,7 +54,7 @@ class HierarchyManager:
     """
     
     # Valid type identifiers
-    VALID_TYPES = {
+    VALID_TYPES = frozenset({
         SYSTEM_TYPE, FUNCTION_TYPE, INTERFACE_TYPE, ASSET_TYPE,
         CONSTRAINT_TYPE, REQUIREMENT_TYPE, ENVIRONMENT_TYPE, HAZARD_TYPE,
         LOSS_TYPE, CONTROL_STRUCTURE_TYPE, CONTROLLER_TYPE,
@@ -56,31 +62,32 @@ class HierarchyManager:
         CONTROL_ALGORITHM_TYPE, PROCESS_MODEL_TYPE, STATE_DIAGRAM_TYPE,
         STATE_TYPE, IN_TRANSITION_TYPE, OUT_TRANSITION_TYPE,
         SAFETY_SECURITY_CONTROL_TYPE
+    })
+    
+    # Hierarchical type patterns as (max_levels, requires_parent)
+    HIERARCHICAL_TYPES: Dict[str, Tuple[int, bool]] = {
+        SYSTEM_TYPE: (10, False),      # Support deep system hierarchies
+        REQUIREMENT_TYPE: (5, False),  # L1, L2, L3, L4, L5 requirements
+        FUNCTION_TYPE: (3, True),      # Function hierarchies; must belong to a system
     }
     
-    # Hierarchical type patterns
-    HIERARCHICAL_TYPES = {
-        SYSTEM_TYPE: {
-            'max_levels': 10,  # Support deep system hierarchies
-            'requires_parent': False
-        },
-        REQUIREMENT_TYPE: {
-            'max_levels': 5,   # L1, L2, L3, L4, L5 requirements
-            'requires_parent': False
-        },
-        FUNCTION_TYPE: {
-            'max_levels': 3,   # Function hierarchies
-            'requires_parent': True  # Must belong to a system
-        }
+    # Every valid type mapped to its hierarchy limits, or None if unlimited,
+    # so one lookup both validates a type and finds its limits
+    TYPE_CONFIG: Dict[str, Optional[Tuple[int, bool]]] = {
+        **dict.fromkeys(VALID_TYPES), **HIERARCHICAL_TYPES
     }
     
-    # Regex pattern for parsing hierarchical IDs  
-    ID_PATTERN = re.compile(r'^([A-Z]+)-(\d+(?:\.\d+)*)$')
+    # Reference grammar for parse_hierarchical_id, which accepts a string if
+    # and only if this matches it with surrounding whitespace stripped. The
+    # parser scans without regex; each digit group here is delimited by '.',
+    # so matching never backtracks
+    ID_PATTERN = re.compile(r'^([A-Z]+)-(\d+(?:\.\d+)*)\Z', re.ASCII)
     
     @classmethod
+    @lru_cache(maxsize=4096)
     def parse_hierarchical_id(cls, id_string: str) -> Optional[HierarchicalID]:
         """
-        Parse hierarchical ID string into components.
+        Parse hierarchical ID string into components, once per distinct string.
         
         Args:
             id_string: Hierarchical ID string (e.g., "S-1.2.1")
@@ -89,29 +96,31 @@ class HierarchyManager:
             HierarchicalID object or None if invalid
         """
         try:
-            match = cls.ID_PATTERN.match(id_string.strip())
-            if not match:
-                return None
-            
-            type_id = match.group(1)
-            numbers_part = match.group(2)
+            type_id, separator, numbers_part = id_string.strip().partition('-')
             
-            # Split by dots to get all levels
-            number_parts = numbers_part.split('.')
+            # Type is one or more ASCII capitals; numbers are dot-separated
+            # ASCII digit groups with no empty group
+            if not (separator and type_id.isascii() and type_id.isalpha() and type_id.isupper()):
+                return None
+            if not (numbers_part.isascii() and numbers_part.replace('.', '').isdigit()):
+                return None
+            if numbers_part[0] == '.' or numbers_part[-1] == '.' or '..' in numbers_part:
+                return None
             
-            if len(number_parts) == 1:
+            first, dot, rest = numbers_part.partition('.')
+            if not dot:
                 # Simple notation like "S-1"
                 level_id = 0
-                seq_id = int(number_parts[0])
+                seq_id = int(first)
             else:
                 # Complex notation like "S-1.2" or "S-1.2.3"
                 # Use the first number as level, last number as sequential
-                level_id = int(number_parts[0])
-                seq_id = int(number_parts[-1])
+                level_id = int(first)
+                seq_id = int(rest.rpartition('.')[2])
             
             # Validate type identifier
-            if type_id not in cls.VALID_TYPES:
-                logger.warning(f"Invalid type identifier: {type_id}")
+            if type_id not in cls.TYPE_CONFIG:
+                logger.warning("Invalid type identifier: %s", type_id)
                 return None
             
             return HierarchicalID(
@@ -120,8 +129,9 @@ class HierarchyManager:
                 sequential_identifier=seq_id
             )
             
-        except Exception as e:
-            logger.error(f"Failed to parse hierarchical ID '{id_string}': {str(e)}")
+        except (AttributeError, ValueError) as e:
+            # Not a string, or a digit group int() still rejects
+            logger.error("Failed to parse hierarchical ID '%s': %s", id_string, e)
             return None
     
     @classmethod
@@ -136,14 +146,13 @@ class HierarchyManager:
             Tuple of (is_valid, error_message)
         """
         try:
-            # Check type identifier
-            if hierarchical_id.type_identifier not in cls.VALID_TYPES:
+            # Check type identifier and level limits
+            type_config = cls.TYPE_CONFIG.get(hierarchical_id.type_identifier, _UNKNOWN_TYPE)
+            if type_config is _UNKNOWN_TYPE:
                 return False, f"Invalid type identifier: {hierarchical_id.type_identifier}"
             
-            # Check level limits
-            type_config = cls.HIERARCHICAL_TYPES.get(hierarchical_id.type_identifier)
             if type_config:
-                max_levels = type_config['max_levels']
+                max_levels, _ = type_config
                 if hierarchical_id.level_identifier > max_levels:
                     return False, f"Level {hierarchical_id.level_identifier} exceeds maximum {max_levels} for type {hierarchical_id.type_identifier}"
             
@@ -157,7 +166,8 @@ class HierarchyManager:
             
             return True, None
             
-        except Exception as e:
+        except (AttributeError, TypeError) as e:
+            # Not a HierarchicalID, or components of the wrong type
             return False, f"Validation error: {str(e)}"
     
     @classmethod
@@ -257,27 +267,27 @@ class HierarchyManager:
             Sorted list of hierarchical ID strings
         """
         try:
-            # Parse all IDs
-            parsed_ids = []
+            # Parse all IDs into (type, level, sequential, original) tuples;
+            # warnings are only formatted if they will be emitted
+            warn = logger.isEnabledFor(logging.WARNING)
+            decorated = []
             for id_str in id_strings:
                 parsed_id = cls.parse_hierarchical_id(id_str)
                 if parsed_id:
-                    parsed_ids.append((id_str, parsed_id))
-                else:
-                    logger.warning(f"Could not parse ID for sorting: {id_str}")
-            
-            # Sort by type, then level, then sequential
-            def sort_key(item):
-                _, parsed_id = item
-                return (
-                    parsed_id.type_identifier,
-                    parsed_id.level_identifier,
-                    parsed_id.sequential_identifier
-                )
+                    decorated.append((
+                        parsed_id.type_identifier,
+                        parsed_id.level_identifier,
+                        parsed_id.sequential_identifier,
+                        id_str
+                    ))
+                elif warn:
+                    logger.warning("Could not parse ID for sorting: %s", id_str)
             
-            sorted_ids = sorted(parsed_ids, key=sort_key)
+            # Sort by type, then level, then sequential; the key is a C-level
+            # tuple slice and keeps equal IDs in input order
+            decorated.sort(key=itemgetter(0, 1, 2))
             
-            return [id_str for id_str, _ in sorted_ids]
+            return [item[3] for item in decorated]
             
         except Exception as e:
             logger.error(f"Failed to sort hierarchical IDs: {str(e)}")
@@ -297,21 +307,29 @@ class HierarchyManager:
             Next available sequential identifier
         """
         try:
-            max_seq = 0
-            
-            for id_str in existing_ids:
-                parsed_id = cls.parse_hierarchical_id(id_str)
-                if parsed_id and parsed_id.type_identifier == type_identifier:
-                    # For level 0 (root), check sequential_identifier directly  
-                    if level_identifier == 0 and parsed_id.level_identifier == 0:
-                        max_seq = max(max_seq, parsed_id.sequential_identifier)
-                    # For root items stored as single number (like S-1, S-2)
-                    elif level_identifier == 0 and parsed_id.sequential_identifier == 0:
-                        max_seq = max(max_seq, parsed_id.level_identifier)
-                    # For nested levels
-                    elif (parsed_id.level_identifier == level_identifier and 
-                          parsed_id.sequential_identifier > 0):
-                        max_seq = max(max_seq, parsed_id.sequential_identifier)
+            # Parsing is memoised, so IDs seen on earlier saves are not reparsed
+            existing_parsed = map(cls.parse_hierarchical_id, existing_ids)
+            same_type = [parsed_id for parsed_id in existing_parsed
+                         if parsed_id and parsed_id.type_identifier == type_identifier]
+            
+            if level_identifier == 0:
+                # Root items are "S-1" (sequential) or stored as a single
+                # level number with no sequential part
+                max_seq = max(
+                    (parsed_id.sequential_identifier if parsed_id.level_identifier == 0
+                     else parsed_id.level_identifier
+                     for parsed_id in same_type
+                     if parsed_id.level_identifier == 0 or parsed_id.sequential_identifier == 0),
+                    default=0
+                )
+            else:
+                # For nested levels
+                max_seq = max(
+                    (parsed_id.sequential_identifier for parsed_id in same_type
+                     if parsed_id.level_identifier == level_identifier
+                     and parsed_id.sequential_identifier > 0),
+                    default=0
+                )
             
             return max_seq + 1
             
@@ -350,28 +368,16 @@ class HierarchyManager:
             True if ancestor relationship exists
         """
         try:
-            ancestor_id = cls.parse_hierarchical_id(potential_ancestor)
-            descendant_id = cls.parse_hierarchical_id(potential_descendant)
+            # The descendant extends the ancestor's full path, which also
+            # means both have the same type; only a match needs parsing, and
+            # any '.'-bounded prefix of a valid ID is itself valid
+            ancestor_str = potential_ancestor.strip()
+            descendant_str = potential_descendant.strip()
             
-            if not ancestor_id or not descendant_id:
+            if not descendant_str.startswith(ancestor_str + "."):
                 return False
             
-            # Must be same type
-            if ancestor_id.type_identifier != descendant_id.type_identifier:
-                return False
-            
-            # Ancestor must be at a higher level (lower depth)
-            ancestor_depth = cls.get_hierarchy_depth(ancestor_id)
-            descendant_depth = cls.get_hierarchy_depth(descendant_id)
-            
-            if ancestor_depth >= descendant_depth:
-                return False
-            
-            # Check if descendant starts with ancestor pattern
-            ancestor_str = str(ancestor_id)
-            descendant_str = str(descendant_id)
-            
-            return descendant_str.startswith(ancestor_str + ".")
+            return cls.parse_hierarchical_id(descendant_str) is not None
             
         except Exception as e:
             logger.error(f"Failed to check ancestor relationship: {str(e)}")
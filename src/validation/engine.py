@@ -3,19 +3,193 @@ Data validation engine for the STPA Tool.
 Implements validation rules as specified in the SRS.
 """
 
-from typing import List, Dict, Any, Optional, Tuple
+from collections import Counter, OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Iterator, Optional, Tuple
 from dataclasses import dataclass
 from enum import Enum
+from functools import lru_cache
 import logging
+import threading
 
+from ..config.constants import (
+    WORKING_BASELINE, VALIDATION_CACHE_SIZE, VALIDATION_MAX_WORKERS, VALIDATION_PARALLEL_MIN_ROWS
+)
 from ..database.connection import DatabaseConnection
-from ..database.entities import System, Requirement, ControlStructure, EntityFactory
+from ..database.entities import System, Requirement, EntityFactory
 from ..utils.hierarchy import HierarchyManager
 
 
 logger = logging.getLogger(__name__)
 
 
+def _load_entities(connection: DatabaseConnection, entity_class, system_id: Optional[int] = None) -> List[Any]:
+    """
+    Load the working-baseline entities of one class for validation.
+    
+    Args:
+        connection: Database connection
+        entity_class: Entity class to load
+        system_id: Optional system ID to limit the entities loaded
+        
+    Returns:
+        List of entities, ordered by ID
+    """
+    repository = EntityFactory.get_repository(connection, entity_class)
+    
+    if system_id:
+        if entity_class is System:
+            system = repository.read(system_id)
+            return [system] if system else []
+        return repository.list_by_system(system_id)
+    
+    sql = f"SELECT * FROM {repository.table_name} WHERE baseline = ? ORDER BY id"
+    return [repository._row_to_entity(row) for row in connection.iterate(sql, (WORKING_BASELINE,))]
+
+
+# Every code point str.strip() removes; the highest is U+3000
+_WHITESPACE_CODES = ", ".join(str(c) for c in range(0x3001) if chr(c).isspace())
+
+# SQL test for a text field that str.strip() would leave empty
+_BLANK = f"({{0}} IS NULL OR TRIM({{0}}, char({_WHITESPACE_CODES})) = '')"
+
+# Completeness queries return only rows with at least one problem, with a
+# flag column per check; {scope} narrows them to one system
+_SQL_INCOMPLETE_SYSTEMS = f"""
+    SELECT * FROM (
+        SELECT id, system_hierarchy, system_name, criticality,
+               {_BLANK.format('system_name')} AS missing_name,
+               {_BLANK.format('system_description')} AS missing_description,
+               (COALESCE(criticality, '') NOT IN ('', 'Non-Critical')
+                AND NOT (confidentiality OR integrity OR availability OR authenticity
+                         OR non_repudiation OR assurance OR trustworthy OR privacy)) AS incomplete_criticality
+        FROM systems WHERE baseline = ?{{scope}}
+    ) WHERE missing_name OR missing_description OR incomplete_criticality
+    ORDER BY id
+"""
+
+_SQL_INCOMPLETE_FUNCTIONS = f"""
+    SELECT * FROM (
+        SELECT id, system_hierarchy, function_name,
+               {_BLANK.format('function_name')} AS missing_name,
+               {_BLANK.format('function_description')} AS missing_description
+        FROM functions WHERE baseline = ?{{scope}}
+    ) WHERE missing_name OR missing_description
+    ORDER BY id
+"""
+
+_SQL_INCOMPLETE_REQUIREMENTS = f"""
+    SELECT * FROM (
+        SELECT id, system_hierarchy, alphanumeric_identifier,
+               {_BLANK.format('requirement_text')} AS missing_text,
+               (verification_method IS NULL OR verification_method = '') AS missing_verification
+        FROM requirements WHERE baseline = ?{{scope}}
+    ) WHERE missing_text OR missing_verification
+    ORDER BY id
+"""
+
+_SQL_INCOMPLETE_CONTROL_STRUCTURES = f"""
+    SELECT * FROM (
+        SELECT id, system_hierarchy, structure_name,
+               {_BLANK.format('structure_name')} AS missing_name,
+               {_BLANK.format('structure_description')} AS missing_description
+        FROM control_structures WHERE baseline = ?{{scope}}
+    ) WHERE missing_name OR missing_description
+    ORDER BY id
+"""
+
+# Rows the completeness queries will read for the whole working baseline
+_SQL_WORKING_ROW_COUNT = """
+    SELECT (SELECT COUNT(*) FROM systems WHERE baseline = ?1)
+         + (SELECT COUNT(*) FROM functions WHERE baseline = ?1)
+         + (SELECT COUNT(*) FROM requirements WHERE baseline = ?1)
+"""
+
+
+def _fetch_incomplete(connection: DatabaseConnection, sql: str, scope_column: str,
+                      system_id: Optional[int] = None) -> Iterator[Any]:
+    """
+    Run a completeness query on the working baseline.
+    
+    Args:
+        connection: Database connection
+        sql: One of the _SQL_INCOMPLETE_* queries
+        scope_column: Column holding the system ID for this table
+        system_id: Optional system ID to limit the rows checked
+        
+    Returns:
+        Rows with at least one completeness problem, fetched in batches
+    """
+    if system_id:
+        return connection.iterate(sql.format(scope=f" AND {scope_column} = ?"), (WORKING_BASELINE, system_id))
+    return connection.iterate(sql.format(scope=""), (WORKING_BASELINE,))
+
+
+def _resolve_parent_chains(parents: Dict[int, Optional[int]]) -> Dict[int, Optional[str]]:
+    """
+    Classify where each entity's chain of parents ends.
+    
+    An entity's chain ends where its parent's does, so each chain is walked
+    once and its outcome shared by every entity on it.
+    
+    Args:
+        parents: Parent ID (or None) by entity ID, for the entities in scope
+        
+    Returns:
+        By entity ID: None if the chain reaches a root, "circular_reference"
+        if it loops, or "invalid_parent" if it reaches a parent not in scope
+    """
+    # Roots need no walk, and the path buffers are reused between walks
+    outcomes = {entity_id: None for entity_id, parent_id in parents.items() if not parent_id}
+    path = []
+    on_path = set()
+    for entity_id in parents:
+        if entity_id in outcomes:
+            continue
+        
+        path.clear()
+        on_path.clear()
+        current_id = entity_id
+        while True:
+            if current_id in outcomes:
+                outcome = outcomes[current_id]
+                break
+            if current_id in on_path:
+                # The chain loops back on itself
+                outcome = "circular_reference"
+                break
+            
+            path.append(current_id)
+            on_path.add(current_id)
+            parent_id = parents[current_id]
+            if parent_id not in parents:
+                outcome = "invalid_parent"
+                break
+            current_id = parent_id
+        
+        for path_id in path:
+            outcomes[path_id] = outcome
+    
+    return outcomes
+
+
+# Messages built from a few distinct values are made once per value and the
+# same string shared by every issue that uses it; literals already are
+@lru_cache(maxsize=None)
+def _incomplete_criticality_message(criticality: str) -> str:
+    return f"System marked as {criticality} but no security attributes are selected"
+
+
+@lru_cache(maxsize=256)
+def _invalid_level_message(level: int, parent_level: int) -> str:
+    return f"Requirement level ({level}) should be greater than parent level ({parent_level})"
+
+
+@lru_cache(maxsize=256)
+def _inconsistent_level_message(level: int, depth: int) -> str:
+    return f"Level identifier ({level}) doesn't match hierarchy depth ({depth})"
+
+
 class ValidationSeverity(Enum):
     """Severity levels for validation issues."""
     ERROR = "error"
@@ -23,7 +197,10 @@ class ValidationSeverity(Enum):
     INFO = "info"
 
 
-@dataclass
+# Not frozen: a frozen __init__ assigns each field through object.__setattr__,
+# which made building issues about three times slower. Being mutable, issues
+# are compared by value but not hashable
+@dataclass(slots=True)
 class ValidationIssue:
     """Represents a validation issue found in the data."""
     entity_type: str
@@ -69,6 +246,15 @@ class CompletenessValidationRule(ValidationRule):
         )
     
     def validate(self, connection: DatabaseConnection, system_id: Optional[int] = None) -> List[ValidationIssue]:
+        if self._run_in_parallel(connection, system_id):
+            checks = (self._validate_systems, self._validate_functions,
+                      self._validate_requirements, self._validate_control_structures)
+            # A generator's body runs where it is consumed, so each check
+            # queries through its worker thread's own connection
+            with ThreadPoolExecutor(max_workers=len(checks), thread_name_prefix="completeness") as executor:
+                futures = [executor.submit(list, check(connection, system_id)) for check in checks]
+                return [issue for future in futures for issue in future.result()]
+        
         issues = []
         
         # Check systems for completeness
@@ -85,199 +271,146 @@ class CompletenessValidationRule(ValidationRule):
         
         return issues
     
-    def _validate_systems(self, connection: DatabaseConnection, system_id: Optional[int] = None) -> List[ValidationIssue]:
-        """Validate system completeness."""
-        issues = []
-        
-        system_repo = EntityFactory.get_repository(connection, System)
-        
-        if system_id:
-            systems = [system_repo.read(system_id)] if system_repo.read(system_id) else []
-        else:
-            # Get all systems using SQL query since there's no list() method
-            from ..config.constants import WORKING_BASELINE
-            sql = "SELECT * FROM systems WHERE baseline = ? ORDER BY id"
-            rows = connection.fetchall(sql, (WORKING_BASELINE,))
-            systems = [system_repo._row_to_entity(row) for row in rows]
+    def _run_in_parallel(self, connection: DatabaseConnection, system_id: Optional[int]) -> bool:
+        """
+        Whether the completeness queries are worth running on worker threads.
         
-        for system in systems:
-            if not system:
-                continue
-                
+        SQLite releases the GIL while it reads, so the four independent
+        queries overlap; for small scopes the thread and connection setup
+        costs more than it saves. Worker connections cannot see an open
+        transaction's changes, so those run on the caller's connection.
+        """
+        if system_id or connection.in_transaction:
+            return False
+        row = connection.fetchone(_SQL_WORKING_ROW_COUNT, (WORKING_BASELINE,))
+        return row is not None and row[0] >= VALIDATION_PARALLEL_MIN_ROWS
+    
+    def _validate_systems(self, connection: DatabaseConnection, system_id: Optional[int] = None) -> Iterator[ValidationIssue]:
+        """Validate system completeness."""
+        for system in _fetch_incomplete(connection, _SQL_INCOMPLETE_SYSTEMS, "id", system_id):
             # Check for empty required fields
-            if not system.system_name or system.system_name.strip() == "":
-                issues.append(ValidationIssue(
+            if system['missing_name']:
+                yield ValidationIssue(
                     entity_type="System",
-                    entity_id=system.id,
-                    entity_name=system.system_hierarchy or "Unknown",
+                    entity_id=system['id'],
+                    entity_name=system['system_hierarchy'] or "Unknown",
                     issue_type="missing_name",
                     severity=ValidationSeverity.ERROR,
                     message="System name is required but not provided",
-                    hierarchical_id=system.system_hierarchy,
+                    hierarchical_id=system['system_hierarchy'],
                     suggestion="Provide a descriptive name for this system"
-                ))
+                )
             
-            if not system.system_description or system.system_description.strip() == "":
-                issues.append(ValidationIssue(
+            if system['missing_description']:
+                yield ValidationIssue(
                     entity_type="System",
-                    entity_id=system.id,
-                    entity_name=system.system_name or "Unknown",
+                    entity_id=system['id'],
+                    entity_name=system['system_name'] or "Unknown",
                     issue_type="missing_description",
                     severity=ValidationSeverity.WARNING,
                     message="System description is recommended but not provided",
-                    hierarchical_id=system.system_hierarchy,
+                    hierarchical_id=system['system_hierarchy'],
                     suggestion="Provide a clear description of this system's purpose and functionality"
-                ))
+                )
             
             # Check criticality settings
-            if (system.criticality and system.criticality != "Non-Critical" and 
-                not any([system.confidentiality, system.integrity, system.availability,
-                        system.authenticity, system.non_repudiation, system.assurance,
-                        system.trustworthy, system.privacy])):
-                issues.append(ValidationIssue(
+            if system['incomplete_criticality']:
+                yield ValidationIssue(
                     entity_type="System",
-                    entity_id=system.id,
-                    entity_name=system.system_name or "Unknown",
+                    entity_id=system['id'],
+                    entity_name=system['system_name'] or "Unknown",
                     issue_type="incomplete_criticality",
                     severity=ValidationSeverity.WARNING,
-                    message=f"System marked as {system.criticality} but no security attributes are selected",
-                    hierarchical_id=system.system_hierarchy,
+                    message=_incomplete_criticality_message(system['criticality']),
+                    hierarchical_id=system['system_hierarchy'],
                     suggestion="Select appropriate security attributes or change criticality level"
-                ))
-        
-        return issues
+                )
     
-    def _validate_functions(self, connection: DatabaseConnection, system_id: Optional[int] = None) -> List[ValidationIssue]:
+    def _validate_functions(self, connection: DatabaseConnection, system_id: Optional[int] = None) -> Iterator[ValidationIssue]:
         """Validate function completeness."""
-        issues = []
-        
-        from ..database.entities import Function
-        function_repo = EntityFactory.get_repository(connection, Function)
-        
-        if system_id:
-            functions = function_repo.list_by_system(system_id)
-        else:
-            # Get all functions using SQL query
-            from ..config.constants import WORKING_BASELINE
-            sql = "SELECT * FROM functions WHERE baseline = ? ORDER BY id"
-            rows = connection.fetchall(sql, (WORKING_BASELINE,))
-            functions = [function_repo._row_to_entity(row) for row in rows]
-        
-        for function in functions:
-            if not function.function_name or function.function_name.strip() == "":
-                issues.append(ValidationIssue(
+        for function in _fetch_incomplete(connection, _SQL_INCOMPLETE_FUNCTIONS, "system_id", system_id):
+            if function['missing_name']:
+                yield ValidationIssue(
                     entity_type="Function",
-                    entity_id=function.id,
-                    entity_name=function.system_hierarchy or "Unknown",
+                    entity_id=function['id'],
+                    entity_name=function['system_hierarchy'] or "Unknown",
                     issue_type="missing_name",
                     severity=ValidationSeverity.ERROR,
                     message="Function name is required but not provided",
-                    hierarchical_id=function.system_hierarchy,
+                    hierarchical_id=function['system_hierarchy'],
                     suggestion="Provide a descriptive name for this function"
-                ))
+                )
             
-            if not function.function_description or function.function_description.strip() == "":
-                issues.append(ValidationIssue(
+            if function['missing_description']:
+                yield ValidationIssue(
                     entity_type="Function",
-                    entity_id=function.id,
-                    entity_name=function.function_name or "Unknown",
+                    entity_id=function['id'],
+                    entity_name=function['function_name'] or "Unknown",
                     issue_type="missing_description",
                     severity=ValidationSeverity.WARNING,
                     message="Function description is recommended but not provided",
-                    hierarchical_id=function.system_hierarchy,
+                    hierarchical_id=function['system_hierarchy'],
                     suggestion="Provide a clear description of what this function does"
-                ))
-        
-        return issues
+                )
     
-    def _validate_requirements(self, connection: DatabaseConnection, system_id: Optional[int] = None) -> List[ValidationIssue]:
+    def _validate_requirements(self, connection: DatabaseConnection, system_id: Optional[int] = None) -> Iterator[ValidationIssue]:
         """Validate requirement completeness."""
-        issues = []
-        
-        requirement_repo = EntityFactory.get_repository(connection, Requirement)
-        
-        if system_id:
-            requirements = requirement_repo.list_by_system(system_id)
-        else:
-            # Get all requirements using SQL query
-            from ..config.constants import WORKING_BASELINE
-            sql = "SELECT * FROM requirements WHERE baseline = ? ORDER BY id"
-            rows = connection.fetchall(sql, (WORKING_BASELINE,))
-            requirements = [requirement_repo._row_to_entity(row) for row in rows]
-        
-        for requirement in requirements:
-            if not requirement.requirement_text or requirement.requirement_text.strip() == "":
-                issues.append(ValidationIssue(
+        for requirement in _fetch_incomplete(connection, _SQL_INCOMPLETE_REQUIREMENTS, "system_id", system_id):
+            if requirement['missing_text']:
+                yield ValidationIssue(
                     entity_type="Requirement",
-                    entity_id=requirement.id,
-                    entity_name=requirement.alphanumeric_identifier or "Unknown",
+                    entity_id=requirement['id'],
+                    entity_name=requirement['alphanumeric_identifier'] or "Unknown",
                     issue_type="missing_text",
                     severity=ValidationSeverity.ERROR,
                     message="Requirement text is required but not provided",
-                    hierarchical_id=requirement.system_hierarchy,
+                    hierarchical_id=requirement['system_hierarchy'],
                     suggestion="Provide the requirement text describing what must be implemented"
-                ))
+                )
             
-            if not requirement.verification_method:
-                issues.append(ValidationIssue(
+            if requirement['missing_verification']:
+                yield ValidationIssue(
                     entity_type="Requirement",
-                    entity_id=requirement.id,
-                    entity_name=requirement.alphanumeric_identifier or "Unknown",
+                    entity_id=requirement['id'],
+                    entity_name=requirement['alphanumeric_identifier'] or "Unknown",
                     issue_type="missing_verification",
                     severity=ValidationSeverity.WARNING,
                     message="Verification method is recommended but not specified",
-                    hierarchical_id=requirement.system_hierarchy,
+                    hierarchical_id=requirement['system_hierarchy'],
                     suggestion="Specify how this requirement will be verified (Test, Analysis, Inspection, Demonstration)"
-                ))
-        
-        return issues
+                )
     
-    def _validate_control_structures(self, connection: DatabaseConnection, system_id: Optional[int] = None) -> List[ValidationIssue]:
+    def _validate_control_structures(self, connection: DatabaseConnection, system_id: Optional[int] = None) -> Iterator[ValidationIssue]:
         """Validate control structure completeness."""
-        issues = []
-        
         try:
-            control_structure_repo = EntityFactory.get_repository(connection, ControlStructure)
-            
-            if system_id:
-                control_structures = control_structure_repo.list_by_system(system_id)
-            else:
-                # Get all control structures using SQL query
-                from ..config.constants import WORKING_BASELINE
-                sql = "SELECT * FROM control_structures WHERE baseline = ? ORDER BY id"
-                rows = connection.fetchall(sql, (WORKING_BASELINE,))
-                control_structures = [control_structure_repo._row_to_entity(row) for row in rows]
-            
-            for cs in control_structures:
-                if not cs.structure_name or cs.structure_name.strip() == "":
-                    issues.append(ValidationIssue(
+            for cs in _fetch_incomplete(connection, _SQL_INCOMPLETE_CONTROL_STRUCTURES, "system_id", system_id):
+                if cs['missing_name']:
+                    yield ValidationIssue(
                         entity_type="ControlStructure",
-                        entity_id=cs.id,
-                        entity_name=cs.system_hierarchy or "Unknown",
+                        entity_id=cs['id'],
+                        entity_name=cs['system_hierarchy'] or "Unknown",
                         issue_type="missing_name",
                         severity=ValidationSeverity.ERROR,
                         message="Control structure name is required but not provided",
-                        hierarchical_id=cs.system_hierarchy,
+                        hierarchical_id=cs['system_hierarchy'],
                         suggestion="Provide a descriptive name for this control structure"
-                    ))
+                    )
                 
                 # Check for unmapped components (placeholder - would need more complex queries)
-                if not cs.structure_description or cs.structure_description.strip() == "":
-                    issues.append(ValidationIssue(
+                if cs['missing_description']:
+                    yield ValidationIssue(
                         entity_type="ControlStructure",
-                        entity_id=cs.id,
-                        entity_name=cs.structure_name or "Unknown",
+                        entity_id=cs['id'],
+                        entity_name=cs['structure_name'] or "Unknown",
                         issue_type="missing_description",
                         severity=ValidationSeverity.WARNING,
                         message="Control structure description is recommended but not provided",
-                        hierarchical_id=cs.system_hierarchy,
+                        hierarchical_id=cs['system_hierarchy'],
                         suggestion="Provide a description of this control structure's purpose and components"
-                    ))
+                    )
         
         except Exception as e:
             logger.warning(f"Could not validate control structures: {e}")
-        
-        return issues
 
 
 class LogicalConsistencyValidationRule(ValidationRule):
@@ -293,94 +426,59 @@ class LogicalConsistencyValidationRule(ValidationRule):
     def validate(self, connection: DatabaseConnection, system_id: Optional[int] = None) -> List[ValidationIssue]:
         issues = []
         
+        # Requirements are read and indexed once for both requirement checks
+        requirements = _load_entities(connection, Requirement, system_id)
+        requirement_map = {req.id: req for req in requirements if req.id}
+        
         # Check for circular requirement references
-        issues.extend(self._validate_requirement_hierarchy(connection, system_id))
+        issues.extend(self._validate_requirement_hierarchy(requirements, requirement_map))
         
         # Check for invalid requirement parent relationships
-        issues.extend(self._validate_requirement_levels(connection, system_id))
+        issues.extend(self._validate_requirement_levels(requirements, requirement_map))
         
         # Check system hierarchy consistency
-        issues.extend(self._validate_system_hierarchy(connection, system_id))
+        issues.extend(self._validate_system_hierarchy(_load_entities(connection, System, system_id)))
         
         return issues
     
-    def _validate_requirement_hierarchy(self, connection: DatabaseConnection, system_id: Optional[int] = None) -> List[ValidationIssue]:
+    def _validate_requirement_hierarchy(self, requirements: List[Requirement],
+                                        requirement_map: Dict[int, Requirement]) -> Iterator[ValidationIssue]:
         """Check for circular references in requirement hierarchy."""
-        issues = []
-        
-        requirement_repo = EntityFactory.get_repository(connection, Requirement)
-        
-        if system_id:
-            requirements = requirement_repo.list_by_system(system_id)
-        else:
-            # Get all requirements using SQL query
-            from ..config.constants import WORKING_BASELINE
-            sql = "SELECT * FROM requirements WHERE baseline = ? ORDER BY id"
-            rows = connection.fetchall(sql, (WORKING_BASELINE,))
-            requirements = [requirement_repo._row_to_entity(row) for row in rows]
-        
-        # Build requirement hierarchy map
-        requirement_map = {req.id: req for req in requirements if req.id}
+        outcomes = _resolve_parent_chains(
+            {req_id: req.parent_requirement_id for req_id, req in requirement_map.items()}
+        )
         
         for requirement in requirements:
-            if not requirement.id:
-                continue
-                
-            visited = set()
-            current_id = requirement.parent_requirement_id
+            outcome = outcomes.get(requirement.id)
             
-            while current_id:
-                if current_id in visited:
-                    # Circular reference detected
-                    issues.append(ValidationIssue(
-                        entity_type="Requirement",
-                        entity_id=requirement.id,
-                        entity_name=requirement.alphanumeric_identifier or "Unknown",
-                        issue_type="circular_reference",
-                        severity=ValidationSeverity.ERROR,
-                        message="Circular reference detected in requirement hierarchy",
-                        hierarchical_id=requirement.system_hierarchy,
-                        suggestion="Remove the circular reference by changing the parent requirement"
-                    ))
-                    break
-                
-                visited.add(current_id)
-                
-                if current_id in requirement_map:
-                    current_id = requirement_map[current_id].parent_requirement_id
-                else:
-                    # Parent requirement doesn't exist
-                    issues.append(ValidationIssue(
-                        entity_type="Requirement",
-                        entity_id=requirement.id,
-                        entity_name=requirement.alphanumeric_identifier or "Unknown",
-                        issue_type="invalid_parent",
-                        severity=ValidationSeverity.ERROR,
-                        message="Parent requirement does not exist",
-                        hierarchical_id=requirement.system_hierarchy,
-                        suggestion="Select a valid parent requirement or remove the parent reference"
-                    ))
-                    break
-        
-        return issues
+            if outcome == "circular_reference":
+                # Circular reference detected
+                yield ValidationIssue(
+                    entity_type="Requirement",
+                    entity_id=requirement.id,
+                    entity_name=requirement.alphanumeric_identifier or "Unknown",
+                    issue_type="circular_reference",
+                    severity=ValidationSeverity.ERROR,
+                    message="Circular reference detected in requirement hierarchy",
+                    hierarchical_id=requirement.system_hierarchy,
+                    suggestion="Remove the circular reference by changing the parent requirement"
+                )
+            elif outcome == "invalid_parent":
+                # Parent requirement doesn't exist
+                yield ValidationIssue(
+                    entity_type="Requirement",
+                    entity_id=requirement.id,
+                    entity_name=requirement.alphanumeric_identifier or "Unknown",
+                    issue_type="invalid_parent",
+                    severity=ValidationSeverity.ERROR,
+                    message="Parent requirement does not exist",
+                    hierarchical_id=requirement.system_hierarchy,
+                    suggestion="Select a valid parent requirement or remove the parent reference"
+                )
     
-    def _validate_requirement_levels(self, connection: DatabaseConnection, system_id: Optional[int] = None) -> List[ValidationIssue]:
+    def _validate_requirement_levels(self, requirements: List[Requirement],
+                                     requirement_map: Dict[int, Requirement]) -> Iterator[ValidationIssue]:
         """Check for invalid requirement level relationships."""
-        issues = []
-        
-        requirement_repo = EntityFactory.get_repository(connection, Requirement)
-        
-        if system_id:
-            requirements = requirement_repo.list_by_system(system_id)
-        else:
-            # Get all requirements using SQL query
-            from ..config.constants import WORKING_BASELINE
-            sql = "SELECT * FROM requirements WHERE baseline = ? ORDER BY id"
-            rows = connection.fetchall(sql, (WORKING_BASELINE,))
-            requirements = [requirement_repo._row_to_entity(row) for row in rows]
-        
-        requirement_map = {req.id: req for req in requirements if req.id}
-        
         for requirement in requirements:
             if not requirement.id or not requirement.parent_requirement_id:
                 continue
@@ -391,34 +489,19 @@ class LogicalConsistencyValidationRule(ValidationRule):
             
             # Check that child requirement is at a higher level than parent
             if requirement.level_identifier <= parent.level_identifier:
-                issues.append(ValidationIssue(
+                yield ValidationIssue(
                     entity_type="Requirement",
                     entity_id=requirement.id,
                     entity_name=requirement.alphanumeric_identifier or "Unknown",
                     issue_type="invalid_level",
                     severity=ValidationSeverity.WARNING,
-                    message=f"Requirement level ({requirement.level_identifier}) should be greater than parent level ({parent.level_identifier})",
+                    message=_invalid_level_message(requirement.level_identifier, parent.level_identifier),
                     hierarchical_id=requirement.system_hierarchy,
                     suggestion="Adjust the requirement level to be more specific than its parent"
-                ))
-        
-        return issues
+                )
     
-    def _validate_system_hierarchy(self, connection: DatabaseConnection, system_id: Optional[int] = None) -> List[ValidationIssue]:
+    def _validate_system_hierarchy(self, systems: List[System]) -> Iterator[ValidationIssue]:
         """Check system hierarchy consistency."""
-        issues = []
-        
-        system_repo = EntityFactory.get_repository(connection, System)
-        
-        if system_id:
-            systems = [system_repo.read(system_id)] if system_repo.read(system_id) else []
-        else:
-            # Get all systems using SQL query
-            from ..config.constants import WORKING_BASELINE
-            sql = "SELECT * FROM systems WHERE baseline = ? ORDER BY id"
-            rows = connection.fetchall(sql, (WORKING_BASELINE,))
-            systems = [system_repo._row_to_entity(row) for row in rows]
-        
         for system in systems:
             if not system or not system.system_hierarchy:
                 continue
@@ -426,7 +509,7 @@ class LogicalConsistencyValidationRule(ValidationRule):
             # Validate hierarchical ID format
             parsed_id = HierarchyManager.parse_hierarchical_id(system.system_hierarchy)
             if not parsed_id:
-                issues.append(ValidationIssue(
+                yield ValidationIssue(
                     entity_type="System",
                     entity_id=system.id,
                     entity_name=system.system_name or "Unknown",
@@ -435,24 +518,22 @@ class LogicalConsistencyValidationRule(ValidationRule):
                     message=f"Invalid hierarchical ID format: {system.system_hierarchy}",
                     hierarchical_id=system.system_hierarchy,
                     suggestion="Use valid hierarchical ID format (e.g., S-1, S-1.1, S-1.1.1)"
-                ))
+                )
                 continue
             
             # Validate hierarchy consistency with level and sequential identifiers
-            expected_level = len(system.system_hierarchy.split('.')) - 1
+            expected_level = system.system_hierarchy.count('.')
             if system.level_identifier != expected_level:
-                issues.append(ValidationIssue(
+                yield ValidationIssue(
                     entity_type="System",
                     entity_id=system.id,
                     entity_name=system.system_name or "Unknown",
                     issue_type="inconsistent_level",
                     severity=ValidationSeverity.WARNING,
-                    message=f"Level identifier ({system.level_identifier}) doesn't match hierarchy depth ({expected_level})",
+                    message=_inconsistent_level_message(system.level_identifier, expected_level),
                     hierarchical_id=system.system_hierarchy,
                     suggestion="Update level identifier to match the hierarchy depth"
-                ))
-        
-        return issues
+                )
 
 
 class ValidationEngine:
@@ -464,6 +545,10 @@ class ValidationEngine:
             CompletenessValidationRule(),
             LogicalConsistencyValidationRule(),
         ]
+        # Rule results by (rule, system_id, write counter); any write through
+        # the connection moves the counter, so stale entries are never hit
+        self._cache: "OrderedDict[tuple, List[ValidationIssue]]" = OrderedDict()
+        self._cache_lock = threading.Lock()
         logger.info(f"Initialized validation engine with {len(self.rules)} rules")
     
     def add_rule(self, rule: ValidationRule):
@@ -471,27 +556,74 @@ class ValidationEngine:
         self.rules.append(rule)
         logger.info(f"Added validation rule: {rule.name}")
     
-    def validate_system(self, system_id: int) -> List[ValidationIssue]:
+    def iter_validate(self, system_id: Optional[int] = None) -> Iterator[ValidationIssue]:
         """
-        Validate a specific system and its components.
+        Run every rule and yield its issues, rule by rule in rule order.
+        
+        Rules without a cached result run concurrently on worker threads
+        that last for this run only.
         
         Args:
-            system_id: System ID to validate
+            system_id: System ID to validate, or None for the whole database
             
-        Returns:
-            List of validation issues found
+        Yields:
+            Validation issues found, rule by rule
         """
-        logger.info(f"Starting validation for system ID: {system_id}")
-        all_issues = []
+        # An open transaction's writes are not counted until it commits, and
+        # worker connections cannot see them, so the rules then run here on
+        # the caller's connection without the cache
+        in_transaction = self.connection.in_transaction
+        
+        # Read the counter before the rules run so a concurrent write can
+        # only cause a miss, never a stale hit
+        write_counter = self.connection.write_counter
+        pending = []
+        with self._cache_lock:
+            for rule in self.rules:
+                if in_transaction:
+                    pending.append((rule, None, None))
+                    continue
+                key = (rule, system_id, write_counter)
+                issues = self._cache.get(key)
+                if issues is not None:
+                    self._cache.move_to_end(key)
+                pending.append((rule, key, issues))
+        
+        misses = [rule for rule, _, issues in pending if issues is None]
+        executor = None
+        futures = {}
+        if len(misses) > 1 and not in_transaction:
+            # Each worker thread reads through its own thread-local connection
+            executor = ThreadPoolExecutor(
+                max_workers=min(len(misses), VALIDATION_MAX_WORKERS), thread_name_prefix="validation"
+            )
+            futures = {rule: executor.submit(rule.validate, self.connection, system_id)
+                       for rule in misses}
         
-        for rule in self.rules:
+        try:
+            yield from self._collect_results(pending, futures, system_id)
+        finally:
+            # The workers exit here, and their connections are released with them
+            if executor is not None:
+                executor.shutdown(wait=True, cancel_futures=True)
+    
+    def _collect_results(self, pending: List[tuple], futures: Dict[ValidationRule, Any],
+                         system_id: Optional[int]) -> Iterator[ValidationIssue]:
+        """Yield each rule's issues in rule order, running or awaiting the rule as needed."""
+        scope = f"for system {system_id}" if system_id is not None else "globally"
+        
+        for rule, key, issues in pending:
+            if issues is not None:
+                logger.debug(f"Rule '{rule.name}' reused {len(issues)} cached issues {scope}")
+                yield from issues
+                continue
+            
             try:
-                issues = rule.validate(self.connection, system_id)
-                all_issues.extend(issues)
-                logger.debug(f"Rule '{rule.name}' found {len(issues)} issues for system {system_id}")
+                future = futures.get(rule)
+                issues = future.result() if future else rule.validate(self.connection, system_id)
             except Exception as e:
                 logger.error(f"Error running validation rule '{rule.name}': {e}")
-                all_issues.append(ValidationIssue(
+                yield ValidationIssue(
                     entity_type="ValidationEngine",
                     entity_id=None,
                     entity_name="Validation Error",
@@ -499,8 +631,30 @@ class ValidationEngine:
                     severity=ValidationSeverity.ERROR,
                     message=f"Error running validation rule '{rule.name}': {str(e)}",
                     suggestion="Check system logs for more details"
-                ))
+                )
+                continue
+            
+            if key is not None:
+                with self._cache_lock:
+                    self._cache[key] = issues
+                    if len(self._cache) > VALIDATION_CACHE_SIZE:
+                        self._cache.popitem(last=False)
+            
+            logger.debug(f"Rule '{rule.name}' found {len(issues)} issues {scope}")
+            yield from issues
+    
+    def validate_system(self, system_id: int) -> List[ValidationIssue]:
+        """
+        Validate a specific system and its components.
         
+        Args:
+            system_id: System ID to validate
+            
+        Returns:
+            List of validation issues found
+        """
+        logger.info(f"Starting validation for system ID: {system_id}")
+        all_issues = list(self.iter_validate(system_id))
         logger.info(f"Validation completed for system {system_id}: {len(all_issues)} issues found")
         return all_issues
     
@@ -512,25 +666,7 @@ class ValidationEngine:
             List of all validation issues found
         """
         logger.info("Starting full database validation")
-        all_issues = []
-        
-        for rule in self.rules:
-            try:
-                issues = rule.validate(self.connection)
-                all_issues.extend(issues)
-                logger.debug(f"Rule '{rule.name}' found {len(issues)} issues globally")
-            except Exception as e:
-                logger.error(f"Error running validation rule '{rule.name}': {e}")
-                all_issues.append(ValidationIssue(
-                    entity_type="ValidationEngine",
-                    entity_id=None,
-                    entity_name="Validation Error",
-                    issue_type="rule_error",
-                    severity=ValidationSeverity.ERROR,
-                    message=f"Error running validation rule '{rule.name}': {str(e)}",
-                    suggestion="Check system logs for more details"
-                ))
-        
+        all_issues = list(self.iter_validate())
         logger.info(f"Full validation completed: {len(all_issues)} issues found")
         return all_issues
     
@@ -544,30 +680,17 @@ class ValidationEngine:
         Returns:
             Dictionary with validation summary statistics
         """
+        # Counter tallies each key in C, one pass per breakdown; severities are
+        # counted as members and their values looked up once per severity
+        severity_counts = Counter(issue.severity for issue in issues)
+        by_severity = {severity.value: severity_counts[severity] for severity in ValidationSeverity}
+        
         summary = {
             'total_issues': len(issues),
-            'by_severity': {severity.value: 0 for severity in ValidationSeverity},
-            'by_entity_type': {},
-            'by_issue_type': {},
-            'critical_issues': []
+            'by_severity': by_severity,
+            'by_entity_type': dict(Counter(issue.entity_type for issue in issues)),
+            'by_issue_type': dict(Counter(issue.issue_type for issue in issues)),
+            'critical_issues': [issue for issue in issues if issue.severity is ValidationSeverity.ERROR]
         }
         
-        for issue in issues:
-            # Count by severity
-            summary['by_severity'][issue.severity.value] += 1
-            
-            # Count by entity type
-            if issue.entity_type not in summary['by_entity_type']:
-                summary['by_entity_type'][issue.entity_type] = 0
-            summary['by_entity_type'][issue.entity_type] += 1
-            
-            # Count by issue type
-            if issue.issue_type not in summary['by_issue_type']:
-                summary['by_issue_type'][issue.issue_type] = 0
-            summary['by_issue_type'][issue.issue_type] += 1
-            
-            # Collect critical issues
-            if issue.severity == ValidationSeverity.ERROR:
-                summary['critical_issues'].append(issue)
-        
         return summary
\ No newline at end of file
@@ -136,6 +136,72 @@ class TestDatabaseConnection:
             assert result is None
             
             db_manager.close()
+    
+    def test_nested_transaction(self):
+        """Test that a failed nested transaction only rolls back its own work."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            db_path = Path(temp_dir) / "test.db"
+            
+            db_manager = DatabaseManager(db_path)
+            db_manager.initialize()
+            
+            connection = db_manager.get_connection()
+            insert_sql = "INSERT INTO systems (type_identifier, level_identifier, sequential_identifier, system_hierarchy, system_name) VALUES (?, ?, ?, ?, ?)"
+            
+            with connection.transaction():
+                connection.execute(insert_sql, ("S", 0, 1, "S-1", "Outer System"))
+                
+                try:
+                    with connection.transaction():
+                        connection.execute(insert_sql, ("S", 0, 2, "S-2", "Inner System"))
+                        raise Exception("Test error")
+                except Exception:
+                    pass
+            
+            # The outer insert is committed, the inner one rolled back
+            assert connection.fetchone("SELECT id FROM systems WHERE system_hierarchy = 'S-1'") is not None
+            assert connection.fetchone("SELECT id FROM systems WHERE system_hierarchy = 'S-2'") is None
+            
+            db_manager.close()
+    
+    def test_iterate_streams_all_rows(self):
+        """Test that iterate yields every row across fetchmany batches."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            db_path = Path(temp_dir) / "test.db"
+            
+            db_conn = DatabaseConnection(db_path)
+            db_conn.execute("CREATE TABLE numbers (n INTEGER)")
+            with db_conn.transaction():
+                for n in range(10):
+                    db_conn.execute("INSERT INTO numbers (n) VALUES (?)", (n,))
+            
+            rows = db_conn.iterate("SELECT n FROM numbers WHERE n >= ? ORDER BY n", (2,), arraysize=3)
+            assert [row['n'] for row in rows] == list(range(2, 10))
+            
+            db_conn.close_connection()
+    
+    def test_write_counter_counts_committed_writes(self):
+        """Test that write_counter moves on committed writes only."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            db_path = Path(temp_dir) / "test.db"
+            
+            db_conn = DatabaseConnection(db_path)
+            db_conn.execute("CREATE TABLE numbers (n INTEGER)")
+            
+            counter = db_conn.write_counter
+            db_conn.fetchall("SELECT n FROM numbers")
+            assert db_conn.write_counter == counter
+            
+            db_conn.execute("INSERT INTO numbers (n) VALUES (1)")
+            assert db_conn.write_counter == counter + 1
+            
+            with db_conn.transaction() as conn:
+                conn.execute("INSERT INTO numbers (n) VALUES (2)")
+                db_conn.execute("INSERT INTO numbers (n) VALUES (3)")
+                assert db_conn.write_counter == counter + 1
+            assert db_conn.write_counter == counter + 2
+            
+            db_conn.close_connection()
 
 
 class TestDatabaseEntities:
@@ -212,6 +278,46 @@ class TestDatabaseEntities:
             
             db_manager.close()
     
+    def test_entity_repository_upsert(self):
+        """Test that upsert inserts new entities and updates existing ones."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            db_path = Path(temp_dir) / "test.db"
+            
+            db_manager = DatabaseManager(db_path)
+            db_manager.initialize()
+            connection = db_manager.get_connection()
+            system_repo = EntityFactory.get_repository(connection, System)
+            
+            # Insert
+            system = System(system_name="Upsert System", system_description="Original")
+            system_id = system_repo.upsert(system)
+            assert system_id is not None
+            assert system.system_hierarchy == "S-1"
+            
+            # Update
+            system.id = system_id
+            system.system_description = "Changed"
+            assert system_repo.upsert(system) == system_id
+            
+            saved_system = system_repo.read(system_id)
+            assert saved_system.system_description == "Changed"
+            assert len(system_repo.list()) == 1
+            
+            audit_records = connection.fetchall(
+                "SELECT operation FROM audit_log WHERE table_name = 'systems' AND row_id = ? ORDER BY id",
+                (system_id,)
+            )
+            assert [row['operation'] for row in audit_records] == ['INSERT', 'UPDATE']
+            
+            # A row deleted since the entity was loaded is not re-created
+            assert system_repo.delete(system_id) is True
+            system.system_description = "Changed again"
+            assert system_repo.upsert(system) is None
+            assert system_repo.read(system_id) is None
+            assert len(system_repo.list()) == 0
+            
+            db_manager.close()
+    
     def test_entity_relationships(self):
         """Test entity relationships and foreign keys."""
         with tempfile.TemporaryDirectory() as temp_dir:
@@ -329,6 +435,60 @@ class TestHierarchicalIDs:
         # Next sequential for level 0
         next_root = HierarchyManager.find_next_sequential_id(existing_ids, "S", 0)
         assert next_root == 3  # S-3
+    
+    def test_hierarchical_id_parsing_deep_and_malformed(self):
+        """Test parsing of deep, padded and malformed ID strings."""
+        # Deep IDs keep the first number as level and the last as sequential
+        deep_id = HierarchyManager.parse_hierarchical_id("S-1.2.3")
+        assert deep_id == HierarchicalID("S", 1, 3)
+        
+        # Surrounding whitespace is ignored
+        assert HierarchyManager.parse_hierarchical_id(" R-4 ") == HierarchicalID("R", 0, 4)
+        
+        malformed = [
+            "", "S", "S-", "S1", "s-1", "X-1", "S-1.", "S-.1", "S-1..2",
+            "S-1.a", "S--1", "S-1 .2", "S-1\n2",
+        ]
+        for id_string in malformed:
+            assert HierarchyManager.parse_hierarchical_id(id_string) is None, id_string
+    
+    def test_hierarchical_id_parsing_rejects_non_ascii(self):
+        """Test that only ASCII capitals and digits are accepted."""
+        # Arabic-Indic and fullwidth digits satisfy str.isdigit()
+        assert HierarchyManager.parse_hierarchical_id("S-١") is None
+        assert HierarchyManager.parse_hierarchical_id("S-1.２") is None
+        # Superscript two satisfies str.isdigit() but not int()
+        assert HierarchyManager.parse_hierarchical_id("S-²") is None
+        # Non-ASCII capital letter as type
+        assert HierarchyManager.parse_hierarchical_id("É-1") is None
+    
+    def test_hierarchical_id_parsing_matches_id_pattern(self):
+        """Test that the parser accepts exactly what ID_PATTERN matches."""
+        samples = [
+            "S-1", "S-1.2", "S-10.20.30", "R-007", " S-1 ", "\tF-2.1\n", "",
+            "S", "S-", "S1", "s-1", "S-1.", "S-.1", "S-1..2", "S-1.a", "S--1",
+            "S-1 .2", "S-1\n2", "S-\u0661", "S-1.\uff12", "S-\u00b2", "\u00c9-1",
+        ]
+        for id_string in samples:
+            matches = HierarchyManager.ID_PATTERN.match(id_string.strip()) is not None
+            parsed = HierarchyManager.parse_hierarchical_id(id_string) is not None
+            assert parsed == matches, id_string
+    
+    def test_is_ancestor(self):
+        """Test ancestor checks follow the full dotted path."""
+        assert HierarchyManager.is_ancestor("S-1", "S-1.2") is True
+        assert HierarchyManager.is_ancestor("S-1.2", "S-1.2.3") is True
+        assert HierarchyManager.is_ancestor(" S-1.2", "S-1.2.3 ") is True
+        
+        # Different numbers or types are not ancestors
+        assert HierarchyManager.is_ancestor("S-01", "S-1.2") is False
+        assert HierarchyManager.is_ancestor("S-1", "S-12.1") is False
+        assert HierarchyManager.is_ancestor("R-1", "S-1.2") is False
+        
+        # Not an ancestor of itself, a parent or an unparseable descendant
+        assert HierarchyManager.is_ancestor("S-1.2", "S-1.2") is False
+        assert HierarchyManager.is_ancestor("S-1.2", "S-1") is False
+        assert HierarchyManager.is_ancestor("S-1", "S-1.x") is False
 
 
 class TestDatabaseInitializer:
@@ -455,4 +615,4 @@ def test_audit_trail_functionality(temp_database):
 
 if __name__ == "__main__":
     # Run tests when script is executed directly
-    pytest.main([__file__, "-v"])
\ No newline at end of file
+    pytest.main([__file__, "-v"])
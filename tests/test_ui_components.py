@@ -22,6 +22,7 @@ from src.ui.main_window import MainWindow
 from src.ui.dialogs import DirectorySelectionDialog, ErrorDialog, ConfirmationDialog
 from src.ui.entity_dialogs import SystemEditDialog, FunctionEditDialog, RequirementEditDialog
 from src.ui.hierarchy_tree import HierarchyTreeWidget
+from src.ui.table_models import EntityTableModel
 from src.database.entities import System, Function, Requirement
 from src.config.settings import ConfigManager
 from src.database.init import DatabaseInitializer
@@ -166,6 +167,28 @@ class TestHierarchyTree:
         assert root_item.text(0) is not None
 
 
+class TestEntityTableModel:
+    """Test entity table model row updates."""
+    
+    def test_update_row_in_place_and_append(self, qapp):
+        """Test that saved rows are applied without a reload when possible."""
+        model = EntityTableModel(["ID", "Name"])
+        model.set_rows([(1, "F-1.1", "First"), (2, "F-1.2", "Second")])
+        
+        # Same ordering key: replaced in place
+        assert model.update_row((1, "F-1.1", "Renamed"))
+        assert model.index(0, 1).data() == "Renamed"
+        
+        # New row sorting last: appended
+        assert model.update_row((3, "F-1.3", "Third"))
+        assert model.rowCount() == 3
+        assert model.entity_id(2) == 3
+        
+        # Changed ordering key or new row in the middle: needs a reload
+        assert not model.update_row((2, "F-1.9", "Second"))
+        assert not model.update_row((4, "F-1.15", "Fourth"))
+
+
 class TestMainWindow:
     """Test main window functionality."""
     
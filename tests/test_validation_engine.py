@@ -12,7 +12,8 @@ sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
 from src.validation.engine import (
     ValidationEngine, ValidationIssue, ValidationSeverity,
-    CompletenessValidationRule, LogicalConsistencyValidationRule
+    CompletenessValidationRule, LogicalConsistencyValidationRule,
+    _resolve_parent_chains
 )
 from src.database.init import DatabaseInitializer
 from src.database.entities import System, Function, Requirement, EntityFactory
@@ -210,6 +211,29 @@ class TestCompletenessValidationRule:
         assert len(name_issues) == 1
         assert name_issues[0].severity == ValidationSeverity.ERROR
     
+    def test_validate_unicode_whitespace_function_name(self, validation_database):
+        """Test that a name of only Unicode whitespace counts as missing."""
+        db_init, incomplete_system_id, critical_system_id = validation_database
+        connection = db_init.get_database_manager().get_connection()
+        
+        function_repo = EntityFactory.get_repository(connection, Function)
+        function_id = function_repo.create(Function(
+            type_identifier="F",
+            level_identifier=0,
+            sequential_identifier=2,
+            system_hierarchy="F-201.1",
+            system_id=critical_system_id,
+            function_name=" ",  # Only a no-break space
+            function_description="Function described"
+        ))
+        
+        rule = CompletenessValidationRule()
+        issues = rule.validate(connection, critical_system_id)
+        
+        name_issues = [i for i in issues if i.entity_type == "Function" and i.issue_type == "missing_name"]
+        assert len(name_issues) == 1
+        assert name_issues[0].entity_id == function_id
+    
     def test_validate_incomplete_requirements(self, validation_database):
         """Test validation of incomplete requirements."""
         db_init, incomplete_system_id, critical_system_id = validation_database
@@ -226,6 +250,22 @@ class TestCompletenessValidationRule:
         text_issues = [i for i in requirement_issues if i.issue_type == "missing_text"]
         assert len(text_issues) == 1
         assert text_issues[0].severity == ValidationSeverity.ERROR
+    
+    def test_parallel_completeness_matches_serial(self, validation_database):
+        """Test that running the completeness checks in parallel finds the same issues."""
+        from unittest.mock import patch
+        
+        db_init, incomplete_system_id, critical_system_id = validation_database
+        connection = db_init.get_database_manager().get_connection()
+        
+        rule = CompletenessValidationRule()
+        serial_issues = rule.validate(connection)
+        
+        with patch("src.validation.engine.VALIDATION_PARALLEL_MIN_ROWS", 0):
+            assert rule._run_in_parallel(connection, None)
+            parallel_issues = rule.validate(connection)
+        
+        assert parallel_issues == serial_issues
 
 
 class TestLogicalConsistencyValidationRule:
@@ -253,6 +293,35 @@ class TestLogicalConsistencyValidationRule:
         assert circular_issues[0].severity == ValidationSeverity.ERROR
         assert "circular reference" in circular_issues[0].message.lower()
     
+    def test_resolve_parent_chains(self):
+        """Test chain outcomes for roots, cycles, cycle tails and dangling parents."""
+        parents = {
+            1: None, 2: 1,        # Root and child
+            3: 4, 4: 3, 5: 3,     # Cycle and a tail leading into it
+            6: 6,                 # Self reference
+            7: 99, 8: 7,          # Missing parent and a descendant of it
+        }
+        
+        outcomes = _resolve_parent_chains(parents)
+        
+        assert outcomes == {
+            1: None, 2: None,
+            3: "circular_reference", 4: "circular_reference", 5: "circular_reference",
+            6: "circular_reference",
+            7: "invalid_parent", 8: "invalid_parent",
+        }
+    
+    def test_resolve_deep_parent_chain(self):
+        """Test that a very deep chain resolves without recursion or rewalking."""
+        depth = 50000
+        parents = {i: i - 1 for i in range(2, depth + 1)}
+        parents[1] = depth  # Close the chain into one large cycle
+        
+        outcomes = _resolve_parent_chains(parents)
+        
+        assert len(outcomes) == depth
+        assert set(outcomes.values()) == {"circular_reference"}
+    
     def test_validate_system_hierarchy(self, validation_database):
         """Test validation of system hierarchy consistency."""
         db_init, incomplete_system_id, critical_system_id = validation_database
@@ -359,6 +428,72 @@ class TestValidationEngine:
         custom_issues = [i for i in issues if i.issue_type == "custom_issue"]
         assert len(custom_issues) == 1
     
+    def test_validate_system_reuses_results_until_write(self, validation_database):
+        """Test that repeated validation hits the cache and a committed write misses it."""
+        db_init, incomplete_system_id, critical_system_id = validation_database
+        connection = db_init.get_database_manager().get_connection()
+        
+        class CountingRule(CompletenessValidationRule):
+            def __init__(self):
+                super().__init__()
+                self.runs = 0
+            
+            def validate(self, connection, system_id=None):
+                self.runs += 1
+                return super().validate(connection, system_id)
+        
+        rule = CountingRule()
+        engine = ValidationEngine(connection)
+        engine.rules = [rule]
+        
+        first_issues = engine.validate_system(incomplete_system_id)
+        second_issues = engine.validate_system(incomplete_system_id)
+        assert rule.runs == 1
+        assert second_issues == first_issues
+        
+        # A committed write invalidates the cached results
+        connection.execute(
+            "UPDATE systems SET system_name = 'Named System' WHERE id = ?", (incomplete_system_id,)
+        )
+        third_issues = engine.validate_system(incomplete_system_id)
+        assert rule.runs == 2
+        assert len(third_issues) == len(first_issues) - 1
+    
+    def test_rules_run_concurrently_in_rule_order(self, validation_database):
+        """Test that rules run at the same time and report in rule order."""
+        import threading
+        
+        db_init, incomplete_system_id, critical_system_id = validation_database
+        connection = db_init.get_database_manager().get_connection()
+        
+        # Both rules must be running at once to get past the barrier
+        barrier = threading.Barrier(2, timeout=5)
+        
+        class BarrierRule(CompletenessValidationRule):
+            def __init__(self, marker):
+                super().__init__()
+                self.name = marker
+            
+            def validate(self, connection, system_id=None):
+                barrier.wait()
+                return [ValidationIssue(
+                    entity_type="Test",
+                    entity_id=None,
+                    entity_name=self.name,
+                    issue_type="custom_issue",
+                    severity=ValidationSeverity.INFO,
+                    message="Custom rule executed"
+                )]
+        
+        engine = ValidationEngine(connection)
+        engine.rules = [BarrierRule("first"), BarrierRule("second")]
+        issues = engine.validate_all()
+        
+        assert [issue.entity_name for issue in issues] == ["first", "second"]
+        
+        # The run's worker threads are gone once it finishes
+        assert not [t for t in threading.enumerate() if t.name.startswith("validation")]
+    
     def test_get_validation_summary(self, validation_database):
         """Test generating validation summary."""
         db_init, incomplete_system_id, critical_system_id = validation_database